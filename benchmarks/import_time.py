@@ -0,0 +1,63 @@
+""" Import-time benchmark for the insurance_python package.
+
+ Every measurement runs in a fresh interpreter, as in a short-lived batch worker, and reports the median wall time of the import
+ over several runs together with the heavy optional dependencies that the import pulled in. The package must be installed
+ (pip install . or pip install -e .). With --check the script fails if any import pulls in one of the optional dependencies
+ (pandas, matplotlib, seaborn), which are only imported where a DataFrame or a plot is produced.
+
+ Usage:
+     python benchmarks/import_time.py [--repeat 7] [--check]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "insurance_python",
+    "insurance_python.smith_wilson.SWCalibrate",
+    "insurance_python.smith_wilson.SWCurve",
+    "insurance_python.bisection_alpha.bisection_alpha",
+    "insurance_python.nelson_siegel_svansson.nelsonsiegelsvensson",
+    "insurance_python.black_sholes.simulate_black_scholes",
+    "insurance_python.hull_white_one_factor.simulate_Hull_White_One_Factor",
+    "insurance_python.singular_spectrum_analysis.ssaBasic",
+    "insurance_python.vasicek_two_factor.Vasicek",
+    "insurance_python.vasicek_two_factor.Pricing",
+    "insurance_python.vasicek_two_factor.Calibration",
+    "from insurance_python import BrownianMotion, Swaption, ZeroCouponBond, Calibrator",
+]
+HEAVY = ["numpy", "scipy", "pandas", "matplotlib", "seaborn"]
+OPTIONAL = ["pandas", "matplotlib", "seaborn"]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+def time_import(module: str, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", PROBE.format(statement=module if module.startswith("from ") else "import " + module, heavy=HEAVY)], capture_output=True, text=True, check=True)
+        elapsed, loaded = (out.stdout.split() + [""])[:2]
+        timings.append(float(elapsed))
+    return statistics.median(timings), loaded
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=7, help="number of fresh interpreters per module")
+    parser.add_argument("--check", action="store_true", help="fail if an import pulls in an optional dependency")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<80} {'median [ms]':>12}  heavy modules loaded")
+    for module in MODULES:
+        median, loaded = time_import(module, args.repeat)
+        print(f"{module:<80} {1000 * median:>12.1f}  {loaded or '-'}")
+        if any(name in OPTIONAL for name in loaded.split(",")):
+            failures.append(module)
+    if args.check and failures:
+        sys.exit("Optional dependencies are imported eagerly by: " + ", ".join(failures))
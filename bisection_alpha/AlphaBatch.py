@@ -0,0 +1,194 @@
+import numpy as np
+if __package__:
+    from .AlphaSolver import AlphaResult as AlphaResult
+else:
+    from AlphaSolver import AlphaResult as AlphaResult
+
+def _GalfaStack(M: np.ndarray, alpha: np.ndarray, Y: np.ndarray, T: float, Tau: np.ndarray, derivative: bool):
+    """
+    Gap function for m values of alpha with c curves each. alpha is an m x 1 ndarray, Y the m x c x n ndarray of right-hand sides
+    p / d - 1 and Tau broadcasts to m x c. One stacked linear solve with the m hearts H(alpha) gives x = Q b for all curves.
+    """
+    S = M[:, np.newaxis] + M
+    A = np.abs(M[:, np.newaxis] - M)
+    a = alpha[:, np.newaxis, np.newaxis]
+    eS = np.exp(-a * S)
+    eA = np.exp(-a * A)
+    H = 0.5 * (a * (S - A) + eS - eA)                             # Heart of the Wilson function from paragraph 132 for every alpha
+    X = np.linalg.solve(H, np.swapaxes(Y, 1, 2))                  # n x c columns x = Q b from paragraph 149 for every alpha
+
+    sinhM = np.sinh(alpha[:, np.newaxis] * M)
+    N = 1 + alpha[:, np.newaxis] * np.einsum("n,mnc->mc", M, X)
+    D = np.einsum("mn,mnc->mc", sinhM, X)
+    K = N / D                                                     # Kappa as defined in paragraph 155
+    E = np.exp(alpha * T)[:, np.newaxis]
+    F = 1 - K * E
+    g = alpha[:, np.newaxis] / np.abs(F) - Tau                    # Gap at the convergence point from paragraph 158
+    if not derivative:
+        return g
+
+    dX = -np.linalg.solve(H, 0.5 * (S * (1 - eS) - A * (1 - eA)) @ X)   # dx / dalpha = -H^-1 (dH / dalpha) x
+    dN = np.einsum("n,mnc->mc", M, X) + alpha[:, np.newaxis] * np.einsum("n,mnc->mc", M, dX)
+    dD = np.einsum("mn,mnc->mc", M * np.cosh(alpha[:, np.newaxis] * M), X) + np.einsum("mn,mnc->mc", sinhM, dX)
+    dF = -((dN * D - N * dD) / D ** 2 + K * T) * E
+    return g, 1 / np.abs(F) - alpha[:, np.newaxis] * np.sign(F) * dF / F ** 2
+
+def _GalfaInputs(M_Obs, r_Obs, ufr):
+    M = np.asarray(M_Obs, dtype=float).ravel()
+    r = np.atleast_2d(np.asarray(r_Obs, dtype=float))
+    ufr = np.broadcast_to(np.asarray(ufr, dtype=float), (r.shape[0],))
+    d = np.exp(-np.log(1 + ufr)[:, np.newaxis] * M)              # Vector d described in paragraph 138 for each curve
+    y = (1 + r) ** (-M) / d - 1                                  # Right-hand side of H (Q b) = Q^-1 (p - q) with Q = diag(d) and q = d
+    return M, y, max(M.max() + 40, 60)                           # Convergence point as defined in paragraph 120 and again in 157
+
+def GalfaBatch(M_Obs: np.ndarray, r_Obs: np.ndarray, ufr, alpha: np.ndarray, Tau) -> np.ndarray:
+    """
+    Calculates the gap at the convergence point between the allowable tolerance Tau and the extrapolated curve for many curves and a grid of alpha values.
+
+    Vectorized version of `Galfa`. For zero-coupon inputs the calibration from paragraph 149 is H(alpha) Q b = p / d - 1, so the heart of
+    every alpha on the grid is built once and solved for all curves in a single stacked linear solve.
+
+    Args:
+        M_Obs = n x 1 ndarray of maturities of bonds, that have rates provided in input (r). The maturities are common to all curves. Ex. M_Obs = np.array([1, 3])
+        r_Obs = n_curves x n ndarray of rates. Each row is one curve. Ex. r_Obs = np.array([[0.0024, 0.0034], [0.0030, 0.0041]])
+        ufr =   1 x 1 floating number or n_curves x 1 ndarray representing the ultimate forward rate of each curve. Ex. ufr = 0.042
+        alpha = n_alpha x 1 ndarray of values of the convergence speed parameter alpha. Ex. alpha = np.linspace(0.05, 0.5, 10)
+        Tau =   1 x 1 floating number or n_curves x 1 ndarray representing the allowed difference between ufr and actual curve. Ex. Tau = 0.00001
+
+    Returns:
+        n_curves x n_alpha ndarray with the gap of every curve at every alpha (same as `Galfa` applied to each pair)
+
+    Example of use:
+        >>> import numpy as np
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> r_Obs = np.array([[0.01, 0.02, 0.03, 0.032, 0.035, 0.04], [0.011, 0.021, 0.031, 0.033, 0.036, 0.041]])
+        >>> GalfaBatch(M_Obs, r_Obs, 0.04, np.array([0.1, 0.15]), 0.0001).shape
+        [Out] (2, 2)
+
+    For more information see https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+    M, y, T = _GalfaInputs(M_Obs, r_Obs, ufr)
+    alpha = np.asarray(alpha, dtype=float).ravel()
+    Y = np.broadcast_to(y, (alpha.size,) + y.shape)
+    return _GalfaStack(M, alpha, Y, T, np.asarray(Tau, dtype=float), False).T
+
+def SolveAlphaBatch(xStart: float, xEnd: float, M_Obs: np.ndarray, r_Obs: np.ndarray, ufr, Tau, Precision: float, maxIter: int, nGrid: int = 10, method: str = "newton") -> AlphaResult:
+    """
+    Root finding for the convergence speed parameter alpha of many curves at once.
+
+    The gap function is first evaluated with `GalfaBatch` on a grid of nGrid alpha values on [xStart, xEnd]. For every curve the first
+    grid interval where the gap changes sign is used as the starting bracket, so the smallest root on the interval is found. All curves
+    are then refined in lock-step: every iteration takes one safeguarded Newton step (as in `SolveAlpha`) or one bisection step for each
+    unconverged curve and evaluates all of them with a single stacked linear solve. Converged curves drop out of the following iterations.
+
+    Args:
+        xStart =    1 x 1 floating number representing the minimum allowed value of the convergence speed parameter alpha. Ex. alpha = 0.05
+        xEnd =      1 x 1 floating number representing the maximum allowed value of the convergence speed parameter alpha. Ex. alpha = 0.8
+        M_Obs =     n x 1 ndarray of maturities of bonds, that have rates provided in input (r). The maturities are common to all curves. Ex. M_Obs = np.array([1, 3])
+        r_Obs =     n_curves x n ndarray of rates. Each row is one curve. Ex. r_Obs = np.array([[0.0024, 0.0034], [0.0030, 0.0041]])
+        ufr  =      1 x 1 floating number or n_curves x 1 ndarray representing the ultimate forward rate of each curve. Ex. ufr = 0.042
+        Tau =       1 x 1 floating number or n_curves x 1 ndarray representing the allowed difference between ufr and actual curve. Ex. Tau = 0.00001
+        Precision = 1 x 1 floating number representing the precision of the calculation. A curve stops when its alpha moves by less than Precision
+        maxIter =   1 x 1 positive integer representing the maximum number of refinement iterations allowed
+        nGrid =     1 x 1 integer (at least 2) representing the number of alpha values in the initial grid
+        method =    String "newton" (safeguarded Newton with analytic derivative) or "bisection"
+
+    Returns:
+        AlphaResult where every field is an n_curves x 1 ndarray with the result of the corresponding curve. Curves without a sign
+        change of the gap function on [xStart, xEnd] have converged = False and alpha = nan. The evaluations count the grid points.
+
+    Example of use:
+        >>> import numpy as np
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> r_Obs = np.array([[0.01, 0.02, 0.03, 0.032, 0.035, 0.04], [0.011, 0.021, 0.031, 0.033, 0.036, 0.041]])
+        >>> SolveAlphaBatch(0.05, 0.5, M_Obs, r_Obs, 0.042, 0.0001, 0.0000000001, 1000).alpha
+        [Out] array([0.11403727, 0.11475153])
+
+    For more information see https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+    if method not in ("newton", "bisection"):
+        raise ValueError(f"Unknown method {method!r}")
+    if nGrid < 2:
+        raise ValueError("nGrid must be at least 2")
+    M, y, T = _GalfaInputs(M_Obs, r_Obs, ufr)
+    nCurves = y.shape[0]
+    Tau = np.broadcast_to(np.asarray(Tau, dtype=float), (nCurves,))
+    if np.any(Tau <= 0):
+        raise ValueError("Tau must be positive")
+
+    grid = np.linspace(xStart, xEnd, nGrid)
+    G = _GalfaStack(M, grid, np.broadcast_to(y, (nGrid,) + y.shape), T, Tau, False).T   # n_curves x nGrid
+
+    alpha = np.full(nCurves, np.nan)
+    gap = np.full(nCurves, np.nan)
+    converged = np.zeros(nCurves, dtype=bool)
+    iterations = np.zeros(nCurves, dtype=int)
+    evaluations = np.full(nCurves, nGrid)
+    message = np.full(nCurves, "Gap function has the same sign at all points of the grid", dtype=object)
+
+    rows = np.arange(nCurves)
+    hit = np.abs(G) < Precision                                  # Grid point already satisfies the conditions
+    change = np.sign(G[:, :-1]) != np.sign(G[:, 1:])             # Grid interval contains a root
+    iHit = np.where(hit.any(axis=1), hit.argmax(axis=1), nGrid)
+    iChange = np.where(change.any(axis=1), change.argmax(axis=1), nGrid)
+    onGrid = iHit <= iChange
+    alpha[onGrid & (iHit < nGrid)] = grid[iHit[onGrid & (iHit < nGrid)]]
+    gap[onGrid & (iHit < nGrid)] = G[rows, np.minimum(iHit, nGrid - 1)][onGrid & (iHit < nGrid)]
+    converged[onGrid & (iHit < nGrid)] = True
+    message[onGrid & (iHit < nGrid)] = "Grid point is a root"
+
+    active = ~onGrid                                             # Curves with a bracket that still have to be refined
+    iLeft = np.minimum(iChange, nGrid - 2)
+    gLeft = G[rows, iLeft]
+    # Keep every bracket oriented so that g(xLow) < 0 < g(xHigh)
+    xLow = np.where(gLeft < 0, grid[iLeft], grid[iLeft + 1])
+    xHigh = np.where(gLeft < 0, grid[iLeft + 1], grid[iLeft])
+    alpha[active] = (xLow[active] + xHigh[active]) / 2
+    step = np.abs(xHigh - xLow)
+    stepOld = step.copy()
+    yLog = np.zeros(nCurves)
+    dy = np.zeros(nCurves)
+
+    def Evaluate(index):
+        # Newton iterates on log((g + Tau) / Tau), which has the same root and sign as g but is close to linear in alpha
+        Y = y[index][:, np.newaxis, :]
+        if method == "newton":
+            g, dg = _GalfaStack(M, alpha[index], Y, T, Tau[index, np.newaxis], True)
+            gap[index], dy[index] = g[:, 0], dg[:, 0] / (g[:, 0] + Tau[index])
+            yLog[index] = np.log1p(gap[index] / Tau[index])
+        else:
+            gap[index] = yLog[index] = _GalfaStack(M, alpha[index], Y, T, Tau[index, np.newaxis], False)[:, 0]
+        evaluations[index] += 1
+
+    index = np.flatnonzero(active)
+    Evaluate(index)
+    for iIter in range(1, maxIter + 1):
+        if index.size == 0:
+            break
+        a, yI, dyI = alpha[index], yLog[index], dy[index]
+        lo, hi = xLow[index], xHigh[index]
+        bisect = (((a - hi) * dyI - yI) * ((a - lo) * dyI - yI) > 0) | (np.abs(2 * yI) > np.abs(stepOld[index] * dyI))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newStep = np.where(bisect, (hi - lo) / 2, yI / dyI)
+        stepOld[index], step[index] = step[index], newStep
+        alpha[index] = np.where(bisect, lo + newStep, a - newStep)
+        iterations[index] = iIter
+
+        done = np.abs(newStep) < Precision
+        converged[index[done]] = True
+        message[index[done]] = "Converged"
+        if done.any():
+            Evaluate(index[done])                                # Gap at the returned alpha
+        index = index[~done]
+        if index.size == 0:
+            break
+
+        Evaluate(index)
+        root = gap[index] == 0
+        converged[index[root]] = True
+        message[index[root]] = "Converged"
+        index = index[~root]
+        xLow[index] = np.where(gap[index] < 0, alpha[index], xLow[index])
+        xHigh[index] = np.where(gap[index] > 0, alpha[index], xHigh[index])
+    message[index] = "Maximum number of iterations reached"
+    return AlphaResult(alpha, converged, iterations, evaluations, gap, message)
@@ -0,0 +1,112 @@
+import json
+import os
+
+import numpy as np
+if __package__:
+    from .AlphaSolver import AlphaResult as AlphaResult, SolveAlpha as SolveAlpha
+else:
+    from AlphaSolver import AlphaResult as AlphaResult, SolveAlpha as SolveAlpha
+
+class AlphaCache:
+    """
+    Persistent store of the last calibrated alpha per curve key (currency, last liquid point, convergence point).
+
+    The cache is kept in memory as a dictionary and, if a path is given, mirrored to a JSON file that is read when the cache is created
+    and rewritten (atomically) whenever a value is stored.
+
+    Args:
+        path = Optional string with the path to the JSON file. Ex. path = "alpha_cache.json"
+
+    Example of use:
+        >>> cache = AlphaCache("alpha_cache.json")
+        >>> cache.set("EUR", 20, 60, 0.1234)
+        >>> cache.get("EUR", 20, 60)
+        [Out] 0.1234
+    """
+    def __init__(self, path: str = None):
+        self.path = path
+        self.values = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                for record in json.load(file):
+                    self.values[(record["currency"], float(record["llp"]), float(record["convergence_point"]))] = float(record["alpha"])
+
+    def get(self, currency: str, llp: float, convergencePoint: float):
+        """ Returns the cached alpha or None. """
+        return self.values.get((currency, float(llp), float(convergencePoint)))
+
+    def set(self, currency: str, llp: float, convergencePoint: float, alpha: float):
+        self.values[(currency, float(llp), float(convergencePoint))] = float(alpha)
+        if self.path is not None:
+            self.save()
+
+    def save(self):
+        records = [{"currency": c, "llp": u, "convergence_point": t, "alpha": a} for (c, u, t), a in sorted(self.values.items())]
+        with open(self.path + ".tmp", "w") as file:
+            json.dump(records, file, indent=1)
+        os.replace(self.path + ".tmp", self.path)
+
+    def __len__(self):
+        return len(self.values)
+
+def SolveAlphaIncremental(currency: str, xStart: float, xEnd: float, M_Obs: np.ndarray, r_Obs: np.ndarray, ufr: float, Tau: float, Precision: float, maxIter: int, cache: AlphaCache, width: float = 0.005, method: str = "newton") -> AlphaResult:
+    """
+    Calibration of the convergence speed parameter alpha that starts from the value found in the previous run for the same curve.
+
+    The curve is identified by the currency, the last liquid point (the longest observed maturity) and the convergence point from
+    paragraph 120. If the cache holds an alpha for this key, `SolveAlpha` is first run on the tight bracket [alpha - width, alpha + width]
+    (clipped to [xStart, xEnd]). Only if the gap function does not change sign on the tight bracket is the full bracket [xStart, xEnd]
+    used. Converged results are stored in the cache. Since alpha moves little between daily runs, a rerun usually needs only a few
+    evaluations of the gap function.
+
+    Args:
+        currency =  String identifying the curve. Ex. currency = "EUR"
+        xStart =    1 x 1 floating number representing the minimum allowed value of the convergence speed parameter alpha. Ex. alpha = 0.05
+        xEnd =      1 x 1 floating number representing the maximum allowed value of the convergence speed parameter alpha. Ex. alpha = 0.8
+        M_Obs =     n x 1 ndarray of maturities of bonds, that have rates provided in input (r). Ex. u=[[1], [3]]
+        r_Obs =     n x 1 ndarray of rates, for which you wish to calibrate the algorithm. Each rate belongs to an observable Zero-Coupon Bond with a known maturity. Ex. r = [[0.0024], [0.0034]]
+        ufr  =      1 x 1 floating number, representing the ultimate forward rate. Ex. ufr = 0.042
+        Tau =       1 x 1 floating number representing the allowed difference between ufr and actual curve. Ex. Tau = 0.00001
+        Precision = 1 x 1 floating number representing the precision of the calculation. The method stops when alpha moves by less than Precision
+        maxIter =   1 x 1 positive integer representing the maximum number of iterations allowed
+        cache =     AlphaCache holding the alpha of previous runs
+        width =     1 x 1 floating number representing the half width of the tight bracket around the cached alpha. Ex. width = 0.005
+        method =    String "newton", "brent" or "bisection" (see `SolveAlpha`)
+
+    Returns:
+        AlphaResult of the last call to `SolveAlpha`. The evaluations include the evaluations spent on the tight bracket and the message
+        states which bracket was used.
+
+    Example of use:
+        >>> import numpy as np
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> r_Obs = np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04])
+        >>> cache = AlphaCache("alpha_cache.json")
+        >>> SolveAlphaIncremental("EUR", 0.05, 0.5, M_Obs, r_Obs, 0.042, 0.0001, 0.0000000001, 1000, cache).evaluations   # First run
+        [Out] 6
+        >>> SolveAlphaIncremental("EUR", 0.05, 0.5, M_Obs, r_Obs + 0.0001, 0.042, 0.0001, 0.0000000001, 1000, cache).evaluations   # Next day
+        [Out] 5
+
+    For more information see https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+    llp = float(np.max(M_Obs))                           # Last liquid point
+    convergencePoint = max(llp + 40, 60)                 # Convergence point as defined in paragraph 120 and again in 157
+    alphaOld = cache.get(currency, llp, convergencePoint)
+
+    evaluations = 0
+    if alphaOld is not None:
+        lower, upper = max(xStart, alphaOld - width), min(xEnd, alphaOld + width)
+        if lower < upper:
+            result = SolveAlpha(lower, upper, M_Obs, r_Obs, ufr, Tau, Precision, maxIter, method)
+            if not np.isnan(result.alpha):                 # Bracket check passed
+                result = result._replace(message=result.message + " (warm start)")
+                if result.converged:
+                    cache.set(currency, llp, convergencePoint, result.alpha)
+                return result
+            evaluations = result.evaluations
+
+    result = SolveAlpha(xStart, xEnd, M_Obs, r_Obs, ufr, Tau, Precision, maxIter, method)
+    result = result._replace(evaluations=result.evaluations + evaluations, message=result.message + " (full bracket)")
+    if result.converged:
+        cache.set(currency, llp, convergencePoint, result.alpha)
+    return result
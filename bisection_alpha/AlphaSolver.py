@@ -0,0 +1,172 @@
+from typing import NamedTuple
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.optimize import brentq
+
+class AlphaResult(NamedTuple):
+    """
+    Result of the calibration of the convergence speed parameter alpha.
+
+    Fields:
+        alpha =       1 x 1 floating number representing the calibrated alpha (the last iterate if the method did not converge)
+        converged =   True if the root was found within the requested precision
+        iterations =  Number of iterations of the root finding method
+        evaluations = Number of evaluations of the gap function g(alpha)
+        gap =         Value of the gap function g(alpha) at the returned alpha
+        message =     Description of the outcome
+    """
+    alpha: float
+    converged: bool
+    iterations: int
+    evaluations: int
+    gap: float
+    message: str
+
+class GalfaSystem:
+    """
+    Gap function g(alpha) - Tau from paragraph 158 for one curve, with the parts that do not depend on alpha computed only once.
+
+    For zero-coupon inputs Q = diag(d), so the calibration from paragraph 149 can be written as H(alpha) x = p / d - 1 with x = Q b.
+    The right-hand side, the maturity sums and differences used by the heart from paragraph 132 and the convergence point from
+    paragraph 120 are fixed; each evaluation only builds and factorizes H(alpha). The derivative of g follows from
+    dx / dalpha = -H^-1 (dH / dalpha) x with
+        dH / dalpha = 0.5 * (S - S exp(-alpha S) - A + A exp(-alpha A)),  S = u + v, A = |u - v|.
+
+    Args:
+        M_Obs = n x 1 ndarray of maturities of bonds, that have rates provided in input (r). Ex. u=[[1], [3]]
+        r_Obs = n x 1 ndarray of rates, for which you wish to calibrate the algorithm. Each rate belongs to an observable Zero-Coupon Bond with a known maturity. Ex. r = [[0.0024], [0.0034]]
+        ufr =   1 x 1 floating number, representing the ultimate forward rate. Ex. ufr = 0.042
+        Tau =   1 x 1 floating number representing the allowed difference between ufr and actual curve. Ex. Tau = 0.00001
+
+    Example of use:
+        >>> import numpy as np
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> r_Obs = np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04])
+        >>> g = GalfaSystem(M_Obs, r_Obs, 0.04, 0.0001)
+        >>> g(0.15)   # Same as Galfa(M_Obs, r_Obs, 0.04, 0.15, 0.0001)
+        [Out] -8.544212205612438e-05
+        >>> g(0.15, derivative=True)
+        [Out] (-8.544212205612438e-05, -0.000803347112...)
+
+    For more information see https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+    def __init__(self, M_Obs: np.ndarray, r_Obs: np.ndarray, ufr: float, Tau: float):
+        self.M = np.asarray(M_Obs, dtype=float).ravel()
+        r = np.asarray(r_Obs, dtype=float).ravel()
+        self.Tau = Tau
+        self.T = max(self.M.max() + 40, 60)            # Convergence point as defined in paragraph 120 and again in 157
+        d = np.exp(-np.log(1 + ufr) * self.M)          # Vector d described in paragraph 138
+        self.y = (1 + r) ** (-self.M) / d - 1          # Right-hand side of H (Q b) = Q^-1 (p - q) with Q = diag(d) and q = d
+        self.S = self.M[:, np.newaxis] + self.M        # u + v and |u - v| used by the heart from paragraph 132
+        self.A = np.abs(self.M[:, np.newaxis] - self.M)
+
+    def __call__(self, alpha: float, derivative: bool = False):
+        eS = np.exp(-alpha * self.S)
+        eA = np.exp(-alpha * self.A)
+        H = cho_factor(0.5 * (alpha * (self.S - self.A) + eS - eA))   # Heart of the Wilson function from paragraph 132
+        x = cho_solve(H, self.y)                                      # x = Q b from paragraph 149
+
+        sinhM = np.sinh(alpha * self.M)
+        N = 1 + alpha * self.M @ x
+        D = sinhM @ x
+        K = N / D                                                     # Kappa as defined in paragraph 155
+        F = 1 - K * np.exp(alpha * self.T)
+        g = alpha / np.abs(F) - self.Tau                              # Gap at the convergence point from paragraph 158
+        if not derivative:
+            return g
+
+        dH = 0.5 * (self.S * (1 - eS) - self.A * (1 - eA))
+        dx = -cho_solve(H, dH @ x)
+        dN = self.M @ x + alpha * self.M @ dx
+        dD = (self.M * np.cosh(alpha * self.M)) @ x + sinhM @ dx
+        dK = (dN * D - N * dD) / D ** 2
+        dF = -(dK + K * self.T) * np.exp(alpha * self.T)
+        return g, 1 / np.abs(F) - alpha * np.sign(F) * dF / F ** 2
+
+def SolveAlpha(xStart: float, xEnd: float, M_Obs: np.ndarray, r_Obs: np.ndarray, ufr: float, Tau: float, Precision: float, maxIter: int, method: str = "newton") -> AlphaResult:
+    """
+    Root finding for the convergence speed parameter alpha with a safeguarded Newton method, Brent's method or bisection.
+
+    Solves the same problem as `BisectionAlpha` but evaluates the gap function with `GalfaSystem`, which reuses the alpha-independent
+    parts of the calibration across iterations. The Newton method is applied to log((g + Tau) / Tau), which has the same root as g but is
+    nearly linear in alpha, using the analytic derivative of g. It falls back to a bisection step whenever the Newton step leaves the
+    current bracket or does not shrink fast enough, so it always keeps a bracket around the root. It typically converges in about
+    6 evaluations of g (including the two end points) instead of the 30+ evaluations needed by bisection.
+
+    Args:
+        xStart =    1 x 1 floating number representing the minimum allowed value of the convergence speed parameter alpha. Ex. alpha = 0.05
+        xEnd =      1 x 1 floating number representing the maximum allowed value of the convergence speed parameter alpha. Ex. alpha = 0.8
+        M_Obs =     n x 1 ndarray of maturities of bonds, that have rates provided in input (r). Ex. u=[[1], [3]]
+        r_Obs =     n x 1 ndarray of rates, for which you wish to calibrate the algorithm. Each rate belongs to an observable Zero-Coupon Bond with a known maturity. Ex. r = [[0.0024], [0.0034]]
+        ufr  =      1 x 1 floating number, representing the ultimate forward rate. Ex. ufr = 0.042
+        Tau =       1 x 1 floating number representing the allowed difference between ufr and actual curve. Ex. Tau = 0.00001
+        Precision = 1 x 1 floating number representing the precision of the calculation. The method stops when alpha moves by less than Precision
+        maxIter =   1 x 1 positive integer representing the maximum number of iterations allowed
+        method =    String "newton" (safeguarded Newton with analytic derivative), "brent" (Brent's method from scipy) or "bisection"
+
+    Returns:
+        AlphaResult with the calibrated alpha, a convergence flag, the number of iterations and evaluations of g, the final gap and a message.
+        If the gap function does not change sign on [xStart, xEnd] the result has converged = False and alpha = nan.
+
+    Example of use:
+        >>> import numpy as np
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> r_Obs = np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04])
+        >>> result = SolveAlpha(0.05, 0.5, M_Obs, r_Obs, 0.042, 0.0001, 0.0000000001, 1000)
+        >>> result.alpha, result.converged
+        [Out] (0.11403727446..., True)
+
+    For more information see https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+    if method not in ("newton", "brent", "bisection"):
+        raise ValueError(f"Unknown method {method!r}")
+    if Tau <= 0:
+        raise ValueError("Tau must be positive")
+    g = GalfaSystem(M_Obs, r_Obs, ufr, Tau)
+    yStart = g(xStart)
+    yEnd = g(xEnd)
+    if np.abs(yStart) < Precision:                     # If an end point already satisfies the conditions return it
+        return AlphaResult(xStart, True, 0, 2, yStart, "Start point is a root")
+    if np.abs(yEnd) < Precision:
+        return AlphaResult(xEnd, True, 0, 2, yEnd, "End point is a root")
+    if np.sign(yStart) == np.sign(yEnd):
+        return AlphaResult(np.nan, False, 0, 2, np.nan, "Gap function has the same sign at both end points of the interval")
+
+    if method == "brent":
+        alpha, info = brentq(g, xStart, xEnd, xtol=Precision, maxiter=maxIter, full_output=True, disp=False)
+        return AlphaResult(alpha, info.converged, info.iterations, info.function_calls + 3, g(alpha), info.flag)
+
+    def Evaluate(alpha):
+        # Newton iterates on log((g + Tau) / Tau), which has the same root and sign as g but is close to linear in alpha
+        if method == "newton":
+            y, dy = g(alpha, derivative=True)
+            return y, np.log1p(y / Tau), dy / (y + Tau)
+        y = g(alpha)
+        return y, y, 0.0
+
+    # Keep the bracket oriented so that g(xLow) < 0 < g(xHigh)
+    xLow, xHigh = (xStart, xEnd) if yStart < 0 else (xEnd, xStart)
+    alpha = (xStart + xEnd) / 2
+    stepOld = step = np.abs(xEnd - xStart)
+    gap, y, dy = Evaluate(alpha)
+    evaluations = 3
+    for iIter in range(1, maxIter + 1):
+        if ((alpha - xHigh) * dy - y) * ((alpha - xLow) * dy - y) > 0 or np.abs(2 * y) > np.abs(stepOld * dy):
+            stepOld, step = step, (xHigh - xLow) / 2  # Bisection step if the Newton step leaves the bracket or converges too slowly
+            alpha = xLow + step
+        else:
+            stepOld, step = step, y / dy              # Newton step
+            alpha = alpha - step
+        if np.abs(step) < Precision:
+            return AlphaResult(alpha, True, iIter, evaluations + 1, g(alpha), "Converged")
+
+        gap, y, dy = Evaluate(alpha)
+        evaluations += 1
+        if gap == 0:
+            return AlphaResult(alpha, True, iIter, evaluations, gap, "Converged")
+        if gap < 0:
+            xLow = alpha
+        else:
+            xHigh = alpha
+    return AlphaResult(alpha, False, maxIter, evaluations, gap, "Maximum number of iterations reached")
@@ -1,4 +1,8 @@
 import numpy as np
+if __package__:
+    from .SWHeart import SWHeart as SWHeart
+else:
+    from SWHeart import SWHeart as SWHeart
 
 def SWCalibrate(r: np.ndarray, M: np.ndarray, ufr: float, alpha: float)-> np.ndarray:
     """
@@ -19,9 +23,6 @@ def SWCalibrate(r: np.ndarray, M: np.ndarray, ufr: float, alpha: float)-> np.nda
     https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
     """
 
-    from SWHeart import SWHeart as SWHeart
-
-
     C = np.identity(M.size)
     p = (1+r) **(-M)  # Transform rates to implied market prices of a ZCB bond
     d = np.exp(-np.log(1+ufr) * M)    # Calculate vector d described in paragraph 138
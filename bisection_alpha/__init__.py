@@ -0,0 +1 @@
+""" Calibration of the convergence speed alpha of the Smith & Wilson algorithm. """
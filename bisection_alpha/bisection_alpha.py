@@ -1,6 +1,10 @@
 import numpy as np
-from SWCalibrate import SWCalibrate as SWCalibrate
-from SWExtrapolate import SWExtrapolate as SWExtrapolate
+if __package__:
+    from .SWCalibrate import SWCalibrate as SWCalibrate
+    from .SWExtrapolate import SWExtrapolate as SWExtrapolate
+else:
+    from SWCalibrate import SWCalibrate as SWCalibrate
+    from SWExtrapolate import SWExtrapolate as SWExtrapolate
 
 def Galfa(M_Obs: np.ndarray, r_Obs: np.ndarray, ufr: float, alpha: float, Tau: float)->float:
     """
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+if __package__:
+    from .bisection_alpha import Galfa, BisectionAlpha
+    from .AlphaSolver import GalfaSystem, SolveAlpha
+    from .AlphaBatch import GalfaBatch, SolveAlphaBatch
+    from .AlphaCache import AlphaCache, SolveAlphaIncremental
+else:
+    from bisection_alpha import Galfa, BisectionAlpha
+    from AlphaSolver import GalfaSystem, SolveAlpha
+    from AlphaBatch import GalfaBatch, SolveAlphaBatch
+    from AlphaCache import AlphaCache, SolveAlphaIncremental
+
+M_Obs = np.array([1, 2, 4, 5, 6, 7])
+r_Obs = np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04])
+ufr = 0.042
+Tau = 0.0001
+Precision = 0.0000000001
+
+# Gap function with reused alpha-independent parts matches Galfa, and its derivative matches finite differences
+@pytest.mark.parametrize("alpha", [0.06, 0.1, 0.15, 0.3])
+def test_galfa_system(alpha):
+    g = GalfaSystem(M_Obs, r_Obs, ufr, Tau)
+    value, derivative = g(alpha, derivative=True)
+    assert value == pytest.approx(Galfa(M_Obs, r_Obs, ufr, alpha, Tau), abs=1e-14)
+    h = 1e-7
+    assert derivative == pytest.approx((g(alpha + h) - g(alpha - h)) / (2 * h), rel=1e-5)
+
+# All root finding methods agree with BisectionAlpha; Newton needs only a handful of evaluations
+@pytest.mark.parametrize("method", ["newton", "brent", "bisection"])
+def test_solve_alpha(method):
+    result = SolveAlpha(0.05, 0.5, M_Obs, r_Obs, ufr, Tau, Precision, 1000, method)
+    assert result.converged
+    assert result.alpha == pytest.approx(BisectionAlpha(0.05, 0.5, M_Obs, r_Obs, ufr, Tau, Precision, 1000), abs=1e-9)
+    assert result.gap == GalfaSystem(M_Obs, r_Obs, ufr, Tau)(result.alpha), "Gap should belong to the returned alpha."
+    if method == "newton":
+        assert result.evaluations <= 8, "Newton method needed too many evaluations."
+
+# Failures are reported in the result instead of printed
+def test_solve_alpha_failure():
+    result = SolveAlpha(0.3, 0.5, M_Obs, r_Obs, ufr, Tau, Precision, 1000)
+    assert not result.converged and np.isnan(result.alpha), "Interval without a root should not converge."
+    result = SolveAlpha(0.05, 0.5, M_Obs, r_Obs, ufr, Tau, Precision, 2)
+    assert not result.converged and result.iterations == 2
+
+# Batched gap function and lock-step refinement agree with the scalar versions curve by curve
+@pytest.mark.parametrize("method", ["newton", "bisection"])
+def test_solve_alpha_batch(method):
+    r = np.vstack([r_Obs, r_Obs + 0.001, r_Obs - 0.003, r_Obs * 0.5])
+    ufrs = np.array([0.042, 0.042, 0.036, 0.03])
+    grid = np.array([0.06, 0.15, 0.3])
+    G = GalfaBatch(M_Obs, r, ufrs, grid, Tau)
+    assert G == pytest.approx(np.array([[Galfa(M_Obs, r[i], ufrs[i], a, Tau) for a in grid] for i in range(r.shape[0])]), abs=1e-14)
+    result = SolveAlphaBatch(0.05, 0.5, M_Obs, r, ufrs, Tau, Precision, 1000, method=method)
+    for i in range(r.shape[0]):
+        expected = SolveAlpha(0.05, 0.5, M_Obs, r[i], ufrs[i], Tau, Precision, 1000)
+        assert result.converged[i] == expected.converged
+        if expected.converged:
+            assert result.alpha[i] == pytest.approx(expected.alpha, abs=1e-9)
+            assert result.gap[i] == pytest.approx(GalfaSystem(M_Obs, r[i], ufrs[i], Tau)(result.alpha[i]), abs=1e-14)
+
+# Warm start from the persistent cache finds the same alpha and falls back to the full bracket after a large move
+def test_solve_alpha_incremental(tmp_path):
+    path = str(tmp_path / "alpha.json")
+    first = SolveAlphaIncremental("EUR", 0.05, 0.5, M_Obs, r_Obs, ufr, Tau, Precision, 1000, AlphaCache(path), method="bisection")
+    assert first.message.endswith("(full bracket)")
+    assert AlphaCache(path).get("EUR", 7, 60) == first.alpha, "Alpha was not persisted."
+
+    nextDay = SolveAlphaIncremental("EUR", 0.05, 0.5, M_Obs, r_Obs + 0.0005, ufr, Tau, Precision, 1000, AlphaCache(path), method="bisection")
+    assert nextDay.message.endswith("(warm start)")
+    assert nextDay.evaluations < first.evaluations
+    assert nextDay.alpha == pytest.approx(SolveAlpha(0.05, 0.5, M_Obs, r_Obs + 0.0005, ufr, Tau, Precision, 1000).alpha, abs=1e-9)
+
+    jump = SolveAlphaIncremental("EUR", 0.05, 0.5, M_Obs, r_Obs + 0.01, ufr, Tau, Precision, 1000, AlphaCache(path))
+    assert jump.converged and jump.message.endswith("(full bracket)")
@@ -0,0 +1 @@
+""" Black-Scholes model: path simulation, closed-form prices and Greeks, implied volatility and Monte Carlo pricing. """
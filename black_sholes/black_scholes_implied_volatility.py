@@ -0,0 +1,97 @@
+import numpy as np
+from scipy.special import erfcx, ndtr
+
+def _normalized_black(x, s, theta):
+    """ Undiscounted out-of-the-money option price divided by sqrt(F K), with x = ln(F / K), s = sigma sqrt(T) and theta = +1 (call) or -1 (put). """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = x / s + s / 2
+    return theta * (np.exp(x / 2) * ndtr(theta * d1) - np.exp(-x / 2) * ndtr(theta * (d1 - s)))
+
+def _log_normalized_black(x, s, theta):
+    """ Returns ln of _normalized_black and its derivative with respect to s, without underflow far out of the money.
+     With N(z) = erfcx(-z / sqrt(2)) exp(-z^2 / 2) / 2 and exp(x/2 - d1^2/2) = exp(-x/2 - d2^2/2) the common exponential factors out. """
+    d1 = x / s + s / 2
+    bracket = theta * (erfcx(-theta * d1 / np.sqrt(2)) - erfcx(-theta * (d1 - s) / np.sqrt(2))) / 2
+    return x / 2 - d1**2 / 2 + np.log(bracket), 1 / (np.sqrt(2 * np.pi) * bracket)
+
+def black_scholes_implied_volatility(price, S, K, T, r, q=0.0, call=True, bounds=(1e-6, 10.0), tol: float = 1e-12, max_iter: int = 100) -> np.ndarray:
+    """
+    Invert the Black-Scholes formula for whole arrays of option quotes at once.
+
+    Every quote is first converted with put-call parity to the out-of-the-money option on the forward, normalized by sqrt(F K), which is a
+    smooth increasing function of s = sigma sqrt(T). The initial guess is the closed-form approximation of Corrado and Miller, or, where it
+    does not exist (far from the money), the guess of Manaster and Koehler s = sqrt(2 |ln(F / K)|) from which Newton's method converges.
+    All quotes are then refined together with Halley steps. Each quote keeps a bracket of its root and falls back on bisection whenever a
+    step would leave it, and it stops as soon as it has converged (per-element masks), so deep in- and out-of-the-money quotes stay robust.
+
+    Args:
+        price (array of floats): Option prices.
+        S (array of floats): Spot price of the underlying asset.
+        K (array of floats): Strike price.
+        T (array of floats): Time to maturity in years.
+        r (array of floats): Continuously compounded risk-free rate.
+        q (array of floats): Continuous dividend yield.
+        call (array of bools): True for calls and False for puts.
+        bounds (tuple of floats): Range of volatilities that is searched.
+        tol (float): Convergence tolerance on the relative change of the volatility.
+        max_iter (int): Maximum number of iterations.
+
+    Returns:
+        np.ndarray: Implied volatilities of the broadcast shape of the arguments. Quotes outside the no-arbitrage bounds, or with a
+        volatility outside of bounds, are nan.
+
+    Example:
+        black_scholes_implied_volatility(np.array([16.69944841, 10.45058357, 6.04008813]), 100, np.array([90, 100, 110]), 1, 0.05)
+        Output:
+            array([0.2, 0.2, 0.2])
+
+    Reference:
+    - Corrado, C. J. and Miller, T. W. A note on a simple, accurate formula to compute implied standard deviations. 1996. Journal of Banking & Finance. 20:3, pp. 595-603
+    - Manaster, S. and Koehler, G. The calculation of implied variances from the Black-Scholes model: A note. 1982. The Journal of Finance. 37:1, pp. 227-230
+    """
+    price, S, K, T, r, q = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (price, S, K, T, r, q)))
+    call = np.broadcast_to(call, price.shape)
+
+    # Undiscounted out-of-the-money price normalized by sqrt(F K)
+    F = S * np.exp((r - q) * T)
+    x = np.log(F / K)
+    undiscounted = price * np.exp(r * T)
+    theta = np.where(x > 0, -1.0, 1.0)                                        # Out-of-the-money side
+    otm = undiscounted - np.where(call, 1.0, -1.0) * np.where(np.where(call, 1, -1) == theta, 0.0, F - K)
+    beta = otm / np.sqrt(F * K)
+    beta_max = np.exp(theta * x / 2)
+    sqrt_T = np.sqrt(T)
+    lo, hi = bounds[0] * sqrt_T, bounds[1] * sqrt_T
+    valid = (beta > _normalized_black(x, lo, theta)) & (beta < np.minimum(beta_max, _normalized_black(x, hi, theta)))
+
+    # Initial guess
+    intrinsic = F - K
+    c = undiscounted - np.where(call, 0.0, -intrinsic)                       # Undiscounted call price via put-call parity
+    discriminant = (c - intrinsic / 2)**2 - intrinsic**2 / np.pi
+    with np.errstate(invalid='ignore'):
+        corrado_miller = np.sqrt(2 * np.pi) / (F + K) * (c - intrinsic / 2 + np.sqrt(discriminant))
+    s = np.where((discriminant >= 0) & (corrado_miller > 0), corrado_miller, np.sqrt(2 * np.abs(x)))
+    s = np.clip(s, lo, hi)
+
+    # Safeguarded Halley iteration on the log of the normalized price, only for the quotes that have not converged
+    s, lo, hi = np.where(valid, s, np.nan), lo.copy(), hi.copy()
+    log_beta = np.log(np.where(valid, beta, 1))
+    active = np.flatnonzero(valid)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        sa, xa = s.flat[active], x.flat[active]
+        log_b, slope = _log_normalized_black(xa, sa, theta.flat[active])
+        g = log_b - log_beta.flat[active]
+        lo.flat[active] = np.where(g < 0, sa, lo.flat[active])
+        hi.flat[active] = np.where(g > 0, sa, hi.flat[active])
+        curvature = slope * (xa**2 / sa**3 - sa / 4) - slope**2
+        newton = -g / slope
+        step = newton / np.maximum(1 + newton * curvature / (2 * slope), 0.5)
+        sNew = sa + step
+        outside = ~((sNew > lo.flat[active]) & (sNew < hi.flat[active]))
+        sNew = np.where(outside, (lo.flat[active] + hi.flat[active]) / 2, sNew)
+        s.flat[active] = sNew
+        done = (np.abs(sNew - sa) <= tol * sNew) | (g == 0)
+        active = active[~done]
+    return s / sqrt_T
@@ -0,0 +1,159 @@
+import numpy as np
+from typing import NamedTuple
+from scipy.special import ndtr
+if __package__:
+    from .simulate_black_scholes_paths import black_scholes_path_chunks as black_scholes_path_chunks
+    from .black_scholes_pricing import black_scholes_price as black_scholes_price
+else:
+    from simulate_black_scholes_paths import black_scholes_path_chunks as black_scholes_path_chunks
+    from black_scholes_pricing import black_scholes_price as black_scholes_price
+
+OPTIONS = ("asian", "lookback", "barrier")
+BARRIER_TYPES = ("down-and-out", "down-and-in", "up-and-out", "up-and-in")
+
+class MonteCarloResult(NamedTuple):
+    """ Monte Carlo price, its standard error and the number of simulated paths. """
+    price: float
+    std_error: float
+    n_paths: int
+
+def geometric_asian_price(S0: float, K: float, T: float, r: float, sigma: float, n_steps: int, q: float = 0.0, call: bool = True) -> float:
+    """
+    Price a European option on the geometric average of the prices at the n_steps equally spaced dates T / n_steps, ..., T in closed form.
+
+    The log of the geometric average is normally distributed with mean ln S0 + (r - q - sigma^2 / 2) T (n + 1) / (2 n) and variance
+    sigma^2 T (n + 1) (2n + 1) / (6 n^2), so the price follows from the Black formula.
+
+    Args:
+        S0 (float): Initial value of the underlying asset.
+        K (float): Strike price.
+        T (float): Time to maturity in years.
+        r (float): Continuously compounded risk-free rate.
+        sigma (float): Volatility of the underlying asset's return.
+        n_steps (int): Number of averaging dates.
+        q (float): Continuous dividend yield.
+        call (bool): True for a call and False for a put.
+
+    Returns:
+        float: Price of the option.
+    """
+    n = n_steps
+    mean = np.log(S0) + (r - q - sigma**2 / 2) * T * (n + 1) / (2 * n)
+    std = sigma * np.sqrt(T * (n + 1) * (2 * n + 1) / (6 * n**2))
+    d1 = (mean - np.log(K) + std**2) / std
+    w = 1 if call else -1
+    return float(np.exp(-r * T) * w * (np.exp(mean + std**2 / 2) * ndtr(w * d1) - K * ndtr(w * (d1 - std))))
+
+def black_scholes_path_dependent_mc(S0: float, r: float, sigma: float, T: float, n_steps: int, n_paths: int, option: str = "asian", K: float = None, call: bool = True, barrier: float = None, barrier_type: str = "down-and-out", control_variate: str = None, q: float = 0.0, seed=None, path_chunk: int = 50000, chunk_steps: int = 256) -> MonteCarloResult:
+    """
+    Price Asian, lookback and barrier options by Monte Carlo simulation of Black-Scholes paths without storing the paths.
+
+    The paths are simulated in chunks of path_chunk paths and, within a chunk, in blocks of chunk_steps time steps (see
+    black_scholes_path_chunks). The statistics the payoff depends on (running sum and log sum of the prices, running maximum and minimum,
+    barrier hit flags) are updated block by block, and only the sums needed for the estimator are kept between chunks. All path dependent
+    features are monitored at the n_steps dates T / n_steps, ..., T.
+
+    With a control variate X of known expectation the estimator is mean(Y - b (X - E[X])), where the payoff Y is regressed on X over all
+    paths. "geometric_asian" uses the option on the geometric average (see geometric_asian_price), which is almost perfectly correlated
+    with the arithmetic Asian option; "vanilla" uses the European option with the same strike.
+
+    Args:
+        S0 (float): Initial value of the underlying asset.
+        r (float): Continuously compounded risk-free rate.
+        sigma (float): Volatility of the underlying asset's return.
+        T (float): Time to maturity in years.
+        n_steps (int): Number of time steps (monitoring dates).
+        n_paths (int): Number of simulated paths.
+        option (str): "asian" (arithmetic average price), "lookback" or "barrier".
+        K (float): Strike price. For a lookback option without strike the floating strike payoff S_T - min (call) or max - S_T (put) is used.
+        call (bool): True for a call and False for a put.
+        barrier (float): Barrier level of a barrier option.
+        barrier_type (str): "down-and-out", "down-and-in", "up-and-out" or "up-and-in".
+        control_variate (str): None, "geometric_asian" or "vanilla".
+        q (float): Continuous dividend yield.
+        seed (int): Seed of the numpy random generator.
+        path_chunk (int): Number of paths simulated at once.
+        chunk_steps (int): Number of time steps generated at once.
+
+    Returns:
+        MonteCarloResult: Named tuple with the price, its standard error and the number of paths.
+
+    Example:
+        Arithmetic Asian call on monthly averages over one year with the geometric Asian control variate
+        black_scholes_path_dependent_mc(100, 0.05, 0.2, 1, 12, 1000000, option="asian", K=100, control_variate="geometric_asian", seed=1)
+        Output:
+            MonteCarloResult(price=6.156..., std_error=0.0002..., n_paths=1000000)
+
+    Reference:
+    For more information, see: Glasserman, P. Monte Carlo Methods in Financial Engineering. 2003. Springer. Section 4.1
+    """
+    if option not in OPTIONS:
+        raise ValueError("option must be one of " + ", ".join(OPTIONS))
+    if option == "barrier" and (barrier is None or barrier_type not in BARRIER_TYPES):
+        raise ValueError("A barrier option needs a barrier and a barrier_type from " + ", ".join(BARRIER_TYPES))
+    if option != "lookback" and K is None:
+        raise ValueError("The strike K is required")
+    if control_variate not in (None, "geometric_asian", "vanilla"):
+        raise ValueError("control_variate must be None, 'geometric_asian' or 'vanilla'")
+    if control_variate is not None and K is None:
+        raise ValueError("A control variate needs the strike K")
+
+    w = 1 if call else -1
+    discount = np.exp(-r * T)
+    dt = T / n_steps
+    if control_variate == "geometric_asian":
+        expected_control = geometric_asian_price(S0, K, T, r, sigma, n_steps, q, call)
+    elif control_variate == "vanilla":
+        expected_control = float(black_scholes_price(S0, K, T, r, sigma, q, call))
+
+    rng = np.random.default_rng(seed)
+    sums = np.zeros(5)                                                   # Sums of Y, X, Y^2, X^2 and X Y
+    for start in range(0, n_paths, path_chunk):
+        m = min(path_chunk, n_paths - start)
+        total = np.zeros(m)
+        log_total = np.zeros(m)
+        high = np.full(m, float(S0))
+        low = np.full(m, float(S0))
+        hit = np.zeros(m, dtype=bool)
+        for _, S in black_scholes_path_chunks(S0, r - q, sigma, T, dt, m, chunk_steps=chunk_steps, rng=rng):
+            if option == "asian":
+                total += S.sum(axis=1)
+            if control_variate == "geometric_asian":
+                log_total += np.log(S).sum(axis=1)
+            if option == "lookback":
+                np.maximum(high, S.max(axis=1), out=high)
+                np.minimum(low, S.min(axis=1), out=low)
+            if option == "barrier":
+                hit |= (S <= barrier).any(axis=1) if barrier_type.startswith("down") else (S >= barrier).any(axis=1)
+        S_T = S[:, -1]
+
+        if option == "asian":
+            payoff = np.maximum(w * (total / n_steps - K), 0)
+        elif option == "lookback":
+            if K is None:
+                payoff = S_T - low if call else high - S_T
+            else:
+                payoff = np.maximum(high - K, 0) if call else np.maximum(K - low, 0)
+        else:
+            vanilla = np.maximum(w * (S_T - K), 0)
+            payoff = np.where(hit == barrier_type.endswith("in"), vanilla, 0.0)
+        Y = discount * payoff
+        if control_variate == "geometric_asian":
+            X = discount * np.maximum(w * (np.exp(log_total / n_steps) - K), 0)
+        elif control_variate == "vanilla":
+            X = discount * np.maximum(w * (S_T - K), 0)
+        else:
+            X = np.zeros(m)
+        sums += [Y.sum(), X.sum(), Y @ Y, X @ X, X @ Y]
+
+    n = n_paths
+    mean_Y, mean_X = sums[0] / n, sums[1] / n
+    var_Y = (sums[2] - n * mean_Y**2) / (n - 1)
+    if control_variate is None:
+        return MonteCarloResult(float(mean_Y), float(np.sqrt(var_Y / n)), n)
+    var_X = (sums[3] - n * mean_X**2) / (n - 1)
+    cov_XY = (sums[4] - n * mean_X * mean_Y) / (n - 1)
+    b = cov_XY / var_X if var_X > 0 else 0.0
+    price = mean_Y - b * (mean_X - expected_control)
+    var_controlled = max(var_Y - 2 * b * cov_XY + b**2 * var_X, 0.0)
+    return MonteCarloResult(float(price), float(np.sqrt(var_controlled / n)), n)
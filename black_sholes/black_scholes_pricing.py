@@ -0,0 +1,97 @@
+import numpy as np
+from typing import NamedTuple
+from scipy.special import ndtr
+
+class BlackScholesResult(NamedTuple):
+    """ Price and Greeks of European options. Theta is the derivative with respect to calendar time (per year), vega and rho are per unit change. """
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
+    rho: np.ndarray
+
+def _black_scholes_d(S, K, T, r, q, sigma):
+    """ Returns d1, d2, sqrt(T), sigma sqrt(T) and the discount factors exp(-qT), exp(-rT); for sigma sqrt(T) = 0 the d's are +-inf. """
+    sqrt_T = np.sqrt(T)
+    std = sigma * sqrt_T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = (np.log(S / K) + (r - q) * T) / std + std / 2
+        d1 = np.where(std > 0, d1, np.where(np.log(S / K) + (r - q) * T > 0, np.inf, -np.inf))
+    return d1, d1 - std, sqrt_T, std, np.exp(-q * T), np.exp(-r * T)
+
+def black_scholes_price(S, K, T, r, sigma, q=0.0, call=True) -> np.ndarray:
+    """
+    Price European call and put options with the Black-Scholes formula. All arguments are broadcast against each other.
+
+    Args:
+        S (array of floats): Spot price of the underlying asset.
+        K (array of floats): Strike price.
+        T (array of floats): Time to maturity in years.
+        r (array of floats): Continuously compounded risk-free rate.
+        sigma (array of floats): Volatility of the underlying asset's return.
+        q (array of floats): Continuous dividend yield.
+        call (array of bools): True for calls and False for puts.
+
+    Returns:
+        np.ndarray: Option prices of the broadcast shape of the arguments.
+
+    Example:
+        black_scholes_price(100, np.array([90, 100, 110]), 1, 0.05, 0.2)
+        Output:
+            array([16.69944841, 10.45058357,  6.04008813])
+
+    Reference:
+    For more information, see: https://en.wikipedia.org/wiki/Black%E2%80%93Scholes_model
+    """
+    S, K, T, r, sigma, q = (np.asarray(x, dtype=float) for x in (S, K, T, r, sigma, q))
+    w = np.where(call, 1.0, -1.0)
+    d1, d2, _, _, discount_q, discount_r = _black_scholes_d(S, K, T, r, q, sigma)
+    return w * (S * discount_q * ndtr(w * d1) - K * discount_r * ndtr(w * d2))
+
+def black_scholes(S, K, T, r, sigma, q=0.0, call=True) -> BlackScholesResult:
+    """
+    Price European call and put options and calculate their Greeks with the Black-Scholes formula in one pass.
+
+    All arguments are broadcast against each other, so a whole book of options (or one option under many scenarios) is valued in one
+    call. d1, d2, the normal density and the discount factors are calculated once and shared by the price and all Greeks. Options with
+    zero volatility or zero time to maturity get their limit values.
+
+    Args:
+        S (array of floats): Spot price of the underlying asset.
+        K (array of floats): Strike price.
+        T (array of floats): Time to maturity in years.
+        r (array of floats): Continuously compounded risk-free rate.
+        sigma (array of floats): Volatility of the underlying asset's return.
+        q (array of floats): Continuous dividend yield.
+        call (array of bools): True for calls and False for puts.
+
+    Returns:
+        BlackScholesResult: Named tuple with the arrays price, delta, gamma, vega, theta and rho.
+
+    Example:
+        result = black_scholes(100, np.array([90, 100, 110]), 1, 0.05, 0.2, call=np.array([True, True, False]))
+        result.delta
+        Output:
+            array([ 0.80970306,  0.63683065, -0.55035207])
+
+    Reference:
+    For more information, see: https://en.wikipedia.org/wiki/Greeks_(finance)
+    """
+    S, K, T, r, sigma, q = (np.asarray(x, dtype=float) for x in (S, K, T, r, sigma, q))
+    w = np.where(call, 1.0, -1.0)
+    d1, d2, sqrt_T, std, discount_q, discount_r = _black_scholes_d(S, K, T, r, q, sigma)
+    Nd1, Nd2 = ndtr(w * d1), ndtr(w * d2)
+    density = np.exp(-d1**2 / 2) / np.sqrt(2 * np.pi)
+    S_q, K_r = S * discount_q, K * discount_r
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gamma = np.where(std > 0, discount_q * density / (S * std), 0.0)
+        time_decay = np.where(sqrt_T > 0, -S_q * density * sigma / (2 * sqrt_T), 0.0)
+    return BlackScholesResult(
+        price=w * (S_q * Nd1 - K_r * Nd2),
+        delta=w * discount_q * Nd1,
+        gamma=gamma,
+        vega=S_q * density * sqrt_T,
+        theta=time_decay - w * r * K_r * Nd2 + w * q * S_q * Nd1,
+        rho=w * K_r * T * Nd2,
+    )
@@ -1,7 +1,9 @@
 import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 
-def simulate_black_scholes(S0: float, mu: float, sigma: float, T: float, dt: float) -> pd.DataFrame:
+def simulate_black_scholes(S0: float, mu: float, sigma: float, T: float, dt: float) -> "pd.DataFrame":
     """
     Simulate a single path for stock prices using the Black-Scholes model with vectorized operations.
     
@@ -61,5 +63,6 @@ def simulate_black_scholes(S0: float, mu: float, sigma: float, T: float, dt: flo
     price_path = S0 * np.exp(np.insert(np.cumsum(increments), 0, 0))
     
     # Convert to DataFrame with a single column for the simulated path
+    import pandas as pd
     return pd.DataFrame(price_path, index=time, columns=['Simulation'])
 
@@ -0,0 +1,97 @@
+import numpy as np
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
+
+def black_scholes_path_chunks(S0: float, mu: float, sigma: float, T: float, dt: float, n_paths: int, seed=None, chunk_steps: int = 256, rng=None):
+    """
+    Generate Black-Scholes paths for many paths at once, a block of time steps at a time.
+
+    The log price of every path is carried from one block to the next, so only n_paths x chunk_steps values are held in memory at any time,
+    however long the horizon.
+
+    Args:
+        S0 (float): Initial value of the underlying asset.
+        mu (float): Drift rate of the underlying asset.
+        sigma (float): Standard deviation of the underlying asset's return.
+        T (float): Maximum modeling time.
+        dt (float): Length of each subinterval.
+        n_paths (int): Number of simulated paths.
+        seed (int): Seed of the numpy random generator.
+        chunk_steps (int): Number of time steps generated at once.
+        rng (np.random.Generator): Random generator to use instead of a new one created from the seed.
+
+    Yields:
+        Tuples (start, S) where S is the n_paths x k ndarray of prices at the time steps start + 1, ..., start + k (time step i is at time i * dt).
+
+    Example:
+        for start, S in black_scholes_path_chunks(100, 0.05, 0.3, 60, 1/252, 10000, seed=1):
+            running_max = np.maximum(running_max, S.max(axis=1))
+    """
+    if chunk_steps < 1:
+        raise ValueError("chunk_steps must be positive")
+    N = int(round(T / dt))  # number of steps
+    rng = np.random.default_rng(seed) if rng is None else rng
+    drift = (mu - 0.5 * sigma ** 2) * dt
+    log_S = np.full((n_paths, 1), np.log(S0))
+    for start in range(0, N, chunk_steps):
+        increments = rng.standard_normal((min(chunk_steps, N - start), n_paths)).T   # Time-major draws, so the paths do not depend on chunk_steps
+        increments *= sigma * np.sqrt(dt)
+        increments += drift
+        np.cumsum(increments, axis=1, out=increments)
+        increments += log_S
+        log_S = increments[:, -1:].copy()
+        yield start, np.exp(increments, out=increments)
+
+def simulate_black_scholes_paths(S0: float, mu: float, sigma: float, T: float, dt: float, n_paths: int, seed=None, report_times=None, dtype=np.float64, chunk_steps: int = 256, as_frame: bool = False):
+    """
+    Simulate many paths for stock prices using the Black-Scholes model at once.
+
+    The paths are generated in blocks of chunk_steps time steps (see black_scholes_path_chunks) and only the prices at the reporting times
+    are stored, so long horizons with small steps need little memory. The result is a plain ndarray; a pandas DataFrame is only built on request.
+
+    Args:
+        S0 (float): Initial value of the underlying asset.
+        mu (float): Drift rate of the underlying asset.
+        sigma (float): Standard deviation of the underlying asset's return.
+        T (float): Maximum modeling time.
+        dt (float): Length of each subinterval.
+        n_paths (int): Number of simulated paths.
+        seed (int): Seed of the numpy random generator.
+        report_times (array of floats): Times (multiples of dt) at which the prices are stored. Defaults to all times 0, dt, ..., T.
+        dtype (numpy dtype): Floating point type of the stored prices. The paths are generated in float64 and only the prices at the
+            reporting times are cast to dtype.
+        chunk_steps (int): Number of time steps generated at once.
+        as_frame (bool): If True, the result is returned as a DataFrame with time as the index and one column per path.
+
+    Returns:
+        np.ndarray: n_paths x n_report array of simulated prices (or the n_report x n_paths DataFrame if requested).
+
+    Example:
+        Model 100000 scenarios of a stock which is worth today 100, with monthly steps over 10 years and annual reporting.
+        import numpy as np
+        paths = simulate_black_scholes_paths(100, 0.05, 0.3, 10, 1/12, 100000, seed=1, report_times=np.arange(0, 11), dtype=np.float32)
+        paths.shape
+        Output:
+            (100000, 11)
+
+    Reference:
+    For more information, see: https://en.wikipedia.org/wiki/Black%E2%80%93Scholes_model
+    """
+    N = int(round(T / dt))  # number of steps
+    time = np.linspace(0, N * dt, N + 1)
+    report_times = time if report_times is None else np.atleast_1d(np.asarray(report_times, dtype=float))
+    report_steps = np.rint(report_times / dt).astype(int)
+    if np.any(report_steps < 0) or np.any(report_steps > N) or np.any(np.abs(report_steps * dt - report_times) > 1e-9):
+        raise ValueError("All reporting times must be multiples of dt between 0 and T")
+
+    paths = np.empty((n_paths, report_steps.shape[0]), dtype=dtype)
+    paths[:, report_steps == 0] = S0
+    for start, S in black_scholes_path_chunks(S0, mu, sigma, T, dt, n_paths, seed, chunk_steps):
+        columns = np.flatnonzero((report_steps > start) & (report_steps <= start + S.shape[1]))
+        paths[:, columns] = S[:, report_steps[columns] - start - 1]
+
+    if as_frame:
+        import pandas as pd
+        return pd.DataFrame(paths.T, index=time[report_steps])
+    return paths
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+if __package__:
+    from .simulate_black_scholes_paths import simulate_black_scholes_paths
+    from .black_scholes_pricing import black_scholes, black_scholes_price
+    from .black_scholes_implied_volatility import black_scholes_implied_volatility
+    from .black_scholes_monte_carlo import black_scholes_path_dependent_mc
+else:
+    from simulate_black_scholes_paths import simulate_black_scholes_paths
+    from black_scholes_pricing import black_scholes, black_scholes_price
+    from black_scholes_implied_volatility import black_scholes_implied_volatility
+    from black_scholes_monte_carlo import black_scholes_path_dependent_mc
+
+# Multi-path generator is a martingale after discounting, independent of the chunking and subsamples the reporting dates
+def test_paths():
+    paths = simulate_black_scholes_paths(100, 0.05, 0.3, 10, 1/12, 100000, seed=1, report_times=np.arange(0, 11), dtype=np.float32)
+    assert paths.shape == (100000, 11) and paths.dtype == np.float32
+    assert paths.mean(axis=0) * np.exp(-0.05 * np.arange(0, 11)) == pytest.approx(100, rel=0.01)
+    full = simulate_black_scholes_paths(100, 0.05, 0.3, 10, 0.5, 5, seed=2, chunk_steps=3)
+    assert full == pytest.approx(simulate_black_scholes_paths(100, 0.05, 0.3, 10, 0.5, 5, seed=2, chunk_steps=50), rel=1e-12)
+    assert simulate_black_scholes_paths(100, 0.05, 0.3, 10, 0.5, 5, seed=2, report_times=[0, 2.5, 10]) == pytest.approx(full[:, [0, 5, 20]], rel=1e-12)
+    frame = simulate_black_scholes_paths(100, 0.05, 0.3, 10, 0.5, 5, seed=2, as_frame=True)
+    assert list(frame.index[:3]) == [0, 0.5, 1] and frame.shape == (21, 5)
+
+# Greeks match finite differences of the price for calls and puts, and the prices satisfy put-call parity
+@pytest.mark.parametrize("call", [True, False])
+def test_greeks(call):
+    S, K, T, r, sigma, q = 100.0, np.array([80, 105, 130]), 1.5, 0.03, 0.25, 0.01
+    result = black_scholes(S, K, T, r, sigma, q, call)
+    price = lambda **bump: black_scholes_price(**{**dict(S=S, K=K, T=T, r=r, sigma=sigma, q=q, call=call), **bump})
+    h = 1e-4
+    assert result.price == pytest.approx(price(), rel=1e-14)
+    assert result.delta == pytest.approx((price(S=S + h) - price(S=S - h)) / (2 * h), abs=1e-8)
+    assert result.gamma == pytest.approx((price(S=S + h) - 2 * price() + price(S=S - h)) / h**2, abs=1e-5)
+    assert result.vega == pytest.approx((price(sigma=sigma + h) - price(sigma=sigma - h)) / (2 * h), rel=1e-6)
+    assert result.theta == pytest.approx(-(price(T=T + h) - price(T=T - h)) / (2 * h), rel=1e-6)
+    assert result.rho == pytest.approx((price(r=r + h) - price(r=r - h)) / (2 * h), rel=1e-6)
+    parity = black_scholes_price(S, K, T, r, sigma, q, True) - black_scholes_price(S, K, T, r, sigma, q, False)
+    assert parity == pytest.approx(S * np.exp(-q * T) - K * np.exp(-r * T), abs=1e-12)
+
+# Implied volatility inverts the price across strikes, maturities and option types, and rejects quotes outside the arbitrage bounds
+def test_implied_volatility():
+    rng = np.random.default_rng(0)
+    K = 100 * np.exp(rng.uniform(-1, 1, 20000))
+    T = rng.uniform(0.05, 10, 20000)
+    sigma = rng.uniform(0.05, 1.0, 20000)
+    call = rng.random(20000) < 0.5
+    prices = black_scholes_price(100, K, T, 0.03, sigma, 0.01, call)
+    implied = black_scholes_implied_volatility(prices, 100, K, T, 0.03, 0.01, call)
+    accurate = black_scholes(100, K, T, 0.03, sigma, 0.01, call).vega > 1e-6 * prices   # Time value not lost in rounding
+    assert implied[accurate] == pytest.approx(sigma[accurate], abs=1e-8)
+    assert np.isnan(black_scholes_implied_volatility([-1.0, 0.0, 150.0], 100, 100, 1, 0.0)).all()
+
+# Geometric Asian control variate cuts the error of the arithmetic Asian price, and knock-in plus knock-out prices the vanilla option
+def test_path_dependent_mc():
+    plain = black_scholes_path_dependent_mc(100, 0.05, 0.2, 1, 12, 200000, "asian", K=100, seed=1, path_chunk=30000)
+    controlled = black_scholes_path_dependent_mc(100, 0.05, 0.2, 1, 12, 200000, "asian", K=100, control_variate="geometric_asian", seed=1, path_chunk=30000)
+    assert controlled.std_error < plain.std_error / 10
+    assert controlled.price == pytest.approx(plain.price, abs=4 * plain.std_error)
+    knock_out = black_scholes_path_dependent_mc(100, 0.05, 0.2, 1, 52, 100000, "barrier", K=100, barrier=90, barrier_type="down-and-out", seed=2, chunk_steps=10)
+    knock_in = black_scholes_path_dependent_mc(100, 0.05, 0.2, 1, 52, 100000, "barrier", K=100, barrier=90, barrier_type="down-and-in", seed=2, chunk_steps=10)
+    assert knock_out.price + knock_in.price == pytest.approx(black_scholes_price(100, 100, 1, 0.05, 0.2), abs=4 * (knock_out.std_error + knock_in.std_error))
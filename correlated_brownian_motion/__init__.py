@@ -0,0 +1 @@
+""" Correlated Brownian motion. """
@@ -1,7 +1,9 @@
 import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 
-def simulate_Dothan_One_Factor(r0: float = 0.1, a: float = 1.0, sigma: float = 0.2, T: int = 52, dt = 0.1) -> pd.DataFrame:
+def simulate_Dothan_One_Factor(r0: float = 0.1, a: float = 1.0, sigma: float = 0.2, T: int = 52, dt = 0.1) -> "pd.DataFrame":
     """ Simulates a temporal series of interest rates using the One Factor Dothan model
      interest_rate_simulation = simulate_Dothan_One_Factor(r0, a, lam, sigma, T, dt)
     
@@ -56,6 +58,7 @@ def simulate_Dothan_One_Factor(r0: float = 0.1, a: float = 1.0, sigma: float = 0
         SD = r[t-1]* np.exp(-a*dt)* np.sqrt(np.exp(sigma**2*dt)-1)
         r[t] = E + SD * np.random.normal(loc = 0,scale = 1)
 
+    import pandas as pd
     dict = {'Time' : time, 'Interest Rate' : r}
 
     interest_rate_simulation = pd.DataFrame.from_dict(data = dict)
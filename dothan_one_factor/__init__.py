@@ -0,0 +1 @@
+""" One factor Dothan short rate model. """
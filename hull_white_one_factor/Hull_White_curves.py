@@ -0,0 +1,66 @@
+import numpy as np
+if __package__:
+    from .Hull_White_pricing import Hull_White_initial_curve as Hull_White_initial_curve, Hull_White_B as Hull_White_B
+else:
+    from Hull_White_pricing import Hull_White_initial_curve as Hull_White_initial_curve, Hull_White_B as Hull_White_B
+
+def Hull_White_affine_tables(a: float, sigma: float, t, f, tenors):
+    """ Calculates the tables of the affine bond formula P(t, t + tenor) = A(t, t + tenor) exp(-B(tenor) r(t))
+     B only depends on the tenor and ln A(t, t + tenor) = ln(P(0, t + tenor) / P(0, t)) + B f(0, t) - sigma^2/(4a) (1 - exp(-2at)) B^2.
+
+     Args:
+       a (float): speed of reversion parameter.
+       sigma (float): instantaneous volatility of the short rate.
+       t (array of floats): representing times of the simulation.
+       f (array of floats): representing the instantaneous forward rates at times from input t.
+       tenors (array of floats): remaining maturities of the bonds.
+
+     Returns:
+       Tuple (lnA, B) with the N x k ndarray of ln A for every time and tenor and the k x 1 ndarray of B for every tenor.
+    """
+    P0, f0 = Hull_White_initial_curve(t, f)
+    t = np.asarray(t, dtype=float)[:, np.newaxis]
+    tenors = np.asarray(tenors, dtype=float)
+    B = Hull_White_B(a, 0, tenors)
+    lnA = np.log(P0(t + tenors) / P0(t)) + B * f0(t) + sigma**2 / (4 * a) * np.expm1(-2 * a * t) * B**2
+    return lnA, B
+
+def Hull_White_zero_curves(paths, a: float, sigma: float, t, f, tenors, chunk_size: int = 1000, yields: bool = False):
+    """ Reconstructs the whole zero-coupon curve at every node of simulated short rate paths
+     The A and B tables of the affine bond formula are calculated once for the time grid and the tenors (see Hull_White_affine_tables).
+     The paths are then processed in chunks of chunk_size paths, so that only one chunk of the n_paths x N x k result is held in memory.
+     for start, stop, curves in Hull_White_zero_curves(paths, a, sigma, t, f, tenors): ...
+
+     Args:
+       paths (array of floats): n_paths x N short rates, e.g. from simulate_Hull_White_One_Factor_paths, where column k is time t[k].
+       a (float): speed of reversion parameter.
+       sigma (float): instantaneous volatility of the short rate.
+       t (array of floats): representing times of the simulation.
+       f (array of floats): representing the instantaneous forward rates at times from input t.
+       tenors (array of floats): remaining maturities of the zero-coupon bonds.
+       chunk_size (int): number of paths processed at once.
+       yields (bool): if True the continuously compounded zero rates -ln P / tenor are returned instead of the bond prices.
+
+     Yields:
+       Tuples (start, stop, curves) where curves is the (stop - start) x N x k ndarray of P(t, t + tenor) of the paths start to stop - 1.
+
+     Example:
+       t = np.linspace(0, 60, 721)
+       paths = simulate_Hull_White_One_Factor_paths(0.02, 0.04, 0.01, t, np.full(t.shape, 0.03), 10000, seed=1)
+       for start, stop, curves in Hull_White_zero_curves(paths, 0.04, 0.01, t, np.full(t.shape, 0.03), np.array([1, 5, 10, 30])):
+           print(curves.shape)
+       [out] = (1000, 721, 4)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    paths = np.asarray(paths)
+    tenors = np.asarray(tenors, dtype=float)
+    lnA, B = Hull_White_affine_tables(a, sigma, t, f, tenors)
+    lnA, B = lnA.astype(paths.dtype), B.astype(paths.dtype)
+    for start in range(0, paths.shape[0], chunk_size):
+        stop = min(start + chunk_size, paths.shape[0])
+        lnP = lnA - paths[start:stop, :, np.newaxis] * B
+        if yields:
+            yield start, stop, -lnP / tenors.astype(paths.dtype)
+        else:
+            yield start, stop, np.exp(lnP, out=lnP)
@@ -0,0 +1,90 @@
+import numpy as np
+if __package__:
+    from .Hull_White_pricing import Hull_White_initial_curve as Hull_White_initial_curve, Hull_White_B as Hull_White_B
+else:
+    from Hull_White_pricing import Hull_White_initial_curve as Hull_White_initial_curve, Hull_White_B as Hull_White_B
+
+OUTPUTS = ("deflator", "bank_account", "short_rate", "integral")
+
+def Hull_White_step_moments(a: float, sigma: float, deltat):
+    """ Returns the decay, B(dt), the standard deviations of x(t + dt) and of its integral over the step, and their correlation, where
+     x = r - alpha(t) is the Ornstein-Uhlenbeck part of the short rate. """
+    decay = np.exp(-a * deltat)
+    B = Hull_White_B(a, 0, deltat)
+    var_x = sigma**2 / (2 * a) * -np.expm1(-2 * a * deltat)
+    var_integral = sigma**2 / a**2 * (deltat - 2 * B + -np.expm1(-2 * a * deltat) / (2 * a))
+    covariance = sigma**2 * B**2 / 2
+    std_x, std_integral = np.sqrt(var_x), np.sqrt(var_integral)
+    return decay, B, std_x, std_integral, covariance / (std_x * std_integral)
+
+def Hull_White_deflators(r0: float, a: float, sigma: float, t, f, n_paths: int, report_times=None, outputs=("deflator",), seed=None, block_size: int = 12) -> dict:
+    """ Simulates the deflator exp(-int r dt) and the bank account of the One Factor Hull-White model without storing the paths
+     The short rate is r(t) = x(t) + alpha(t) (see simulate_Hull_White_One_Factor_paths). Over a time step the pair (x, int x dt) is jointly
+     Gaussian, so it is advanced exactly with two correlated shocks and no discretization error in the integral. The integral of the
+     deterministic alpha(t) is exact as well. Only the current state of every path is kept and the shocks are drawn for blocks of
+     block_size steps at a time, so the memory is O(n_paths); the requested outputs are only stored at the reporting times.
+     results = Hull_White_deflators(r0, a, sigma, t, f, n_paths, report_times)
+
+     Args:
+       r0 (float): starting interest rate of the Hull White process.
+       a (float): speed of reversion parameter.
+       sigma (float): instantaneous volatility of the short rate.
+       t (array of floats): representing times of the simulation. The first time is the starting time of the paths.
+       f (array of floats): representing the instantaneous forward rates at times from input t.
+       n_paths (int): number of simulated paths.
+       report_times (array of floats): times from t at which the outputs are stored. Defaults to the last time.
+       outputs (tuple of str): any of "deflator" (exp(-int r)), "bank_account" (exp(int r)), "short_rate" and "integral" (int r).
+       seed (int): seed of the numpy random generator.
+       block_size (int): number of time steps for which the shocks are drawn at once.
+
+     Returns:
+       Dictionary with an n_paths x n_report ndarray for every requested output.
+
+     Example:
+       t = np.linspace(0, 60, 721)
+       results = Hull_White_deflators(0.03, 0.04, 0.01, t, np.full(t.shape, 0.03), 100000, report_times=np.arange(1, 61), seed=1)
+       results["deflator"].mean(axis=0)
+       [out] = the initial discount factors exp(-0.03 T) up to the Monte Carlo error
+    """
+    unknown = set(outputs) - set(OUTPUTS)
+    if unknown:
+        raise ValueError("Unknown outputs: " + ", ".join(sorted(unknown)))
+    t = np.asarray(t, dtype=float)
+    f = np.asarray(f, dtype=float)
+    report_times = t[-1:] if report_times is None else np.atleast_1d(np.asarray(report_times, dtype=float))
+    report_steps = np.searchsorted(t, report_times)
+    if np.any(report_steps >= t.shape[0]) or np.any(np.abs(t[np.minimum(report_steps, t.shape[0] - 1)] - report_times) > 1e-10):
+        raise ValueError("All reporting times must be times of the simulation")
+
+    # Deterministic part: alpha(t) and its exact integral over every step
+    P0, _ = Hull_White_initial_curve(t, f)
+    alpha = f + sigma**2/(2*a**2)*(1-np.exp(-a*t))**2
+    G = t + (2 * np.exp(-a * t) - np.exp(-2 * a * t) / 2) / a
+    alpha_integral = -np.diff(np.log(P0(t))) + sigma**2 / (2 * a**2) * np.diff(G)
+    decay, B, std_x, std_integral, rho = Hull_White_step_moments(a, sigma, np.diff(t))
+
+    rng = np.random.default_rng(seed)
+    results = {name: np.empty((n_paths, report_steps.shape[0])) for name in outputs}
+    x = np.full(n_paths, r0 - alpha[0])
+    integral = np.zeros(n_paths)
+
+    def report(step, x, integral):
+        for column in np.flatnonzero(report_steps == step):
+            for name in outputs:
+                if name == "deflator":
+                    results[name][:, column] = np.exp(-integral)
+                elif name == "bank_account":
+                    results[name][:, column] = np.exp(integral)
+                elif name == "short_rate":
+                    results[name][:, column] = x + alpha[step]
+                else:
+                    results[name][:, column] = integral
+
+    report(0, x, integral)
+    for block in range(0, t.shape[0] - 1, block_size):
+        shocks = rng.standard_normal((min(block_size, t.shape[0] - 1 - block), 2, n_paths))
+        for el, (z1, z2) in enumerate(shocks, start=block):
+            integral += alpha_integral[el] + B[el] * x + std_integral[el] * (rho[el] * z1 + np.sqrt(1 - rho[el]**2) * z2)
+            x = decay[el] * x + std_x[el] * z1
+            report(el + 1, x, integral)
+    return results
@@ -0,0 +1,225 @@
+import numpy as np
+from scipy.optimize import least_squares
+from scipy.stats import norm
+
+def Hull_White_initial_curve(t, f):
+    """ Returns the initial discount curve P(0, T) and forward curve f(0, T)
+     The forward rates are interpolated linearly between the times t (and extrapolated flat), and the discount factors are the exact
+     exponential of minus their integral. Both returned functions accept arrays of any shape.
+     P0, f0 = Hull_White_initial_curve(t, f)
+
+     Args:
+       t (array of floats): representing times at which the forward rates are given.
+       f (array of floats): representing the instantaneous forward rates at times from input t.
+
+     Returns:
+       Tuple of two functions (P0, f0) where P0(T) is the discount factor and f0(T) the instantaneous forward rate for maturity T.
+
+     Example:
+       P0, f0 = Hull_White_initial_curve(np.array([1, 2, 5, 10, 30]), np.array([0.01, 0.015, 0.02, 0.025, 0.03]))
+       P0(np.array([1, 10]))
+    """
+    t = np.asarray(t, dtype=float)
+    f = np.asarray(f, dtype=float)
+    if t[0] > 0:
+        t, f = np.r_[0, t], np.r_[f[0], f]
+    slope = np.r_[np.diff(f) / np.diff(t), 0]
+    integral = np.r_[0, np.cumsum(np.diff(t) * (f[:-1] + f[1:]) / 2)]
+
+    def f0(T):
+        return np.interp(T, t, f)
+
+    def P0(T):
+        T = np.asarray(T, dtype=float)
+        k = np.clip(np.searchsorted(t, T, side='right') - 1, 0, t.shape[0] - 1)
+        dT = T - t[k]
+        return np.exp(-(integral[k] + f[k] * dT + slope[k] * dT**2 / 2))
+
+    return P0, f0
+
+def Hull_White_B(a: float, t, T):
+    """ B(t, T) = (1 - exp(-a (T - t))) / a of the affine bond price P(t, T) = A(t, T) exp(-B(t, T) r(t)). """
+    return -np.expm1(-a * (np.asarray(T) - np.asarray(t))) / a
+
+def Hull_White_zero_coupon_bond(a: float, sigma: float, t, T, r, P0, f0):
+    """ Calculates the price P(t, T) of a zero-coupon bond at time t if the short rate is r
+     P(t, T) = A(t, T) exp(-B(t, T) r) with ln A(t, T) = ln(P(0, T) / P(0, t)) + B(t, T) f(0, t) - sigma^2/(4a) (1 - exp(-2at)) B(t, T)^2
+
+     Args:
+       a (float): speed of reversion parameter.
+       sigma (float): instantaneous volatility of the short rate.
+       t (array of floats): valuation times.
+       T (array of floats): maturities of the bonds (broadcast against t and r).
+       r (array of floats): short rates at time t.
+       P0, f0 (functions): initial discount and forward curve (see Hull_White_initial_curve).
+
+     Returns:
+       Array of bond prices of the broadcast shape of t, T and r.
+    """
+    B = Hull_White_B(a, t, T)
+    lnA = np.log(P0(T) / P0(t)) + B * f0(t) + sigma**2 / (4 * a) * np.expm1(-2 * a * np.asarray(t)) * B**2
+    return np.exp(lnA - B * r)
+
+def Hull_White_bond_option(a: float, sigma: float, T, S, K, P0, call: bool = True):
+    """ Calculates the price at time 0 of a European option with expiry T on a zero-coupon bond maturing at S > T with strike K
+     ZBC = P(0, S) N(h) - K P(0, T) N(h - sigma_p) and ZBP = K P(0, T) N(-h + sigma_p) - P(0, S) N(-h), where
+     sigma_p = sigma B(T, S) sqrt((1 - exp(-2aT)) / (2a)) and h = ln(P(0, S) / (K P(0, T))) / sigma_p + sigma_p / 2.
+     For sigma_p = 0 (expiry T = 0) the price is the intrinsic value max(P(0, S) - K P(0, T), 0) of the call (and of the put with the sign flipped).
+
+     Args:
+       a (float): speed of reversion parameter.
+       sigma (float): instantaneous volatility of the short rate.
+       T (array of floats): expiries of the options.
+       S (array of floats): maturities of the bonds.
+       K (array of floats): strike prices.
+       P0 (function): initial discount curve (see Hull_White_initial_curve).
+       call (bool): True for a call and False for a put.
+
+     Returns:
+       Array of option prices of the broadcast shape of T, S and K.
+
+     Example:
+       P0, f0 = Hull_White_initial_curve(np.array([0, 30]), np.array([0.03, 0.03]))
+       Hull_White_bond_option(0.05, 0.01, 1, 5, 0.89, P0)
+     For more information see Brigo, D. and Mercurio, F. Interest Rate Models - Theory and Practice. 2006. Springer. Section 3.3.2
+    """
+    T = np.asarray(T, dtype=float)
+    PT, PS = P0(T), P0(S)
+    sigma_p = sigma * Hull_White_B(a, T, S) * np.sqrt(-np.expm1(-2 * a * T) / (2 * a))
+    expired = sigma_p == 0                                   # Expiry T = 0 (or sigma = 0): the option is worth its intrinsic value
+    h = np.log(PS / (K * PT)) / np.where(expired, 1, sigma_p) + sigma_p / 2
+    if call:
+        price, intrinsic = PS * norm.cdf(h) - K * PT * norm.cdf(h - sigma_p), PS - K * PT
+    else:
+        price, intrinsic = K * PT * norm.cdf(-h + sigma_p) - PS * norm.cdf(-h), K * PT - PS
+    return np.where(expired, np.maximum(intrinsic, 0), price)
+
+def Hull_White_caplet(a: float, sigma: float, T, S, X, P0, cap: bool = True):
+    """ Calculates the price at time 0 of a caplet (or floorlet) with unit notional on the simply compounded rate from T to S with strike rate X
+     A caplet is (1 + X (S - T)) put options with expiry T on the zero-coupon bond maturing at S with strike 1 / (1 + X (S - T)).
+
+     Args:
+       a (float): speed of reversion parameter.
+       sigma (float): instantaneous volatility of the short rate.
+       T (array of floats): fixing times.
+       S (array of floats): payment times.
+       X (array of floats): strike rates.
+       P0 (function): initial discount curve (see Hull_White_initial_curve).
+       cap (bool): True for a caplet and False for a floorlet.
+
+     Returns:
+       Array of caplet prices of the broadcast shape of T, S and X.
+    """
+    N = 1 + np.asarray(X) * (np.asarray(S) - np.asarray(T))
+    return N * Hull_White_bond_option(a, sigma, T, S, 1 / N, P0, call=not cap)
+
+def _Hull_White_swap_schedule(expiry, tenor, frequency: int):
+    """ Payment times of the swaps starting at expiry, padded to the longest tenor, and the mask of the actual payments. """
+    expiry, tenor = np.broadcast_arrays(np.asarray(expiry, dtype=float), np.asarray(tenor, dtype=float))
+    n = np.rint(tenor * frequency).astype(int)
+    k = np.arange(1, n.max() + 1)
+    paid = k <= n[..., np.newaxis]
+    times = expiry[..., np.newaxis] + np.where(paid, k, n[..., np.newaxis]) / frequency
+    return expiry, times, paid, n
+
+def Hull_White_swap_rate(expiry, tenor, P0, frequency: int = 1):
+    """ Returns the forward swap rates and annuities at time 0 of swaps starting at expiry with the given tenor. """
+    expiry, times, paid, _ = _Hull_White_swap_schedule(expiry, tenor, frequency)
+    annuity = np.sum(np.where(paid, P0(times), 0), axis=-1) / frequency
+    return (P0(expiry) - P0(times[..., -1])) / annuity, annuity
+
+def Hull_White_swaption(a: float, sigma: float, expiry, tenor, P0, f0, strike=None, frequency: int = 1, payer: bool = True):
+    """ Calculates the price at time 0 of European swaptions with the Jamshidian decomposition
+     The coupon bond underlying the swaption is a decreasing function of the short rate at expiry. With r* the short rate at which it is
+     worth 1, the swaption is a portfolio of options on the zero-coupon bonds of the coupons with strikes P(expiry, T_i; r*). The rates r*
+     of all swaptions are found together with a vectorized Newton iteration, so a whole expiry x tenor grid is priced in one call.
+
+     Args:
+       a (float): speed of reversion parameter.
+       sigma (float): instantaneous volatility of the short rate.
+       expiry (array of floats): expiries of the swaptions, e.g. a column vector for a grid.
+       tenor (array of floats): tenors of the underlying swaps in years (broadcast against expiry), e.g. a row vector for a grid.
+       P0, f0 (functions): initial discount and forward curve (see Hull_White_initial_curve).
+       strike (array of floats): fixed rates of the swaps. Defaults to the at-the-money forward swap rates.
+       frequency (int): number of fixed payments per year.
+       payer (bool): True for payer swaptions and False for receiver swaptions.
+
+     Returns:
+       Array of swaption prices (per unit notional) of the broadcast shape of expiry, tenor and strike.
+
+     Example:
+       P0, f0 = Hull_White_initial_curve(np.array([0, 50]), np.array([0.03, 0.03]))
+       Hull_White_swaption(0.05, 0.01, np.array([[1], [5], [10]]), np.array([1, 5, 10]), P0, f0)
+       [out] = 3 x 3 ndarray of at-the-money payer swaption prices
+     For more information see Brigo, D. and Mercurio, F. Interest Rate Models - Theory and Practice. 2006. Springer. Section 3.3.2
+    """
+    if strike is None:
+        strike = Hull_White_swap_rate(expiry, tenor, P0, frequency)[0]
+    expiry, tenor, strike = np.broadcast_arrays(np.asarray(expiry, dtype=float), np.asarray(tenor, dtype=float), np.asarray(strike, dtype=float))
+    expiry, times, paid, n = _Hull_White_swap_schedule(expiry, tenor, frequency)
+    coupons = np.where(paid, strike[..., np.newaxis] / frequency, 0)
+    coupons = coupons + (np.arange(1, times.shape[-1] + 1) == n[..., np.newaxis])
+    T0 = expiry[..., np.newaxis]
+
+    # Affine bond prices at expiry A exp(-B r); Newton iteration on sum c_i A_i exp(-B_i r) = 1, which is convex and decreasing in r
+    B = Hull_White_B(a, T0, times)
+    A = Hull_White_zero_coupon_bond(a, sigma, T0, times, 0.0, P0, f0)
+    r = f0(expiry)
+    for _ in range(100):
+        values = coupons * A * np.exp(-B * r[..., np.newaxis])
+        step = (values.sum(axis=-1) - 1) / np.sum(B * values, axis=-1)
+        r = r + step
+        if np.all(np.abs(step) < 1e-15):
+            break
+
+    X = A * np.exp(-B * r[..., np.newaxis])
+    options = Hull_White_bond_option(a, sigma, T0, times, X, P0, call=not payer)
+    return np.sum(coupons * options, axis=-1)
+
+def _Hull_White_swaption_vol_to_price(vol, expiry, tenor, strike, P0, frequency: int, vol_type: str, payer: bool = True):
+    """ Converts Black (lognormal) or Bachelier (normal) swaption volatilities to prices. """
+    forward, annuity = Hull_White_swap_rate(expiry, tenor, P0, frequency)
+    strike = forward if strike is None else strike
+    w = 1 if payer else -1
+    std = vol * np.sqrt(expiry)
+    if vol_type == "normal":
+        d = (forward - strike) / std
+        return annuity * (w * (forward - strike) * norm.cdf(w * d) + std * norm.pdf(d))
+    if vol_type == "lognormal":
+        d1 = np.log(forward / strike) / std + std / 2
+        return annuity * w * (forward * norm.cdf(w * d1) - strike * norm.cdf(w * (d1 - std)))
+    raise ValueError("vol_type must be 'normal' or 'lognormal'")
+
+def Hull_White_calibrate(expiry, tenor, market_vol, P0, f0, strike=None, vol_type: str = "normal", frequency: int = 1, a0: float = 0.05, sigma0: float = 0.01):
+    """ Calibrates the speed of reversion a and the volatility sigma to a grid of swaption volatilities
+     The market volatilities are converted to payer swaption prices with the Bachelier (normal) or Black (lognormal) formula and the
+     relative differences to the Jamshidian prices of Hull_White_swaption are minimized with a bounded least squares solver in
+     (log a, log sigma). Each evaluation prices the whole grid in one vectorized call.
+
+     Args:
+       expiry (array of floats): expiries of the swaptions, e.g. a column vector for a grid.
+       tenor (array of floats): tenors of the underlying swaps (broadcast against expiry), e.g. a row vector for a grid.
+       market_vol (array of floats): market volatilities of the broadcast shape of expiry, tenor and strike.
+       P0, f0 (functions): initial discount and forward curve (see Hull_White_initial_curve).
+       strike (array of floats): fixed rates of the swaptions. Defaults to the at-the-money forward swap rates.
+       vol_type (str): "normal" for Bachelier volatilities or "lognormal" for Black volatilities.
+       frequency (int): number of fixed payments per year.
+       a0 (float): initial guess of the speed of reversion.
+       sigma0 (float): initial guess of the volatility.
+
+     Returns:
+       Tuple (a, sigma, success) with the calibrated parameters and a boolean that is False if the solver failed.
+
+     Example:
+       P0, f0 = Hull_White_initial_curve(np.array([0, 50]), np.array([0.03, 0.03]))
+       a, sigma, success = Hull_White_calibrate(np.array([[1], [5], [10]]), np.array([1, 5, 10]), market_vol, P0, f0)
+    """
+    expiry = np.asarray(expiry, dtype=float)
+    market = _Hull_White_swaption_vol_to_price(np.asarray(market_vol, dtype=float), expiry, tenor, strike, P0, frequency, vol_type)
+
+    def residuals(z):
+        return (Hull_White_swaption(np.exp(z[0]), np.exp(z[1]), expiry, tenor, P0, f0, strike, frequency) / market - 1).ravel()
+
+    bounds = (np.log([1e-4, 1e-6]), np.log([3, 1]))
+    opt_sol = least_squares(residuals, np.log([a0, sigma0]), bounds=bounds, method="trf")
+    return np.exp(opt_sol.x[0]), np.exp(opt_sol.x[1]), opt_sol.success
@@ -0,0 +1,164 @@
+import numpy as np
+from typing import NamedTuple
+if __package__:
+    from .Hull_White_pricing import Hull_White_initial_curve as Hull_White_initial_curve
+else:
+    from Hull_White_pricing import Hull_White_initial_curve as Hull_White_initial_curve
+
+class HullWhiteTree(NamedTuple):
+    """ Trinomial tree of the One Factor Hull-White model. The rate over step i at node j is alpha[i] + j * dx. """
+    dt: float
+    dx: float
+    jmax: int
+    alpha: np.ndarray        # n_steps x 1 shift of the rates that fits the initial curve
+    center: np.ndarray       # (2 jmax + 1) x 1 central node k(j) of the branching from node j
+    pu: np.ndarray           # (2 jmax + 1) x 1 probabilities of moving to k(j) + 1, k(j) and k(j) - 1
+    pm: np.ndarray
+    pd: np.ndarray
+
+def Hull_White_tree(a: float, sigma: float, t, f, maturity: float, n_steps: int) -> HullWhiteTree:
+    """ Builds the trinomial tree of the One Factor Hull-White model fitted to the initial forward curve
+     The tree of x = r - alpha(t) is built with the exact mean and variance of x over a step, dx = sqrt(3 V) and mean reverting
+     branching at |j| = jmax. The shifts alpha of every time step are then found by forward induction of the Arrow-Debreu prices, so that
+     the tree reprices the zero-coupon bonds of the initial curve exactly. Every step of the induction is vectorized over the nodes.
+     tree = Hull_White_tree(a, sigma, t, f, maturity, n_steps)
+
+     Args:
+       a (float): speed of reversion parameter.
+       sigma (float): instantaneous volatility of the short rate.
+       t (array of floats): representing times at which the forward rates are given.
+       f (array of floats): representing the instantaneous forward rates at times from input t.
+       maturity (float): last time of the tree.
+       n_steps (int): number of time steps of length maturity / n_steps.
+
+     Returns:
+       HullWhiteTree used by Hull_White_tree_bermudan_swaption and Hull_White_tree_callable_bond.
+
+     Example:
+       tree = Hull_White_tree(0.05, 0.01, np.array([0, 30]), np.array([0.03, 0.03]), 10, 120)
+     For more information see Hull, J. and White, A. Numerical procedures for implementing term structure models I: Single-factor models. 1994. Journal of Derivatives. 2:1, pp. 7-16
+    """
+    P0, _ = Hull_White_initial_curve(t, f)
+    dt = maturity / n_steps
+    M = np.expm1(-a * dt)                                        # Mean of the change of x over a step is M x
+    V = sigma**2 / (2 * a) * -np.expm1(-2 * a * dt)
+    dx = np.sqrt(3 * V)
+    jmax = int(np.floor(0.1835 / -M)) + 1
+
+    j = np.arange(-jmax, jmax + 1)
+    center = np.clip(j, -jmax + 1, jmax - 1)
+    eta = j * M + (j - center)                                   # Expected move relative to the central node, in units of dx
+    pu = 1/6 + (eta**2 + eta) / 2
+    pm = 2/3 - eta**2
+    pd = 1/6 + (eta**2 - eta) / 2
+
+    # Forward induction of the Arrow-Debreu prices Q of the nodes of each step
+    alpha = np.empty(n_steps)
+    Q = np.ones(1)
+    for i in range(n_steps):
+        w = min(i, jmax)
+        nodes = np.arange(-w, w + 1)
+        alpha[i] = np.log(np.sum(Q * np.exp(-nodes * dx * dt)) / P0((i + 1) * dt)) / dt
+        if i == n_steps - 1:
+            break
+        wNext = min(i + 1, jmax)
+        flow = Q * np.exp(-(alpha[i] + nodes * dx) * dt)
+        index = nodes + jmax
+        QNext = np.zeros(2 * wNext + 1)
+        k = center[index] + wNext
+        np.add.at(QNext, k + 1, flow * pu[index])
+        np.add.at(QNext, k, flow * pm[index])
+        np.add.at(QNext, k - 1, flow * pd[index])
+        Q = QNext
+    return HullWhiteTree(dt, dx, jmax, alpha, center, pu, pm, pd)
+
+def _Hull_White_tree_rollback(tree: HullWhiteTree, i: int, values: np.ndarray) -> np.ndarray:
+    """ Discounted expectation at the nodes of step i of the values at the nodes of step i + 1 (vectorized over the last axis). """
+    w = min(i, tree.jmax)
+    wNext = min(i + 1, tree.jmax)
+    nodes = np.arange(-w, w + 1)
+    index = nodes + tree.jmax
+    k = tree.center[index] + wNext
+    expected = tree.pu[index] * values[..., k + 1] + tree.pm[index] * values[..., k] + tree.pd[index] * values[..., k - 1]
+    return np.exp(-(tree.alpha[i] + nodes * tree.dx) * tree.dt) * expected
+
+def _Hull_White_tree_steps(tree: HullWhiteTree, times) -> np.ndarray:
+    """ Maps times to steps of the tree and checks that they lie on the time grid. """
+    steps = np.rint(np.asarray(times, dtype=float) / tree.dt).astype(int)
+    if np.any(np.abs(steps * tree.dt - times) > 1e-8) or np.any(steps > tree.alpha.shape[0]) or np.any(steps < 0):
+        raise ValueError("All dates must lie on the time grid of the tree")
+    return steps
+
+def Hull_White_tree_bermudan_swaption(tree: HullWhiteTree, exercise_times, payment_times, strike: float, payer: bool = True) -> float:
+    """ Prices a Bermudan swaption by backward induction in the Hull-White tree
+     On each exercise date the holder can enter the swap consisting of the remaining fixed payments after that date against the floating
+     leg, which is worth 1 - (value of the remaining fixed coupons and the notional) for a payer swaption with unit notional. The remaining
+     fixed leg and the option are rolled back together, one whole time slice at a time.
+
+     Args:
+       tree (HullWhiteTree): tree built with Hull_White_tree.
+       exercise_times (array of floats): exercise dates, each a start or payment date of the swap.
+       payment_times (array of floats): fixed payment dates of the swap, the last one is the maturity of the swap.
+       strike (float): fixed rate of the swap.
+       payer (bool): True for a payer swaption and False for a receiver swaption.
+
+     Returns:
+       Price at time 0 of the swaption with unit notional.
+
+     Example:
+       tree = Hull_White_tree(0.05, 0.01, np.array([0, 30]), np.array([0.03, 0.03]), 10, 120)
+       Hull_White_tree_bermudan_swaption(tree, np.arange(1, 10), np.arange(2, 11), 0.03)
+    """
+    payment_times = np.asarray(payment_times, dtype=float)
+    accruals = np.diff(np.r_[np.min(exercise_times), payment_times])
+    cash = strike * accruals
+    cash[-1] += 1
+    payment_steps = _Hull_White_tree_steps(tree, payment_times)
+    exercise_steps = set(_Hull_White_tree_steps(tree, exercise_times).tolist())
+    w = 1 if payer else -1
+
+    last = payment_steps[-1]
+    width = 2 * min(last, tree.jmax) + 1
+    fixed_leg = np.zeros(width)
+    option = np.zeros(width)
+    for i in range(last, -1, -1):
+        if i < last:
+            fixed_leg, option = _Hull_White_tree_rollback(tree, i, np.stack([fixed_leg, option]))
+        if i in exercise_steps:
+            option = np.maximum(option, w * (1 - fixed_leg))
+        fixed_leg = fixed_leg + cash[payment_steps == i].sum()
+    return float(option[0])
+
+def Hull_White_tree_callable_bond(tree: HullWhiteTree, coupon_times, coupons, call_times, call_price: float = 1.0) -> float:
+    """ Prices a callable fixed coupon bond with unit notional by backward induction in the Hull-White tree
+     On each call date, after the coupon of that date has been paid, the issuer can redeem the bond at the call price. The issuer calls
+     when the value of the remaining payments exceeds the call price, so the bond is worth min(continuation value, call price).
+
+     Args:
+       tree (HullWhiteTree): tree built with Hull_White_tree.
+       coupon_times (array of floats): coupon dates, the last one is the maturity of the bond.
+       coupons (array of floats): coupon amounts paid on the coupon dates (the notional 1 is added at maturity).
+       call_times (array of floats): dates at which the issuer can call the bond.
+       call_price (float): price at which the bond is called.
+
+     Returns:
+       Price at time 0 of the callable bond.
+
+     Example:
+       tree = Hull_White_tree(0.05, 0.01, np.array([0, 30]), np.array([0.03, 0.03]), 10, 120)
+       Hull_White_tree_callable_bond(tree, np.arange(1, 11), np.full(10, 0.035), np.arange(3, 10))
+    """
+    cash = np.broadcast_to(np.asarray(coupons, dtype=float), np.shape(coupon_times)).copy()
+    cash[-1] += 1
+    coupon_steps = _Hull_White_tree_steps(tree, coupon_times)
+    call_steps = set(_Hull_White_tree_steps(tree, call_times).tolist())
+
+    last = coupon_steps[-1]
+    bond = np.zeros(2 * min(last, tree.jmax) + 1)
+    for i in range(last, -1, -1):
+        if i < last:
+            bond = _Hull_White_tree_rollback(tree, i, bond)
+        if i in call_steps:
+            bond = np.minimum(bond, call_price)
+        bond = bond + cash[coupon_steps == i].sum()
+    return float(bond[0])
@@ -0,0 +1 @@
+""" One factor Hull-White short rate model: simulation, closed-form pricing, trinomial tree, zero curves and deflators. """
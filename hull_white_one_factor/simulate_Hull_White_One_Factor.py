@@ -1,7 +1,9 @@
 import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 
-def simulate_Hull_White_One_Factor(r0: float , a: float, sigma: float, t, f) ->pd.DataFrame:
+def simulate_Hull_White_One_Factor(r0: float , a: float, sigma: float, t, f) -> "pd.DataFrame":
     """ Simulates a temporal series of interest rates using the One Factor Hull-White model
      Form of the model is dr_{t} = [theta[t] - alpha * r_{t-1}] dt + sigma * dW_{t} 
      interest_rate_simulation = simulate_Hull_White_One_Factor(r0, alpha, sigma, t, f)
@@ -50,6 +52,7 @@ def simulate_Hull_White_One_Factor(r0: float , a: float, sigma: float, t, f) ->p
         r[el] = np.random.normal(e[el], np.sqrt(v[el]))
         dict = {'Time' : t, 'Interest Rate' : r}
 
+    import pandas as pd
     interest_rate_simulation = pd.DataFrame.from_dict(data = dict)
     interest_rate_simulation.set_index('Time', inplace = True)
     return interest_rate_simulation
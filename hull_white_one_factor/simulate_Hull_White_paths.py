@@ -0,0 +1,67 @@
+import numpy as np
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
+
+def Hull_White_step_parameters(a: float, sigma: float, t, f):
+    """ Returns the deterministic part alpha(t) of the short rate and the decay exp(-a dt) and standard deviation of each time step. """
+    t = np.asarray(t, dtype=float)
+    alpha = np.asarray(f, dtype=float) + sigma**2/(2*a**2)*(1-np.exp(-a*t))**2
+    deltat = np.diff(t)
+    decay = np.exp(-a*deltat)
+    std = np.sqrt(sigma**2/(2*a) * -np.expm1(-2*a*deltat))
+    return alpha, decay, std
+
+def simulate_Hull_White_One_Factor_paths(r0: float, a: float, sigma: float, t, f, n_paths: int, seed=None, dtype=np.float64, as_frame: bool = False):
+    """ Simulates many paths of the short rate of the One Factor Hull-White model at once
+     Form of the model is dr_{t} = [theta[t] - a * r_{t}] dt + sigma * dW_{t}
+     The short rate is r(t) = x(t) + alpha(t), where alpha(t) = f(t) + sigma^2/(2a^2) (1 - exp(-a t))^2 is deterministic and x(t) is an
+     Ornstein-Uhlenbeck process. The decay and the standard deviation of x over every time step are calculated once, all shocks are drawn
+     as one matrix and the exact transition x(t_k) = exp(-a dt) x(t_{k-1}) + std_k Z_k is applied to all paths at once. The paths have the
+     same distribution as the ones of simulate_Hull_White_One_Factor.
+     paths = simulate_Hull_White_One_Factor_paths(r0, a, sigma, t, f, n_paths)
+
+     Args:
+       r0 (float): starting interest rate of the Hull White process.
+       a (float): speed of reversion parameter that is related to the velocity at which such trajectories will regroup around the forward rate theta.
+       sigma (float): instantaneous volatility measures instant by instant the amplitude of randomness entering the system.
+       t (array of floats): representing times at which the output is generated. The first time is the starting time of the paths.
+       f (array of floats): representing the instantaneous forward rates at times from input t.
+       n_paths (int): number of simulated paths.
+       seed (int): seed of the numpy random generator.
+       dtype (numpy dtype): floating point type in which the shocks are drawn, the recursion for x is run and the paths are returned.
+         With np.float32 the whole simulation is done in single precision.
+       as_frame (bool): if True the paths are returned as a Pandas DataFrame with the time as index and one column per path.
+
+     Returns:
+       n_paths x N ndarray of simulated short rates where column k corresponds to time t[k] (or the N x n_paths DataFrame if requested).
+
+     Example:
+       10000 monthly paths over 60 years of the interest rate which is 2% today with flat forward rates of 3%
+
+       import numpy as np
+
+       t = np.linspace(0, 60, 721)
+       paths = simulate_Hull_White_One_Factor_paths(0.02, 0.04, 0.01, t, np.full(t.shape, 0.03), 10000, seed=1)
+       paths.shape
+       [out] = (10000, 721)
+     For more information see https://en.wikipedia.org/wiki/Hull-White_model
+    """
+    alpha, decay, std = Hull_White_step_parameters(a, sigma, t, f)
+    N = alpha.shape[0]
+    rng = np.random.default_rng(seed)
+
+    # The shocks are drawn into a time-major buffer, so that every step updates one contiguous row of all paths in place; the buffer is
+    # transposed into the row-major n_paths x N output only at the end
+    x = np.empty((N, n_paths), dtype=dtype)
+    x[0] = r0 - alpha[0]
+    rng.standard_normal(out=x[1:], dtype=dtype)
+    x[1:] *= std[:, np.newaxis].astype(dtype)
+    for el in range(1, N):
+        x[el] += decay[el-1] * x[el-1]
+    x += alpha[:, np.newaxis].astype(dtype)
+
+    if as_frame:
+        import pandas as pd
+        return pd.DataFrame(x, index=pd.Index(np.asarray(t), name='Time'))
+    return np.ascontiguousarray(x.T)
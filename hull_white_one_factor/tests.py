@@ -0,0 +1,109 @@
+import warnings
+
+import numpy as np
+import pytest
+from scipy.integrate import trapezoid
+if __package__:
+    from .simulate_Hull_White_paths import simulate_Hull_White_One_Factor_paths
+    from .Hull_White_pricing import Hull_White_initial_curve, Hull_White_zero_coupon_bond, Hull_White_bond_option, Hull_White_caplet, Hull_White_swaption, Hull_White_swap_rate, Hull_White_calibrate
+    from .Hull_White_tree import Hull_White_tree, Hull_White_tree_bermudan_swaption, Hull_White_tree_callable_bond
+    from .Hull_White_curves import Hull_White_zero_curves
+    from .Hull_White_deflators import Hull_White_deflators
+else:
+    from simulate_Hull_White_paths import simulate_Hull_White_One_Factor_paths
+    from Hull_White_pricing import Hull_White_initial_curve, Hull_White_zero_coupon_bond, Hull_White_bond_option, Hull_White_caplet, Hull_White_swaption, Hull_White_swap_rate, Hull_White_calibrate
+    from Hull_White_tree import Hull_White_tree, Hull_White_tree_bermudan_swaption, Hull_White_tree_callable_bond
+    from Hull_White_curves import Hull_White_zero_curves
+    from Hull_White_deflators import Hull_White_deflators
+
+a, sigma, r0 = 0.1, 0.01, 0.02
+t = np.linspace(0, 10, 121)
+f = 0.03 - 0.01 * np.exp(-0.3 * t)
+
+# Simulated paths have the exact mean and variance of the Hull-White short rate
+def test_paths_moments():
+    paths = simulate_Hull_White_One_Factor_paths(r0, a, sigma, t, f, 100000, seed=1)
+    assert paths.shape == (100000, t.size)
+    assert paths.flags.c_contiguous
+    alpha = f + sigma**2 / (2 * a**2) * (1 - np.exp(-a * t))**2
+    mean = alpha + (r0 - alpha[0]) * np.exp(-a * t)
+    variance = sigma**2 / (2 * a) * (1 - np.exp(-2 * a * t))
+    assert paths.mean(axis=0) == pytest.approx(mean, abs=2e-4)
+    assert paths.var(axis=0) == pytest.approx(variance, rel=0.02, abs=1e-12)
+    frame = simulate_Hull_White_One_Factor_paths(r0, a, sigma, t, f, 10, seed=2, as_frame=True)
+    assert frame.values.T == pytest.approx(simulate_Hull_White_One_Factor_paths(r0, a, sigma, t, f, 10, seed=2))
+
+P0, f0 = Hull_White_initial_curve(np.array([0.5, 1, 2, 5, 10, 30]), np.array([0.01, 0.015, 0.02, 0.025, 0.03, 0.031]))
+
+# Closed-form prices satisfy put-call parity and a one-period payer swaption is a caplet
+def test_closed_form_prices():
+    call = Hull_White_bond_option(a, sigma, 2, 7, 0.9, P0)
+    put = Hull_White_bond_option(a, sigma, 2, 7, 0.9, P0, call=False)
+    assert call - put == pytest.approx(P0(7) - 0.9 * P0(2), abs=1e-15)
+    assert Hull_White_swaption(a, sigma, 5, 1, P0, f0, strike=0.03) == pytest.approx(Hull_White_caplet(a, sigma, 5, 6, 0.03, P0), abs=1e-15)
+    payer = Hull_White_swaption(a, sigma, np.array([[1], [5]]), np.array([1, 5, 10]), P0, f0)
+    receiver = Hull_White_swaption(a, sigma, np.array([[1], [5]]), np.array([1, 5, 10]), P0, f0, payer=False)
+    assert payer.shape == (2, 3)
+    assert payer == pytest.approx(receiver, abs=1e-15)   # At the money
+
+# Options that expire today are worth their intrinsic value, without warnings, also inside the Jamshidian swaption
+def test_zero_expiry():
+    P0, f0 = Hull_White_initial_curve(np.array([0, 50]), np.array([0.03, 0.03]))
+    K = np.array([0.8, P0(5), 0.9])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        call = Hull_White_bond_option(0.05, 0.01, 0, 5, K, P0)
+        put = Hull_White_bond_option(0.05, 0.01, 0, 5, K, P0, call=False)
+        swaption = Hull_White_swaption(0.05, 0.01, 0, np.array([5, 10]), P0, f0, strike=np.array([[0.02], [0.04]]))
+    assert call == pytest.approx(np.maximum(P0(5) - K, 0), abs=1e-15)
+    assert put == pytest.approx(np.maximum(K - P0(5), 0), abs=1e-15)
+    forward, annuity = Hull_White_swap_rate(0, np.array([5, 10]), P0)
+    assert swaption == pytest.approx(np.maximum(forward - np.array([[0.02], [0.04]]), 0) * annuity, abs=1e-12)
+
+# Calibration recovers the parameters used to generate a grid of normal swaption volatilities
+def test_calibrate():
+    expiry, tenor = np.array([[1], [2], [5], [10]]), np.array([1, 2, 5, 10, 20])
+    prices = Hull_White_swaption(0.08, 0.012, expiry, tenor, P0, f0)
+    forward, annuity = Hull_White_swap_rate(expiry, tenor, P0)
+    vols = prices / annuity * np.sqrt(2 * np.pi / expiry)                # Bachelier at the money
+    a_fit, sigma_fit, success = Hull_White_calibrate(expiry, tenor, vols, P0, f0)
+    assert success
+    assert (a_fit, sigma_fit) == pytest.approx((0.08, 0.012), rel=1e-6)
+
+# Tree reprices the initial curve, converges to the closed-form European swaption and respects the early exercise bounds
+def test_tree():
+    tree = Hull_White_tree(a, sigma, np.array([0.5, 1, 2, 5, 10, 30]), np.array([0.01, 0.015, 0.02, 0.025, 0.03, 0.031]), 10, 240)
+    assert Hull_White_tree_callable_bond(tree, [10], [0.0], []) == pytest.approx(P0(10), abs=1e-14)
+    strike = Hull_White_swap_rate(5, 5, P0)[0]
+    european = Hull_White_tree_bermudan_swaption(tree, [5], np.arange(6, 11), strike)
+    assert european == pytest.approx(Hull_White_swaption(a, sigma, 5, 5, P0, f0), rel=0.01)
+    assert Hull_White_tree_bermudan_swaption(tree, np.arange(5, 10), np.arange(6, 11), strike) > european
+    straight = 0.03 * P0(np.arange(1, 11)).sum() + P0(10)
+    assert Hull_White_tree_callable_bond(tree, np.arange(1, 11), np.full(10, 0.03), []) == pytest.approx(straight, abs=1e-14)
+    assert Hull_White_tree_callable_bond(tree, np.arange(1, 11), np.full(10, 0.03), np.arange(3, 10)) < straight
+
+# Streamed zero curves equal the affine bond formula at every node and discount back to the initial curve
+def test_zero_curves():
+    tenors = np.array([1, 5, 10])
+    paths = simulate_Hull_White_One_Factor_paths(r0, a, sigma, t, f, 20000, seed=4)
+    chunks = list(Hull_White_zero_curves(paths, a, sigma, t, f, tenors, chunk_size=7000))
+    assert [(start, stop) for start, stop, _ in chunks] == [(0, 7000), (7000, 14000), (14000, 20000)]
+    curves = np.concatenate([c for _, _, c in chunks])
+    P0_sim, f0_sim = Hull_White_initial_curve(t, f)
+    expected = Hull_White_zero_coupon_bond(a, sigma, t[:, np.newaxis], t[:, np.newaxis] + tenors, paths[:5, :, np.newaxis], P0_sim, f0_sim)
+    assert curves[:5] == pytest.approx(expected, rel=1e-13)
+    deflator = np.exp(-trapezoid(paths, t, axis=1))
+    assert np.mean(deflator[:, np.newaxis] * curves[:, -1], axis=0) == pytest.approx(P0_sim(t[-1] + tenors), rel=0.01)
+
+# Exact joint transition of (r, int r) reprices the initial curve even with annual steps
+def test_deflators():
+    t_annual = np.arange(0, 31.0)
+    f_annual = 0.03 - 0.01 * np.exp(-0.3 * t_annual)
+    P0_annual, _ = Hull_White_initial_curve(t_annual, f_annual)
+    results = Hull_White_deflators(f_annual[0], a, sigma, t_annual, f_annual, 50000, report_times=np.array([5, 30]), outputs=("deflator", "bank_account"), seed=5)
+    deflator = results["deflator"]
+    assert deflator.shape == (50000, 2)
+    assert deflator.mean(axis=0) == pytest.approx(P0_annual(np.array([5, 30])), abs=4 * deflator.std(axis=0).max() / np.sqrt(50000))
+    assert results["bank_account"] * deflator == pytest.approx(1, abs=1e-12)
+    with pytest.raises(ValueError):
+        Hull_White_deflators(0.02, a, sigma, t_annual, f_annual, 10, report_times=[2.5])
@@ -0,0 +1,117 @@
+"""
+Collection of actuarial models in Python.
+
+Each model lives in its own subpackage (for example `insurance_python.smith_wilson`) and can still be used as a loose script from its
+folder in the repository. This module exposes the public functions and classes of all models under one namespace:
+
+    >>> from insurance_python import SWCalibrate, SWExtrapolate
+
+The models are imported lazily on first access, so importing `insurance_python` only costs the import of this file. Heavy optional
+dependencies (pandas, matplotlib, seaborn) are only imported by the functions that return a DataFrame or draw a plot.
+"""
+
+import importlib
+
+__version__ = "0.1.0"
+
+# Public name -> module (relative to this package) that defines it
+_API = {
+    # Smith & Wilson algorithm
+    "SWHeart": "smith_wilson.SWHeart",
+    "SWCalibrate": "smith_wilson.SWCalibrate",
+    "SWExtrapolate": "smith_wilson.SWExtrapolate",
+    "SWCalibrateBatch": "smith_wilson.SWCalibrateBatch",
+    "SWExtrapolateBatch": "smith_wilson.SWExtrapolateBatch",
+    "SWCurve": "smith_wilson.SWCurve",
+    "SWCurveCache": "smith_wilson.SWCurve",
+    "SWGetCurve": "smith_wilson.SWCurve",
+    "SWHeartApply": "smith_wilson.SWStructured",
+    "SWHeartFactor": "smith_wilson.SWStructured",
+    "SWCalibrateStructured": "smith_wilson.SWStructured",
+    "SWExtrapolateStructured": "smith_wilson.SWStructured",
+    "SWExtrapolateChunked": "smith_wilson.SWExtrapolateChunked",
+    "SWEvaluate": "smith_wilson.SWEvaluate",
+    "SWCashFlowMatrix": "smith_wilson.SWCalibrateInstruments",
+    "SWSwapCashFlows": "smith_wilson.SWCalibrateInstruments",
+    "SWCalibrateInstruments": "smith_wilson.SWCalibrateInstruments",
+    "SWSensitivity": "smith_wilson.SWSensitivity",
+    "SWBatchRun": "smith_wilson.SWBatchRun",
+    # Calibration of alpha
+    "Galfa": "bisection_alpha.bisection_alpha",
+    "BisectionAlpha": "bisection_alpha.bisection_alpha",
+    "AlphaResult": "bisection_alpha.AlphaSolver",
+    "GalfaSystem": "bisection_alpha.AlphaSolver",
+    "SolveAlpha": "bisection_alpha.AlphaSolver",
+    "GalfaBatch": "bisection_alpha.AlphaBatch",
+    "SolveAlphaBatch": "bisection_alpha.AlphaBatch",
+    "AlphaCache": "bisection_alpha.AlphaCache",
+    "SolveAlphaIncremental": "bisection_alpha.AlphaCache",
+    # Nelson-Siegel-Svensson
+    "NelsonSiegelSvansson": "nelson_siegel_svansson.nelsonsiegelsvensson",
+    "NSSGoodFit": "nelson_siegel_svansson.nelsonsiegelsvensson",
+    "NSSMinimize": "nelson_siegel_svansson.nelsonsiegelsvensson",
+    "NSSLoadings": "nelson_siegel_svansson.NSSLoadings",
+    "NSSLoadingsDerivative": "nelson_siegel_svansson.NSSLoadings",
+    "NSSJacobian": "nelson_siegel_svansson.NSSFitBatch",
+    "NSSLeastSquares": "nelson_siegel_svansson.NSSFitBatch",
+    "NSSFitBatch": "nelson_siegel_svansson.NSSFitBatch",
+    "NSSProjection": "nelson_siegel_svansson.NSSFitVarPro",
+    "NSSFitVarPro": "nelson_siegel_svansson.NSSFitVarPro",
+    "NSSCurve": "nelson_siegel_svansson.NSSCurve",
+    "DNSModel": "nelson_siegel_svansson.DynamicNSS",
+    "DNSFactors": "nelson_siegel_svansson.DynamicNSS",
+    "DNSEstimate": "nelson_siegel_svansson.DynamicNSS",
+    "DNSSimulate": "nelson_siegel_svansson.DynamicNSS",
+    # Short rate and equity models
+    "simulate_black_scholes": "black_sholes.simulate_black_scholes",
+    "black_scholes_path_chunks": "black_sholes.simulate_black_scholes_paths",
+    "simulate_black_scholes_paths": "black_sholes.simulate_black_scholes_paths",
+    "BlackScholesResult": "black_sholes.black_scholes_pricing",
+    "black_scholes": "black_sholes.black_scholes_pricing",
+    "black_scholes_price": "black_sholes.black_scholes_pricing",
+    "black_scholes_implied_volatility": "black_sholes.black_scholes_implied_volatility",
+    "MonteCarloResult": "black_sholes.black_scholes_monte_carlo",
+    "geometric_asian_price": "black_sholes.black_scholes_monte_carlo",
+    "black_scholes_path_dependent_mc": "black_sholes.black_scholes_monte_carlo",
+    "simulate_Hull_White_One_Factor": "hull_white_one_factor.simulate_Hull_White_One_Factor",
+    "simulate_Hull_White_One_Factor_paths": "hull_white_one_factor.simulate_Hull_White_paths",
+    "Hull_White_initial_curve": "hull_white_one_factor.Hull_White_pricing",
+    "Hull_White_B": "hull_white_one_factor.Hull_White_pricing",
+    "Hull_White_zero_coupon_bond": "hull_white_one_factor.Hull_White_pricing",
+    "Hull_White_bond_option": "hull_white_one_factor.Hull_White_pricing",
+    "Hull_White_caplet": "hull_white_one_factor.Hull_White_pricing",
+    "Hull_White_swap_rate": "hull_white_one_factor.Hull_White_pricing",
+    "Hull_White_swaption": "hull_white_one_factor.Hull_White_pricing",
+    "Hull_White_calibrate": "hull_white_one_factor.Hull_White_pricing",
+    "HullWhiteTree": "hull_white_one_factor.Hull_White_tree",
+    "Hull_White_tree": "hull_white_one_factor.Hull_White_tree",
+    "Hull_White_tree_bermudan_swaption": "hull_white_one_factor.Hull_White_tree",
+    "Hull_White_tree_callable_bond": "hull_white_one_factor.Hull_White_tree",
+    "Hull_White_affine_tables": "hull_white_one_factor.Hull_White_curves",
+    "Hull_White_zero_curves": "hull_white_one_factor.Hull_White_curves",
+    "Hull_White_step_moments": "hull_white_one_factor.Hull_White_deflators",
+    "Hull_White_deflators": "hull_white_one_factor.Hull_White_deflators",
+    "simulate_Vasicek_One_Factor": "vasicek_one_factor.Vasicek_one_factor",
+    "simulate_Dothan_One_Factor": "dothan_one_factor.Dothan_one_factor",
+    "BrownianMotion": "vasicek_two_factor.Vasicek",
+    "Swaption": "vasicek_two_factor.Pricing",
+    "ZeroCouponBond": "vasicek_two_factor.Pricing",
+    "Calibrator": "vasicek_two_factor.Calibration",
+    "CorBrownian": "correlated_brownian_motion.CorBM",
+    # Time series
+    "stationary_bootstrap": "stationary_bootstrap.stationary_bootstrap",
+    "OptimalLength": "stationary_bootstrap_calibration.stationary_bootstrap_calibrate",
+    "ssaBasic": "singular_spectrum_analysis.ssaBasic",
+}
+
+__all__ = sorted(_API)
+
+def __getattr__(name: str):
+    if name not in _API:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("." + _API[name], __name__), name)
+    globals()[name] = value          # Later lookups do not go through __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,93 @@
+from typing import NamedTuple
+
+import numpy as np
+if __package__:
+    from .NSSLoadings import NSSLoadings as NSSLoadings
+else:
+    from NSSLoadings import NSSLoadings as NSSLoadings
+
+class DNSModel(NamedTuple):
+    """ Dynamic Nelson-Siegel-Svansson model: fixed lambdas and a VAR(1) beta_t = intercept + transition @ beta_{t-1} + e_t, e_t ~ N(0, covariance). """
+    lambda0: float
+    lambda1: float
+    intercept: np.ndarray     # 4 x 1
+    transition: np.ndarray    # 4 x 4
+    covariance: np.ndarray    # 4 x 4
+    factors: np.ndarray       # n_days x 4 history of the betas
+
+def DNSFactors(TimeVec, YieldMat, lambda0: float, lambda1: float) -> np.ndarray:
+    """
+    DNSFactors calculates the time series of the betas of a history of curves for fixed shape parameters. With the lambdas fixed the
+    curve is linear in the betas, so every day is a linear least squares fit with the same loading matrix.
+
+    Arguments:
+        TimeVec: n x 1 ndarray of maturities for which the yields in YieldMat were observed.
+        YieldMat: n_days x n ndarray of observed yields, one curve per row in chronological order.
+        lambda0: 1 x 1 floating number, representing the first shape parameter lambda of the NSS parametrization.
+        lambda1: 1 x 1 floating number, representing the second shape parameter lambda of the NSS parametrization.
+
+    Returns:
+        n_days x 4 ndarray of the betas (beta0, beta1, beta2, beta3) of each day.
+    """
+    L = NSSLoadings(TimeVec, lambda0, lambda1)
+    return np.linalg.lstsq(L, np.atleast_2d(YieldMat).T, rcond=None)[0].T
+
+def DNSEstimate(TimeVec, YieldMat, lambda0: float, lambda1: float) -> DNSModel:
+    """
+    DNSEstimate estimates the dynamic Nelson-Siegel-Svansson model in the style of Diebold and Li. The betas of each day are fitted with
+    `DNSFactors` and a vector autoregression of order 1 is estimated on them by ordinary least squares.
+
+    Arguments:
+        TimeVec: n x 1 ndarray of maturities for which the yields in YieldMat were observed.
+        YieldMat: n_days x n ndarray of observed yields, one curve per row in chronological order (at least 6 days).
+        lambda0: 1 x 1 floating number, representing the first shape parameter lambda of the NSS parametrization.
+        lambda1: 1 x 1 floating number, representing the second shape parameter lambda of the NSS parametrization.
+
+    Returns:
+        DNSModel with the estimated intercept, transition matrix and covariance matrix of the shocks.
+
+    Example of use:
+        >>> model = DNSEstimate(TimeVec, YieldMat, 1.5, 8)   # YieldMat: history of daily or monthly curves
+        >>> scenarios = DNSSimulate(model, np.array([1, 2, 5, 10, 20, 30]), nScen=10000, nSteps=12, seed=1)
+
+    Source:
+    - Diebold, F. X. and Li, C. Forecasting the term structure of government bond yields. 2006. Journal of Econometrics. 130:2, pp. 337-364
+    """
+    factors = DNSFactors(TimeVec, YieldMat, lambda0, lambda1)
+    if factors.shape[0] < 6:
+        raise ValueError("At least 6 curves are needed to estimate the vector autoregression")
+    X = np.column_stack([np.ones(factors.shape[0] - 1), factors[:-1]])
+    coefficients = np.linalg.lstsq(X, factors[1:], rcond=None)[0]                     # 5 x 4
+    residuals = factors[1:] - X @ coefficients
+    covariance = residuals.T @ residuals / (residuals.shape[0] - X.shape[1])
+    return DNSModel(float(lambda0), float(lambda1), coefficients[0], coefficients[1:].T, covariance, factors)
+
+def DNSSimulate(model: DNSModel, TimeVec, nScen: int, nSteps: int, x0=None, seed=None, returnFactors: bool = False):
+    """
+    DNSSimulate simulates yield curve scenarios from the dynamic Nelson-Siegel-Svansson model. All scenarios are propagated together,
+    one step of the vector autoregression at a time, and the curves of all scenarios and steps are calculated with a single product
+    with the loading matrix of TimeVec.
+
+    Arguments:
+        model: DNSModel estimated with `DNSEstimate`.
+        TimeVec: n x 1 ndarray of maturities of the simulated curves.
+        nScen: Positive integer representing the number of scenarios.
+        nSteps: Positive integer representing the number of time steps (of the same length as the steps of the history).
+        x0: 4 x 1 ndarray of the starting betas. Defaults to the last betas of the history.
+        seed: Seed of the numpy random generator.
+        returnFactors: Boolean. If True, the simulated betas are returned as well.
+
+    Returns:
+        nScen x nSteps x n ndarray of simulated yields (and the nScen x nSteps x 4 ndarray of simulated betas if requested).
+    """
+    rng = np.random.default_rng(seed)
+    x = np.broadcast_to(model.factors[-1] if x0 is None else np.asarray(x0, dtype=float), (nScen, 4))
+    shocks = rng.standard_normal((nSteps, nScen, 4)) @ np.linalg.cholesky(model.covariance).T
+    factors = np.empty((nScen, nSteps, 4))
+    for step in range(nSteps):
+        x = model.intercept + x @ model.transition.T + shocks[step]
+        factors[:, step] = x
+    yields = factors @ NSSLoadings(TimeVec, model.lambda0, model.lambda1).T
+    if returnFactors:
+        return yields, factors
+    return yields
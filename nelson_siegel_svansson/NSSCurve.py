@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+import numpy as np
+if __package__:
+    from .NSSLoadings import NSSLoadings as NSSLoadings
+else:
+    from NSSLoadings import NSSLoadings as NSSLoadings
+
+class NSSCurve:
+    """
+    Evaluation of Nelson-Siegel-Svansson curves on fixed maturity grids with cached loading matrices.
+
+    The loading matrix (see `NSSLoadings`) only depends on the maturities and on the two shape parameters. It is calculated once per
+    (maturity grid, lambda0, lambda1) and kept in a least recently used cache of at most maxSize matrices. Evaluating the curve for one or
+    many beta vectors is then a single matrix product. The maturity T = 0 gives the limit beta0 + beta1 without division warnings.
+
+    Arguments:
+        maxSize: Positive integer representing the maximum number of loading matrices kept in the cache.
+
+    Example of use:
+        >>> import numpy as np
+        >>> curve = NSSCurve()
+        >>> T = np.array([0, 1, 5, 30])
+        >>> curve(T, [0.03, -0.02, 0.01, 0.005], 1.5, 8)                        # n x 1 ndarray, same as NelsonSiegelSvansson for T > 0
+        >>> curve(T, np.array([[0.03, -0.02, 0.01, 0.005], [0.02, 0, 0, 0]]), 1.5, 8)   # 2 x n ndarray, the loadings are reused
+    """
+    def __init__(self, maxSize: int = 128):
+        if maxSize < 1:
+            raise ValueError("maxSize must be positive")
+        self.maxSize = maxSize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def loadings(self, T, lambda0: float, lambda1: float) -> np.ndarray:
+        """ Returns the read-only n x 4 loading matrix for the maturities T, from the cache if possible. """
+        T = np.ascontiguousarray(T, dtype=float).ravel()
+        key = (T.tobytes(), float(lambda0), float(lambda1))
+        L = self.cache.get(key)
+        if L is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return L
+        self.misses += 1
+        L = NSSLoadings(T, lambda0, lambda1)
+        L.flags.writeable = False                                   # Shared between callers
+        self.cache[key] = L
+        if len(self.cache) > self.maxSize:
+            self.cache.popitem(last=False)                          # Evict the least recently used matrix
+        return L
+
+    def __call__(self, T, betas, lambda0: float, lambda1: float) -> np.ndarray:
+        """
+        Calculates the curve at the maturities T.
+
+        Arguments:
+            T: n x 1 ndarray of maturities.
+            betas: 4 x 1 ndarray (beta0, beta1, beta2, beta3), or m x 4 ndarray with one beta vector per row.
+            lambda0: 1 x 1 floating number, representing the first shape parameter lambda of the NSS parametrization.
+            lambda1: 1 x 1 floating number, representing the second shape parameter lambda of the NSS parametrization.
+
+        Returns:
+            n x 1 ndarray of rates, or m x n ndarray with one curve per beta vector.
+        """
+        return np.asarray(betas, dtype=float) @ self.loadings(T, lambda0, lambda1).T
+
+    def clear(self):
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.cache)
@@ -0,0 +1,157 @@
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.optimize import least_squares
+if __package__:
+    from .NSSLoadings import NSSLoadings as NSSLoadings, NSSLoadingsDerivative as NSSLoadingsDerivative, LAMBDA_BOUNDS as LAMBDA_BOUNDS
+    from .NSSFitVarPro import NSSFitVarPro as NSSFitVarPro, LAMBDA_GRID as LAMBDA_GRID
+else:
+    from NSSLoadings import NSSLoadings as NSSLoadings, NSSLoadingsDerivative as NSSLoadingsDerivative, LAMBDA_BOUNDS as LAMBDA_BOUNDS
+    from NSSFitVarPro import NSSFitVarPro as NSSFitVarPro, LAMBDA_GRID as LAMBDA_GRID
+
+RESCUE_RATIO = 4    # A warm start whose squared error exceeds the best point of the coarse lambda grid by this factor is refitted from the grid
+
+def NSSResiduals(params, TimeVec, YieldVec):
+    """ Residuals between the NSS curve with params = (beta0, ..., beta3, lambda0, lambda1) and the observed yields. """
+    return NSSLoadings(TimeVec, params[4], params[5]) @ params[:4] - YieldVec
+
+def NSSJacobian(params, TimeVec):
+    """
+    NSSJacobian calculates the analytic n x 6 Jacobian of the NSS curve (and of `NSSResiduals`) with respect to
+    (beta0, beta1, beta2, beta3, lambda0, lambda1) at the maturities TimeVec.
+    """
+    dL = NSSLoadingsDerivative(TimeVec, params[4], params[5])
+    return np.column_stack([NSSLoadings(TimeVec, params[4], params[5]), dL[:, :2] @ params[1:3], dL[:, 2] * params[3]])
+
+def _NSSLogResiduals(z, TimeVec, YieldVec):
+    return NSSResiduals(np.concatenate([z[:4], np.exp(z[4:])]), TimeVec, YieldVec)
+
+def _NSSLogJacobian(z, TimeVec, YieldVec):
+    params = np.concatenate([z[:4], np.exp(z[4:])])
+    J = NSSJacobian(params, TimeVec)
+    J[:, 4:] *= params[4:]                      # Chain rule for lambda = exp(z)
+    return J
+
+def NSSLeastSquares(TimeVec, YieldVec, x0) -> tuple:
+    """
+    NSSLeastSquares fits the Nelson-Siegel-Svansson curve to the observed yields with the trust region least squares solver from scipy
+    using the analytic Jacobian `NSSJacobian`. The solver works with log(lambda0) and log(lambda1), bounded by LAMBDA_BOUNDS, and
+    scales the betas with the size of the observed yields.
+
+    Arguments:
+        TimeVec: n x 1 ndarray of maturities for which the yields in YieldVec were observed.
+        YieldVec: n x 1 ndarray of observed yields.
+        x0: 6 x 1 ndarray with the initial guess (beta0, beta1, beta2, beta3, lambda0, lambda1). The lambdas must be positive and should
+            differ, since for lambda0 = lambda1 the loadings of beta2 and beta3 coincide and the solver cannot separate them.
+
+    Returns:
+        Tuple (params, success) with the 6 x 1 ndarray of fitted parameters and a boolean that is False if the solver failed.
+
+    Source:
+    - https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.least_squares.html
+    """
+    x0 = np.asarray(x0, dtype=float)
+    if np.any(x0[4:] <= 0):
+        raise ValueError("Initial lambdas must be positive")
+    logBounds = np.log(LAMBDA_BOUNDS)
+    z0 = np.r_[x0[:4], np.clip(np.log(x0[4:]), logBounds[0], logBounds[1])]
+    bounds = (np.r_[[-np.inf] * 4, [logBounds[0]] * 2], np.r_[[np.inf] * 4, [logBounds[1]] * 2])
+    scale = np.r_[np.full(4, max(np.abs(YieldVec).max(), 1e-6)), 1, 1]
+    opt_sol = least_squares(_NSSLogResiduals, z0, jac=_NSSLogJacobian, bounds=bounds, args=(TimeVec, YieldVec), method="trf", x_scale=scale)
+    return np.r_[opt_sol.x[:4], np.exp(opt_sol.x[4:])], opt_sol.success
+
+def _NSSFitChunks(TimeVec, Chunks, lambdas):
+    """
+    Fits k chunks of consecutive curves (k x chunkSize x n ndarray, padded with rows of nan) in lock-step: the i-th curves of all chunks
+    are fitted together with `NSSFitVarPro`, each starting from the lambdas of the previous curve of its chunk (k x 2 ndarray, nan if
+    there is none yet). Curves without a warm start, whose warm start does not converge, or whose warm start ends in a minimum more than
+    RESCUE_RATIO times worse than the best point of the lambda grid (a chain caught in a local minimum), are fitted from the grid instead.
+    """
+    l0, l1 = (g.ravel() for g in np.meshgrid(LAMBDA_GRID, LAMBDA_GRID, indexing="ij"))
+    L = NSSLoadings(TimeVec, l0[l0 != l1], l1[l0 != l1])
+    Residual = np.eye(TimeVec.size) - L @ np.linalg.pinv(L)      # Residual projector of every grid point, so the grid bound costs one product
+    params = np.full(Chunks.shape[:2] + (6,), np.nan)
+    success = np.zeros(Chunks.shape[:2], dtype=bool)
+    lambdas = np.array(lambdas, dtype=float)
+    for i in range(Chunks.shape[1]):
+        Y = Chunks[:, i]
+        observed = ~np.isnan(Y)
+        warm = observed.any(axis=1) & ~np.isnan(lambdas[:, 0])
+        if warm.any():
+            params[warm, i], success[warm, i] = NSSFitVarPro(TimeVec, Y[warm], lambdaStart=lambdas[warm])
+            check = np.flatnonzero(warm & success[:, i] & observed.all(axis=1))
+            if check.size:
+                P = params[check, i]
+                cost = np.sum((np.einsum("mnk,mk->mn", NSSLoadings(TimeVec, P[:, 4], P[:, 5]), P[:, :4]) - Y[check]) ** 2, axis=1)
+                bound = np.min(np.sum((Residual @ Y[check].T) ** 2, axis=1), axis=0)
+                success[check[cost > RESCUE_RATIO * bound], i] = False
+        grid = observed.any(axis=1) & ~success[:, i]
+        complete = grid & observed.all(axis=1)
+        if complete.any():
+            params[complete, i], success[complete, i] = NSSFitVarPro(TimeVec, Y[complete])
+        for j in np.flatnonzero(grid & ~complete):
+            params[j, i], success[j, i] = NSSFitVarPro(TimeVec[observed[j]], Y[j, observed[j]])
+        lambdas[success[:, i]] = params[success[:, i], i, 4:]
+    params[~success] = np.nan
+    return params, success
+
+def NSSFitBatch(TimeVec, YieldMat, x0=None, workers: int = None, chunkSize: int = 50) -> tuple:
+    """
+    NSSFitBatch fits the Nelson-Siegel-Svansson curve to many curves, for example a daily history of yield curves.
+
+    Every curve is fitted by variable projection (see `NSSFitVarPro`): the betas are solved in closed form and a Levenberg-Marquardt
+    search with the analytic Jacobian runs over the two lambdas only. Each curve starts from the lambdas fitted for the previous curve
+    (warm start), which for a history of daily curves is a very good initial guess and needs only a few iterations. The history is split
+    into consecutive chunks of chunkSize curves. The chunks are fitted side by side, the i-th curves of all chunks in one vectorized
+    step, and are spread over a pool of worker processes. The first curve of every chunk, and any curve whose warm start does not
+    converge or ends far above the best point of the lambda grid (RESCUE_RATIO), is fitted from the grid of `NSSFitVarPro`, which does
+    not depend on an initial guess. A chunk therefore starts from the fit that the previous chunk would have carried forward unless the
+    curve has several competing minima, and the result does not depend on the number of workers.
+
+    Arguments:
+        TimeVec: n x 1 ndarray of maturities for which the yields in YieldMat were observed.
+        YieldMat: n_curves x n ndarray of observed yields, one curve per row in chronological order. Missing yields can be set to nan.
+        x0: Optional 6 x 1 ndarray with an initial guess (beta0, beta1, beta2, beta3, lambda0, lambda1) for the first curve of the history.
+            Only the lambdas are used. By default the first curve is fitted from the grid like the first curve of every other chunk.
+        workers: Integer representing the number of worker processes. With 1 everything runs in the calling process. Defaults to the number of CPUs.
+        chunkSize: Positive integer representing the number of consecutive curves in one chain of warm starts.
+
+    Returns:
+        Tuple (params, success) with the n_curves x 6 ndarray of fitted parameters (nan for failed fits and for curves without any
+        observed yield) and the n_curves x 1 boolean ndarray of success flags. A RuntimeWarning lists the rows whose fit failed.
+
+    Example of use:
+        >>> import numpy as np
+        >>> TimeVec = np.array([1, 2, 5, 10, 25])
+        >>> YieldMat = np.array([[0.0039, 0.0061, 0.0166, 0.0258, 0.0332], [0.0041, 0.0063, 0.0168, 0.0259, 0.0331]])
+        >>> params, success = NSSFitBatch(TimeVec, YieldMat, workers=1)
+    """
+    if chunkSize < 1:
+        raise ValueError("chunkSize must be positive")
+    TimeVec = np.asarray(TimeVec, dtype=float).ravel()
+    YieldMat = np.atleast_2d(np.asarray(YieldMat, dtype=float))
+    nCurves = YieldMat.shape[0]
+    nChunks = -(-nCurves // chunkSize)
+    Chunks = np.full((nChunks * chunkSize, TimeVec.size), np.nan)
+    Chunks[:nCurves] = YieldMat
+    Chunks = Chunks.reshape(nChunks, chunkSize, TimeVec.size)
+    lambdas = np.full((nChunks, 2), np.nan)
+    if x0 is not None:
+        lambdas[0] = np.asarray(x0, dtype=float)[4:]
+
+    workers = max(min(workers or os.cpu_count() or 1, nChunks), 1)
+    groups = np.array_split(np.arange(nChunks), workers)
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_NSSFitChunks, [TimeVec] * workers, [Chunks[g] for g in groups], [lambdas[g] for g in groups]))
+    else:
+        results = [_NSSFitChunks(TimeVec, Chunks, lambdas)]
+    params = np.concatenate([r[0] for r in results]).reshape(-1, 6)[:nCurves]
+    success = np.concatenate([r[1] for r in results]).ravel()[:nCurves]
+
+    failed = np.flatnonzero(~success & ~np.isnan(YieldMat).all(axis=1))
+    if failed.size:
+        warnings.warn(f"NSSFitBatch could not fit the curves in rows {failed.tolist()}", RuntimeWarning)
+    return params, success
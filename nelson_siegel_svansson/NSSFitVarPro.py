@@ -0,0 +1,162 @@
+import numpy as np
+if __package__:
+    from .NSSLoadings import NSSLoadings as NSSLoadings, NSSLoadingsDerivative as NSSLoadingsDerivative, LAMBDA_BOUNDS as LAMBDA_BOUNDS
+else:
+    from NSSLoadings import NSSLoadings as NSSLoadings, NSSLoadingsDerivative as NSSLoadingsDerivative, LAMBDA_BOUNDS as LAMBDA_BOUNDS
+
+LAMBDA_GRID = np.geomspace(0.1, 30, 40)   # Default grid of both shape parameters
+
+def NSSProjection(TimeVec, YieldMat, lambda0, lambda1, jacobian: bool = False):
+    """
+    NSSProjection solves the betas of the Nelson-Siegel-Svansson curve in closed form for m pairs of shape parameters.
+
+    For fixed lambdas the curve L(lambda0, lambda1) beta is linear in the betas, so the least squares betas are L^+ y. The residuals
+    L L^+ y - y are the variable projection residuals, and Kaufman's approximation of their Jacobian with respect to
+    (log lambda0, log lambda1) is (I - L L^+) dL beta. Missing yields (nan) are left out by zeroing their rows of L, so their residuals are 0.
+
+    Arguments:
+        TimeVec: n x 1 ndarray of maturities for which the yields were observed.
+        YieldMat: m x n ndarray of observed yields, one row for each pair of lambdas. Missing yields can be set to nan.
+        lambda0: m x 1 ndarray of the first shape parameters.
+        lambda1: m x 1 ndarray of the second shape parameters.
+        jacobian: Boolean. If True, the Jacobian of the residuals is also returned.
+
+    Returns:
+        Tuple (beta, residuals) with the m x 4 ndarray of betas and the m x n ndarray of residuals, and the m x n x 2 Jacobian if requested.
+    """
+    L = NSSLoadings(TimeVec, lambda0, lambda1)                                # m x n x 4
+    missing = np.isnan(YieldMat)
+    if missing.any():
+        L = np.where(missing[..., np.newaxis], 0, L)
+        YieldMat = np.where(missing, 0, YieldMat)
+    Linv = np.linalg.pinv(L)                                                  # m x 4 x n
+    beta = np.einsum("mkn,mn->mk", Linv, YieldMat)
+    residuals = np.einsum("mnk,mk->mn", L, beta) - YieldMat
+    if not jacobian:
+        return beta, residuals
+    dL = NSSLoadingsDerivative(TimeVec, lambda0, lambda1)                     # m x n x 3
+    D = np.stack([np.einsum("mnk,mk->mn", dL[..., :2], beta[:, 1:3]) * lambda0[:, np.newaxis], dL[..., 2] * (beta[:, 3] * lambda1)[:, np.newaxis]], axis=-1)
+    if missing.any():
+        D[missing] = 0
+    return beta, residuals, D - L @ (Linv @ D)
+
+def NSSFitVarPro(TimeVec, YieldVec, lambda0Grid=LAMBDA_GRID, lambda1Grid=LAMBDA_GRID, nStart: int = 3, maxIter: int = 100, lambdaStart=None) -> tuple:
+    """
+    NSSFitVarPro fits the Nelson-Siegel-Svansson curve by variable projection: the four betas are always solved in closed form
+    (see `NSSProjection`), so only the two shape parameters are searched.
+
+    The sum of squared residuals of every pair (lambda0, lambda1) on the grid is evaluated in one vectorized pass for all curves. The
+    nStart best local minima of the grid of each curve are then refined with a Levenberg-Marquardt search over (log lambda0, log lambda1)
+    that runs in lock-step for all curves and starting points, and the best result of each curve is kept. The result does not depend
+    on an initial guess and is deterministic. If lambdaStart is given, the grid is skipped and only that starting point is refined,
+    which is much faster when a good guess is known (for example the lambdas of the previous day, see `NSSFitBatch`).
+
+    Arguments:
+        TimeVec: n x 1 ndarray of maturities for which the yields in YieldVec were observed.
+        YieldVec: n x 1 ndarray of observed yields, or n_curves x n ndarray with one curve per row.
+        lambda0Grid: ndarray of positive values of lambda0 that are searched. Defaults to 40 values between 0.1 and 30.
+        lambda1Grid: ndarray of positive values of lambda1 that are searched. Pairs with lambda0 = lambda1 are skipped.
+        nStart: Integer representing the number of local minima of the grid that are refined. With 0 the best grid point is returned.
+        maxIter: Positive integer representing the maximum number of Levenberg-Marquardt iterations.
+        lambdaStart: Optional 2 x 1 ndarray (n_curves x 2 for several curves) of positive starting values of (lambda0, lambda1). With
+            lambdaStart the curves may have missing yields (nan); the grid search needs all yields.
+
+    Returns:
+        Tuple (params, converged) with the 6 x 1 ndarray (n_curves x 6 for several curves) of fitted parameters
+        (beta0, beta1, beta2, beta3, lambda0, lambda1) and the flag(s) that are False if no refinement of the curve converged.
+
+    Example of use:
+        >>> import numpy as np
+        >>> from nelsonsiegelsvensson import NelsonSiegelSvansson
+        >>> TimeVec = np.array([1, 2, 5, 10, 25])
+        >>> YieldVec = np.array([0.0039, 0.0061, 0.0166, 0.0258, 0.0332])
+        >>> params, converged = NSSFitVarPro(TimeVec, YieldVec)
+        >>> NelsonSiegelSvansson(np.array([30, 31]), *params)
+
+    Source:
+    - Golub, G. and Pereyra, V. Separable nonlinear least squares: the variable projection method and its applications. 2003. Inverse Problems. 19:2, pp. R1-R26
+    """
+    TimeVec = np.asarray(TimeVec, dtype=float).ravel()
+    single = np.ndim(YieldVec) == 1
+    YieldMat = np.atleast_2d(np.asarray(YieldVec, dtype=float))
+    nCurves = YieldMat.shape[0]
+
+    if lambdaStart is not None:
+        iCurve = np.arange(nCurves)
+        start = np.broadcast_to(np.asarray(lambdaStart, dtype=float), (nCurves, 2))
+        if np.any(start <= 0):
+            raise ValueError("Starting lambdas must be positive")
+        z, refine = np.log(start), maxIter > 0
+    else:
+        if np.isnan(YieldMat).any():
+            raise ValueError("The grid search needs all yields; missing yields are only supported with lambdaStart")
+        # Closed form betas for every pair of lambdas on the grid and every curve
+        lambda0Grid = np.asarray(lambda0Grid, dtype=float).ravel()
+        lambda1Grid = np.asarray(lambda1Grid, dtype=float).ravel()
+        lambda0, lambda1 = (g.ravel() for g in np.meshgrid(lambda0Grid, lambda1Grid, indexing="ij"))
+        keep = lambda0 != lambda1
+        L = NSSLoadings(TimeVec, lambda0[keep], lambda1[keep])                   # n_grid x n x 4
+        sse = np.full((lambda0.size, nCurves), np.inf)
+        sse[keep] = np.sum((L @ (np.linalg.pinv(L) @ YieldMat.T) - YieldMat.T) ** 2, axis=1)
+
+        # Local minima of the grid (not larger than any of the 8 neighbours) are the starting points of the refinement
+        S = np.pad(sse.reshape(lambda0Grid.size, lambda1Grid.size, nCurves), ((1, 1), (1, 1), (0, 0)), constant_values=np.inf)
+        center = S[1:-1, 1:-1]
+        isMinimum = np.isfinite(center)
+        for i in range(3):
+            for j in range(3):
+                isMinimum &= center <= S[i:i + center.shape[0], j:j + center.shape[1]]
+        candidates = np.where(isMinimum.reshape(lambda0.size, nCurves), sse, np.inf)
+        iStart = np.argsort(candidates, axis=0)[:max(nStart, 1)]                  # nStart x n_curves
+        iStart[0] = np.argmin(sse, axis=0)                                         # The best grid point is always a starting point
+        valid = np.isfinite(candidates[iStart, np.arange(nCurves)])
+        valid[0] = True
+        iCurve = np.broadcast_to(np.arange(nCurves), iStart.shape)[valid]
+        iGrid = iStart[valid]
+        z, refine = np.log(np.column_stack([lambda0[iGrid], lambda1[iGrid]])), nStart > 0
+
+    # Levenberg-Marquardt in lock-step over all starting points, on yields scaled to order 1
+    scale = np.maximum(np.abs(np.nan_to_num(YieldMat)).max(axis=1), 1e-12)[iCurve]
+    y = YieldMat[iCurve] / scale[:, np.newaxis]
+    logBounds = np.log(LAMBDA_BOUNDS)
+    z = np.clip(z, *logBounds)
+    cost = np.sum(NSSProjection(TimeVec, y, np.exp(z[:, 0]), np.exp(z[:, 1]))[1] ** 2, axis=1)
+    converged = np.full(z.shape[0], not refine)
+    mu = np.full(z.shape[0], 1e-3)                                             # Damping relative to the largest curvature
+    nu = np.full(z.shape[0], 2.0)
+    active = np.flatnonzero(~converged)
+    for _ in range(maxIter):
+        if active.size == 0:
+            break
+        _, r, J = NSSProjection(TimeVec, y[active], np.exp(z[active, 0]), np.exp(z[active, 1]), jacobian=True)
+        A = np.swapaxes(J, 1, 2) @ J
+        g = np.einsum("mnk,mn->mk", J, r)
+        damping = mu[active] * np.diagonal(A, axis1=1, axis2=2).max(axis=1) + 1e-30
+        step = -np.linalg.solve(A + damping[:, np.newaxis, np.newaxis] * np.eye(2), g[..., np.newaxis])[..., 0]
+        zNew = np.clip(z[active] + step, *logBounds)
+        step = zNew - z[active]
+        _, rNew = NSSProjection(TimeVec, y[active], np.exp(zNew[:, 0]), np.exp(zNew[:, 1]))
+        costNew = np.sum(rNew ** 2, axis=1)
+
+        # Gain ratio between the actual and the predicted decrease of the cost (Nielsen's update of the damping)
+        predicted = -np.sum(step * (2 * g + np.einsum("mkl,ml->mk", A, step)), axis=1)
+        gain = np.clip((cost[active] - costNew) / np.maximum(predicted, 1e-300), 0, 1)
+        better = costNew < cost[active]
+        done = (np.abs(g).max(axis=1) <= 1e-12) | (np.abs(step).max(axis=1) <= 1e-10) | (better & (cost[active] - costNew <= 1e-12 * cost[active]))
+        z[active[better]] = zNew[better]
+        cost[active[better]] = costNew[better]
+        mu[active] = np.where(better, mu[active] * np.maximum(1 / 3, 1 - (2 * gain - 1) ** 3), mu[active] * nu[active])
+        nu[active] = np.where(better, 2, nu[active] * 2)
+        converged[active[done]] = True
+        active = active[~done & (mu[active] < 1e12)]
+
+    # Best refinement of every curve
+    success = np.zeros(nCurves, dtype=bool)
+    np.logical_or.at(success, iCurve, converged)
+    order = np.lexsort((cost * scale ** 2, iCurve))
+    best = order[np.r_[True, np.diff(iCurve[order]) != 0]]
+    lambdas = np.exp(z[best])
+    params = np.column_stack([NSSProjection(TimeVec, YieldMat[iCurve[best]], lambdas[:, 0], lambdas[:, 1])[0], lambdas])
+    if single:
+        return params[0], success[0]
+    return params, success
@@ -0,0 +1,59 @@
+import numpy as np
+
+LAMBDA_BOUNDS = (0.01, 1000)   # Range of the shape parameters; outside of it the loadings are numerically indistinguishable from 0 or 1
+
+def _NSSFactor(x: np.ndarray):
+    """ Returns (1 - exp(-x)) / x and exp(-x) for x >= 0, with the limit 1 at x = 0. """
+    e = np.exp(-x)
+    xSafe = np.where(x == 0, 1, x)
+    return np.where(x == 0, 1, -np.expm1(-x) / xSafe), e, xSafe
+
+def NSSLoadings(T, lambda0, lambda1) -> np.ndarray:
+    """
+    NSSLoadings calculates the factor loadings of the Nelson-Siegel-Svansson curve, i.e. the matrix L such that
+    NelsonSiegelSvansson(T, beta0, beta1, beta2, beta3, lambda0, lambda1) = L @ [beta0, beta1, beta2, beta3].
+    The maturity T = 0 is allowed and gives the limit of the loadings (1, 1, 0, 0).
+
+    Arguments:
+        T: n x 1 ndarray of maturities for which the user wants to calculate the loadings.
+        lambda0: 1 x 1 floating number (or m x 1 ndarray), representing the first shape parameter lambda of the NSS parametrization.
+        lambda1: 1 x 1 floating number (or m x 1 ndarray), representing the second shape parameter lambda of the NSS parametrization.
+
+    Returns:
+        n x 4 ndarray with the loadings of beta0, beta1, beta2 and beta3 for every maturity in T (m x n x 4 for m pairs of lambdas).
+
+    Example of use:
+        >>> import numpy as np
+        >>> L = NSSLoadings(np.array([0, 1, 5, 30]), 1.5, 8)
+        >>> L @ np.array([0.03, -0.02, 0.01, 0.005])   # Same as NelsonSiegelSvansson with these parameters (for T > 0)
+    """
+    T = np.asarray(T, dtype=float).ravel()
+    alpha1, e0, _ = _NSSFactor(T / np.asarray(lambda0, dtype=float)[..., np.newaxis])
+    f1, e1, _ = _NSSFactor(T / np.asarray(lambda1, dtype=float)[..., np.newaxis])
+    return np.stack(np.broadcast_arrays(1.0, alpha1, alpha1 - e0, f1 - e1), axis=-1)
+
+def NSSLoadingsDerivative(T, lambda0, lambda1) -> np.ndarray:
+    """
+    NSSLoadingsDerivative calculates the derivatives of the Nelson-Siegel-Svansson loadings with respect to the shape parameters.
+    With x = T / lambda the derivative of (1 - exp(-x)) / x with respect to lambda is (1 - exp(-x) (1 + x)) / (x lambda), and the
+    derivative of exp(-x) is x exp(-x) / lambda.
+
+    Arguments:
+        T: n x 1 ndarray of maturities.
+        lambda0: 1 x 1 floating number (or m x 1 ndarray), representing the first shape parameter lambda of the NSS parametrization.
+        lambda1: 1 x 1 floating number (or m x 1 ndarray), representing the second shape parameter lambda of the NSS parametrization.
+
+    Returns:
+        n x 3 ndarray (m x n x 3 for m pairs of lambdas) with the derivatives of the loadings of beta1 and beta2 with respect to
+        lambda0 and of the loading of beta3 with respect to lambda1. The derivative of the curve is then beta1 L[:, 0] + beta2 L[:, 1]
+        with respect to lambda0 and beta3 L[:, 2] with respect to lambda1.
+    """
+    T = np.asarray(T, dtype=float).ravel()
+    columns = []
+    for lam in (lambda0, lambda1):
+        lam = np.asarray(lam, dtype=float)[..., np.newaxis]
+        x = T / lam
+        _, e, xSafe = _NSSFactor(x)
+        dFactor = np.where(x == 0, 0, (-np.expm1(-x) - x * e) / (xSafe * lam))   # d/dlambda of (1 - exp(-x)) / x
+        columns.append((dFactor, dFactor - x * e / lam))                        # ... and of (1 - exp(-x)) / x - exp(-x)
+    return np.stack(np.broadcast_arrays(columns[0][0], columns[0][1], columns[1][1]), axis=-1)
@@ -0,0 +1 @@
+""" Nelson-Siegel-Svensson yield curve model. """
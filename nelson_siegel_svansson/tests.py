@@ -0,0 +1,123 @@
+import warnings
+
+import numpy as np
+import pytest
+if __package__:
+    from .nelsonsiegelsvensson import NelsonSiegelSvansson
+    from .NSSLoadings import NSSLoadings
+    from .NSSFitBatch import NSSJacobian, NSSLeastSquares, NSSFitBatch
+    from .NSSFitVarPro import NSSFitVarPro
+    from .NSSCurve import NSSCurve
+    from .DynamicNSS import DNSEstimate, DNSSimulate
+else:
+    from nelsonsiegelsvensson import NelsonSiegelSvansson
+    from NSSLoadings import NSSLoadings
+    from NSSFitBatch import NSSJacobian, NSSLeastSquares, NSSFitBatch
+    from NSSFitVarPro import NSSFitVarPro
+    from NSSCurve import NSSCurve
+    from DynamicNSS import DNSEstimate, DNSSimulate
+
+TimeVec = np.array([0.25, 0.5, 1, 2, 3, 5, 7, 10, 15, 20, 30])
+params = np.array([0.03, -0.02, 0.01, -0.01, 1.5, 8])
+
+# Loadings reproduce NelsonSiegelSvansson and have the correct limit at T = 0 without warnings
+def test_loadings():
+    assert NSSLoadings(TimeVec, 1.5, 8) @ params[:4] == pytest.approx(NelsonSiegelSvansson(TimeVec, *params), abs=1e-15)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert NSSLoadings(np.array([0.0]), 1.5, 8)[0] == pytest.approx([1, 1, 0, 0])
+
+# Analytic Jacobian matches central finite differences of NelsonSiegelSvansson
+def test_jacobian():
+    J = NSSJacobian(params, TimeVec)
+    h = 1e-6
+    for k in range(6):
+        bump = np.zeros(6)
+        bump[k] = h
+        fd = (NelsonSiegelSvansson(TimeVec, *(params + bump)) - NelsonSiegelSvansson(TimeVec, *(params - bump))) / (2 * h)
+        assert J[:, k] == pytest.approx(fd, abs=1e-8)
+
+# Warm-started batch fit reproduces a history of curves, with and without worker processes
+@pytest.mark.parametrize("workers", [1, 2])
+def test_fit_batch(workers):
+    rng = np.random.default_rng(0)
+    betas = params[:4] + np.cumsum(rng.normal(0, 0.0005, (20, 4)), axis=0)
+    YieldMat = betas @ NSSLoadings(TimeVec, 1.5, 8).T
+    YieldMat[3, 2] = np.nan
+    fitted, success = NSSFitBatch(TimeVec, YieldMat, [0.03, -0.03, 0, 0, 1, 5], workers=workers, chunkSize=8)
+    assert success.all()
+    for i in range(YieldMat.shape[0]):
+        observed = ~np.isnan(YieldMat[i])
+        curve = NelsonSiegelSvansson(TimeVec, *fitted[i])
+        assert curve[observed] == pytest.approx(YieldMat[i, observed], abs=1e-4), "Fitted curve is more than 1bp away from the observed yields."
+
+# Loadings broadcast over arrays of lambdas
+def test_loadings_broadcast():
+    L = NSSLoadings(TimeVec, np.array([1.5, 2.0]), np.array([8.0, 3.0]))
+    assert L.shape == (2, TimeVec.size, 4)
+    assert L[1] == pytest.approx(NSSLoadings(TimeVec, 2.0, 3.0), abs=1e-15)
+
+# Variable projection needs no initial guess and fits at least as well as the warm-started batch fit
+def test_fit_varpro():
+    rng = np.random.default_rng(1)
+    betas = params[:4] + np.cumsum(rng.normal(0, 0.0005, (20, 4)), axis=0)
+    YieldMat = betas @ NSSLoadings(TimeVec, 1.5, 8).T + rng.normal(0, 0.00002, (20, TimeVec.size))
+    fitted, converged = NSSFitVarPro(TimeVec, YieldMat)
+    reference, _ = NSSFitBatch(TimeVec, YieldMat, [0.03, -0.03, 0, 0, 1, 5], workers=1)
+    assert converged.all()
+    for i in range(YieldMat.shape[0]):
+        sse = np.sum((NelsonSiegelSvansson(TimeVec, *fitted[i]) - YieldMat[i]) ** 2)
+        assert sse <= 1.05 * np.sum((NelsonSiegelSvansson(TimeVec, *reference[i]) - YieldMat[i]) ** 2)
+        assert np.sqrt(sse / TimeVec.size) < 1e-4
+    single, _ = NSSFitVarPro(TimeVec, YieldMat[0])
+    assert single == pytest.approx(fitted[0])
+
+# Chunks chain their warm starts, so the fit does not depend on the number of workers, and a warm start caught in a poor local minimum
+# is refitted from the grid
+def test_fit_batch_chunks():
+    rng = np.random.default_rng(1)
+    betas = params[:4] + np.cumsum(rng.normal(0, 0.0005, (20, 4)), axis=0)
+    YieldMat = betas @ NSSLoadings(TimeVec, 1.5, 8).T + rng.normal(0, 0.00002, (20, TimeVec.size))
+    single, success = NSSFitBatch(TimeVec, YieldMat, workers=1, chunkSize=6)
+    pooled, _ = NSSFitBatch(TimeVec, YieldMat, workers=2, chunkSize=6)
+    assert success.all()
+    assert np.array_equal(single, pooled)
+    reference, _ = NSSFitVarPro(TimeVec, YieldMat)
+    trapped, success = NSSFitBatch(TimeVec, YieldMat, [0, 0, 0, 0, 40, 0.17], workers=1)
+    assert success.all()
+    for i in range(YieldMat.shape[0]):
+        sse = np.sum((NelsonSiegelSvansson(TimeVec, *trapped[i]) - YieldMat[i]) ** 2)
+        assert sse <= 5 * np.sum((NelsonSiegelSvansson(TimeVec, *reference[i]) - YieldMat[i]) ** 2)
+
+# Cached curve evaluation matches NelsonSiegelSvansson, handles T = 0 and evicts the least recently used loadings
+def test_curve_cache():
+    curve = NSSCurve(maxSize=2)
+    betas = np.array([params[:4], params[:4] + 0.001])
+    assert curve(TimeVec, betas, 1.5, 8)[1] == pytest.approx(NelsonSiegelSvansson(TimeVec, *(betas[1]), 1.5, 8), abs=1e-15)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert curve(np.array([0.0]), params[:4], 1.5, 8) == pytest.approx([params[0] + params[1]])
+    curve(TimeVec, params[:4], 1.5, 8)
+    curve(TimeVec, params[:4], 2.0, 8)
+    assert len(curve) == 2 and curve.hits == 1 and curve.misses == 3
+    curve(np.array([0.0]), params[:4], 1.5, 8)
+    assert curve.misses == 4
+
+# Dynamic model recovers the VAR of a simulated history and its scenarios have the right shape and conditional mean
+def test_dynamic_nss():
+    rng = np.random.default_rng(2)
+    transition = np.diag([0.99, 0.95, 0.9, 0.8])
+    mean = params[:4]
+    betas = np.empty((2000, 4))
+    betas[0] = mean
+    for t in range(1, betas.shape[0]):
+        betas[t] = mean + transition @ (betas[t - 1] - mean) + rng.normal(0, 0.0005, 4)
+    model = DNSEstimate(TimeVec, betas @ NSSLoadings(TimeVec, 1.5, 8).T, 1.5, 8)
+    assert model.factors == pytest.approx(betas, abs=1e-12)
+    assert np.diag(model.transition) == pytest.approx(np.diag(transition), abs=0.05)
+    yields, factors = DNSSimulate(model, TimeVec, nScen=20000, nSteps=5, seed=3, returnFactors=True)
+    assert yields.shape == (20000, 5, TimeVec.size)
+    expected = betas[-1]
+    for step in range(5):
+        expected = model.intercept + model.transition @ expected
+    assert factors[:, -1].mean(axis=0) == pytest.approx(expected, abs=5e-5)
@@ -0,0 +1,12 @@
+""" Everything is configured in pyproject.toml; this file only keeps the per-model test suites and demo scripts out of the built package.
+ They import their siblings as loose scripts (e.g. from SWCalibrate import SWCalibrate), which only works from the model's folder. """
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+SCRIPTS = {"tests", "tests_calibration", "main", "maximum_likelihood_validation"}
+
+class BuildPyWithoutScripts(build_py):
+    def find_package_modules(self, package, package_dir):
+        return [(pkg, module, path) for pkg, module, path in super().find_package_modules(package, package_dir) if module not in SCRIPTS]
+
+setup(cmdclass={"build_py": BuildPyWithoutScripts})
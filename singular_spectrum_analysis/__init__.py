@@ -0,0 +1 @@
+""" Singular spectrum analysis of time series. """
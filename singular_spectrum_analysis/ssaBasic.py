@@ -1,7 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from numpy.matlib import repmat
 import warnings
 
 class ssaBasic:
@@ -218,12 +215,13 @@ class ssaBasic:
         for ii in range(1, m+1):
             tmp_pos = allPos[G == ii] 
             tmp_d = np.diag(self.S)[np.newaxis,]
-            tmp_u = self.U[:, tmp_pos] * repmat(tmp_d[0,tmp_pos],self.L+1,1)
+            tmp_u = self.U[:, tmp_pos] * np.tile(tmp_d[0,tmp_pos], (self.L+1, 1))
             tmp_y = tmp_u @ self.V[:,tmp_pos].transpose() # ToDo
             y[ii-1, :] = self.hankelization(tmp_y) + self.mX  # Assuming obj has hankelization and mX
 
 
         if display == 'on':
+            import matplotlib.pyplot as plt
             plt.figure(figsize=(8, 2 * m))  # Adjust figure size as needed
             
             for ii in range(0, m):
@@ -333,6 +331,7 @@ class ssaBasic:
                 lower = xCi[1, :]  # 2.5%
                 
                 # Fan plot replacement using matplotlib
+                import matplotlib.pyplot as plt
                 plt.figure(figsize=(10, 5))
                 plt.plot(yHist[:, 0], yHist[:, 1], 'o-', label='Historical', color='black')
 
@@ -413,6 +412,7 @@ class ssaBasic:
         Drel = np.cumsum(D) / np.sum(D)
 
         # make plot
+        import matplotlib.pyplot as plt
         plt.figure()
         display_lower = display.lower()
 
@@ -480,6 +480,8 @@ class ssaBasic:
         # -------------------------------------------------
         # plot w-correlation matrix
         if display == 'on':
+            import matplotlib.pyplot as plt
+            import seaborn as sns
             plt.figure()
             sns.heatmap(np.abs(C))
             plt.title('w-correlation matrix')
@@ -503,6 +505,7 @@ class ssaBasic:
         all_pos = np.arange(0, len_g)
 
         # draw figure
+        import matplotlib.pyplot as plt
         plt.figure()
         for k in range(1, max_group + 1):
             indices = all_pos[G == k]  # Adjust for 0-based indexing
@@ -563,6 +566,7 @@ class ssaBasic:
         best_rmse = totErr[best_idx]
 
         if display == "on":
+            import matplotlib.pyplot as plt
             plt.figure(figsize=(10, 5))
             plt.plot(array_test, np.log(outErr), 'd', label='outError', markersize=7)
             plt.plot(array_test, np.log(inErr), 's', label='inError', markersize=7)
@@ -624,6 +628,7 @@ class ssaBasic:
         best_rmse = totErr[best_idx]
 
         if display == "on":
+            import matplotlib.pyplot as plt
             plt.figure(figsize=(10, 5))
             plt.plot(array_test, np.log(outErr), 'd', label='outError', markersize=7)
             plt.plot(array_test, np.log(inErr), 's', label='inError', markersize=7)
@@ -0,0 +1,195 @@
+""" Batch production of Smith-Wilson curves for many currencies and scenarios.
+
+ Command line usage (see `python SWBatchRun.py --help`):
+     python SWBatchRun.py rates.csv curves.parquet --id currency scenario --max-maturity 150 --workers 8
+
+ The input is a long table (CSV or Parquet) with one row per observed rate and the columns:
+     <id columns>  identification of the curve, for example currency and scenario
+     maturity      maturity of the observed zero-coupon rate in years
+     rate          observed zero-coupon rate (annual compounding)
+     ufr           ultimate forward rate of the curve
+     alpha         convergence speed parameter of the curve
+     llp           (optional) last liquid point of the curve; rates with a longer maturity are not used for the calibration. Curves
+                   with an empty llp use all their rates
+
+ The output is a long table with the id columns, `maturity` and `rate` for every targeted maturity of every curve.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+if __package__:
+    from .SWCalibrateBatch import SWCalibrateBatch as SWCalibrateBatch
+    from .SWExtrapolateBatch import SWExtrapolateBatch as SWExtrapolateBatch
+else:
+    from SWCalibrateBatch import SWCalibrateBatch as SWCalibrateBatch
+    from SWExtrapolateBatch import SWExtrapolateBatch as SWExtrapolateBatch
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+def _SWReadTable(path: str) -> "pd.DataFrame":
+    import pandas as pd
+    if path.lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+class _SWTableWriter:
+    """ Appends DataFrames to a CSV or Parquet file so that the full output never has to be held in memory. """
+    def __init__(self, path: str):
+        self.path = path
+        self.parquet = path.lower().endswith((".parquet", ".pq"))
+        self.writer = None
+
+    def write(self, frame: "pd.DataFrame"):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self.writer is None:
+                self.writer = pq.ParquetWriter(self.path, table.schema)
+            self.writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self.writer is None else "a", header=self.writer is None, index=False)
+            self.writer = True
+
+    def close(self):
+        if self.parquet and self.writer is not None:
+            self.writer.close()
+
+def _SWGroupCurves(data: "pd.DataFrame", idColumns: list, chunkSize: int) -> list:
+    """
+    Split the input table into chunks of curves that share the same observed maturities.
+
+    Returns a list of tuples (keys, M_Obs, r, ufr, alpha) where keys is the list of curve ids in the chunk, M_Obs the common maturities,
+    r the n_curves x n matrix of observed rates and ufr, alpha the n_curves x 1 vectors of curve parameters.
+    """
+    missing = [c for c in list(idColumns) + ["maturity", "rate", "ufr", "alpha"] if c not in data.columns]
+    if missing:
+        raise ValueError(f"Input is missing the columns {missing}")
+
+    data = data.dropna(subset=["rate"])
+    if "llp" in data.columns:
+        data = data[data["llp"].isna() | (data["maturity"] <= data["llp"])]   # Only rates up to the last liquid point enter the calibration
+
+    groups = {}
+    for key, curve in data.sort_values("maturity").groupby(list(idColumns), sort=False):
+        for parameter in ("ufr", "alpha"):
+            if curve[parameter].nunique() != 1:
+                raise ValueError(f"Curve {key} has more than one value of {parameter}")
+        M_Obs = curve["maturity"].to_numpy(dtype=float)
+        if np.unique(M_Obs).size != M_Obs.size:
+            raise ValueError(f"Curve {key} has duplicated maturities")
+        group = groups.setdefault(tuple(M_Obs), ([], [], [], []))
+        group[0].append(key)
+        group[1].append(curve["rate"].to_numpy(dtype=float))
+        group[2].append(curve["ufr"].iat[0])
+        group[3].append(curve["alpha"].iat[0])
+
+    chunks = []
+    for M_Obs, (keys, r, ufr, alpha) in groups.items():
+        for start in range(0, len(keys), chunkSize):
+            part = slice(start, start + chunkSize)
+            chunks.append((keys[part], np.array(M_Obs), np.array(r[part]), np.array(ufr[part]), np.array(alpha[part])))
+    return chunks
+
+def _SWRunChunk(chunk: tuple, M_Target: np.ndarray):
+    """ Calibrate and extrapolate one chunk of curves. Runs in a worker process. """
+    start = time.perf_counter()
+    keys, M_Obs, r, ufr, alpha = chunk
+    b = SWCalibrateBatch(r, M_Obs, ufr, alpha)
+    r_Target = SWExtrapolateBatch(M_Target, M_Obs, b, ufr, alpha)
+    return keys, r_Target, time.perf_counter() - start
+
+def SWBatchRun(inputPath: str, outputPath: str, M_Target: np.ndarray, idColumns: list = ("currency",), workers: int = None, chunkSize: int = 64) -> dict:
+    """
+    Calibrate and extrapolate every curve of an input table with the Smith-Wilson algorithm and stream the results to an output table.
+
+    Curves with the same observed maturities are calibrated together with `SWCalibrateBatch` and `SWExtrapolateBatch`, in chunks of
+    `chunkSize` curves that are distributed over a pool of `workers` processes. The chunks are written to the output file in input
+    order as soon as they are available.
+
+    Arguments:
+        inputPath: String with the path to the input CSV or Parquet file (see the description of this module for the columns).
+        outputPath: String with the path to the output file. Files ending in .parquet are written as Parquet, anything else as CSV.
+        M_Target: k x 1 ndarray representing each targeted bond maturity of interest. Example: M_Target = np.arange(1, 151)
+        idColumns: List of the names of the columns that identify a curve. Example: idColumns = ["currency", "scenario"]
+        workers: Integer representing the number of worker processes. With 1 everything runs in the calling process. Defaults to the number of CPUs.
+        chunkSize: Positive integer representing the maximum number of curves calibrated together in one task.
+
+    Returns:
+        Dictionary with the wall time in seconds of the stages "read", "group", "compute" (summed over the workers), "write" and "total",
+        and the number of "curves".
+
+    Example of use:
+        >>> import numpy as np
+        >>> timings = SWBatchRun("rates.csv", "curves.parquet", np.arange(1, 151), ["currency", "scenario"], workers=8)
+        >>> print(timings["total"])
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+    import pandas as pd
+
+    if chunkSize < 1:
+        raise ValueError("chunkSize must be positive")
+    idColumns = list(idColumns)
+    M_Target = np.asarray(M_Target, dtype=float).ravel()
+    timings = dict.fromkeys(["read", "group", "compute", "write"], 0.0)
+    start = time.perf_counter()
+
+    data = _SWReadTable(inputPath)
+    timings["read"] = time.perf_counter() - start
+
+    tic = time.perf_counter()
+    chunks = _SWGroupCurves(data, idColumns, chunkSize)
+    timings["group"] = time.perf_counter() - tic
+
+    workers = workers or os.cpu_count() or 1
+    writer = _SWTableWriter(outputPath)
+    pool = ProcessPoolExecutor(min(workers, len(chunks))) if workers > 1 and len(chunks) > 1 else None
+    try:
+        if pool is None:
+            results = (_SWRunChunk(chunk, M_Target) for chunk in chunks)
+        else:
+            results = pool.map(_SWRunChunk, chunks, [M_Target] * len(chunks))
+        for keys, r_Target, elapsed in results:
+            timings["compute"] += elapsed
+            tic = time.perf_counter()
+            ids = pd.DataFrame(keys, columns=idColumns).loc[np.repeat(np.arange(len(keys)), M_Target.size)].reset_index(drop=True)
+            ids["maturity"] = np.tile(M_Target, len(keys))
+            ids["rate"] = r_Target.ravel()
+            writer.write(ids)
+            timings["write"] += time.perf_counter() - tic
+    finally:
+        writer.close()
+        if pool is not None:
+            pool.shutdown()
+
+    timings["total"] = time.perf_counter() - start
+    timings["curves"] = sum(len(chunk[0]) for chunk in chunks)
+    return timings
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="input CSV or Parquet file with the observed rates")
+    parser.add_argument("output", help="output CSV or Parquet file with the extrapolated rates")
+    parser.add_argument("--id", nargs="+", default=["currency"], help="columns that identify a curve (default: currency)")
+    parser.add_argument("--max-maturity", type=float, default=150, help="longest targeted maturity in years (default: 150)")
+    parser.add_argument("--step", type=float, default=1, help="spacing of the targeted maturities in years (default: 1)")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="maximum number of curves per task (default: 64)")
+    args = parser.parse_args(argv)
+
+    M_Target = np.arange(1, round(args.max_maturity / args.step) + 1) * args.step
+    timings = SWBatchRun(args.input, args.output, M_Target, args.id, args.workers, args.chunk_size)
+    print(f"Produced {timings['curves']} curves", file=sys.stderr)
+    for stage in ("read", "group", "compute", "write", "total"):
+        print(f"{stage:>8}: {timings[stage]:.3f} s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
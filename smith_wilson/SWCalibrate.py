@@ -1,4 +1,8 @@
 import numpy as np
+if __package__:
+    from .SWHeart import SWHeart as SWHeart
+else:
+    from SWHeart import SWHeart as SWHeart
 
 def SWCalibrate(r, M, ufr: float, alpha: float):
     """
@@ -19,8 +23,6 @@ def SWCalibrate(r, M, ufr: float, alpha: float):
     https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
     """
 
-    from SWHeart import SWHeart as SWHeart
-
     C = np.identity(M.size)
     p = (1+r) **(-M)  # Transform rates to implied market prices of a ZCB bond
     d = np.exp(-np.log(1+ufr) * M)    # Calculate vector d described in paragraph 138
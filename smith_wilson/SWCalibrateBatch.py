@@ -0,0 +1,52 @@
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+if __package__:
+    from .SWHeart import SWHeart as SWHeart
+else:
+    from SWHeart import SWHeart as SWHeart
+
+def SWCalibrateBatch(r: np.ndarray, M: np.ndarray, ufr, alpha) -> np.ndarray:
+    """
+    Calculate the calibration vectors for a stack of curves using the Smith-Wilson algorithm.
+
+    Vectorized version of `SWCalibrate` for many curves observed on the same set of maturities. Since Q = diag(d) (zero-coupon bonds),
+    the system from paragraph 149 can be rewritten as Q'HQ b = p - q  <=>  H (d * b) = p / d - 1. The heart H only depends on the
+    maturities and alpha, so it is built and factorized (Cholesky) once per distinct alpha and then solved for all curves at once.
+
+    Arguments:
+        r: n_curves x n ndarray of rates for which you wish to calibrate the algorithm. Each row is one curve and each column belongs to an observable zero-coupon bond with a known maturity. Example: r = np.array([[0.0024, 0.0034], [0.0030, 0.0041]])
+        M: n x 1 ndarray of maturities of bonds that have rates provided in the input `r`. The maturities are common to all curves. Example: M = np.array([1, 3])
+        ufr: Floating number or n_curves x 1 ndarray representing the ultimate forward rate of each curve. Example: ufr = 0.042
+        alpha: Floating number or n_curves x 1 ndarray representing the convergence speed parameter alpha of each curve. Example: alpha = 0.05
+
+    Returns:
+        n_curves x n ndarray where each row is the calibration vector of the corresponding curve (same as `SWCalibrate` applied to each row of `r`).
+
+    Example of use:
+        >>> import numpy as np
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> r_Obs = np.array([[0.01, 0.02, 0.03, 0.032, 0.035, 0.04], [0.011, 0.021, 0.031, 0.033, 0.036, 0.041]])
+        >>> b = SWCalibrateBatch(r_Obs, M_Obs, 0.04, 0.15)
+        >>> b.shape
+        (2, 6)
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+
+    r = np.atleast_2d(r)
+    M = np.asarray(M, dtype=float).ravel()
+    nCurves = r.shape[0]
+    ufr = np.broadcast_to(np.asarray(ufr, dtype=float), (nCurves,))
+    alpha = np.broadcast_to(np.asarray(alpha, dtype=float), (nCurves,))
+
+    p = (1 + r) ** (-M)                                  # Transform rates to implied market prices of a ZCB bond
+    d = np.exp(-np.log(1 + ufr)[:, np.newaxis] * M)      # Vector d described in paragraph 138 for each curve
+    y = p / d - 1                                        # Right-hand side of H (Q b) = Q^-1 (p - q) with Q = diag(d) and q = d
+
+    b = np.empty_like(y)
+    for a in np.unique(alpha):                           # The heart and its factorization are shared by all curves with the same alpha
+        iCurves = alpha == a
+        H = cho_factor(SWHeart(M, M, a))                 # Cholesky factor of the heart of the Wilson function from paragraph 132
+        b[iCurves] = cho_solve(H, y[iCurves].T).T / d[iCurves]
+    return b
@@ -0,0 +1,118 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import cho_factor, cho_solve
+if __package__:
+    from .SWStructured import SWHeartApply as SWHeartApply
+else:
+    from SWStructured import SWHeartApply as SWHeartApply
+
+def SWCashFlowMatrix(instrument: np.ndarray, times: np.ndarray, amounts: np.ndarray, nInstruments: int = None):
+    """
+    Build the sparse cash flow matrix C described in paragraph 137 from a list of cash flows.
+
+    Arguments:
+        instrument: N_cf x 1 ndarray of integers with the index (0, ..., m-1) of the instrument each cash flow belongs to. Example: instrument = np.array([0, 1, 1])
+        times: N_cf x 1 ndarray with the time (in years) of each cash flow. Example: times = np.array([1, 1, 2])
+        amounts: N_cf x 1 ndarray with the amount of each cash flow. Example: amounts = np.array([1, 0.02, 1.02])
+        nInstruments: Optional integer representing the number of instruments m. Defaults to max(instrument) + 1.
+
+    Returns:
+        Tuple (C, M_CF) where C is an N x m scipy.sparse CSC matrix and M_CF is the N x 1 ndarray of distinct, sorted cash flow dates.
+        Cash flows of the same instrument on the same date are added together.
+
+    Example of use:
+        >>> C, M_CF = SWCashFlowMatrix(np.array([0, 1, 1]), np.array([1, 1, 2]), np.array([1, 0.02, 1.02]))
+        >>> C.toarray()
+        array([[1.  , 0.02],
+               [0.  , 1.02]])
+    """
+    instrument = np.asarray(instrument).ravel()
+    M_CF, row = np.unique(np.asarray(times, dtype=float).ravel(), return_inverse=True)
+    if nInstruments is None:
+        nInstruments = int(instrument.max()) + 1
+    C = sp.csc_matrix((np.asarray(amounts, dtype=float).ravel(), (row, instrument)), shape=(M_CF.size, nInstruments))
+    C.sum_duplicates()
+    return C, M_CF
+
+def SWSwapCashFlows(rates: np.ndarray, tenors: np.ndarray, frequency: int = 1):
+    """
+    Generate the cash flows of par swaps (or par coupon bonds) with notional 1, to be used with `SWCashFlowMatrix`.
+
+    A par swap with rate r and tenor T paying `frequency` times a year is replicated by a bond that pays r / frequency at each payment
+    date and 1 + r / frequency at T. Its price is 1.
+
+    Arguments:
+        rates: m x 1 ndarray of par swap rates. Example: rates = np.array([0.02, 0.025])
+        tenors: m x 1 ndarray of swap tenors in years. Example: tenors = np.array([2, 5])
+        frequency: Positive integer representing the number of fixed leg payments per year. Example: frequency = 1
+
+    Returns:
+        Tuple (instrument, times, amounts) of ndarrays with one element per cash flow.
+
+    Example of use:
+        >>> instrument, times, amounts = SWSwapCashFlows(np.array([0.02, 0.025]), np.array([2, 5]))
+        >>> C, M_CF = SWCashFlowMatrix(instrument, times, amounts)
+    """
+    rates = np.asarray(rates, dtype=float).ravel()
+    tenors = np.asarray(tenors, dtype=float).ravel()
+    nPayments = np.rint(tenors * frequency).astype(int)
+
+    instrument = np.repeat(np.arange(rates.size), nPayments)
+    iPayment = np.arange(nPayments.sum()) - np.repeat(np.cumsum(nPayments) - nPayments, nPayments) + 1
+    times = iPayment / frequency
+    amounts = np.repeat(rates / frequency, nPayments)
+    amounts[np.cumsum(nPayments) - 1] += 1        # Notional repaid at maturity
+    return instrument, times, amounts
+
+def SWCalibrateInstruments(p: np.ndarray, C, M_CF: np.ndarray, ufr: float, alpha: float, blockSize: int = 256) -> np.ndarray:
+    """
+    Calculate the calibration vector using the Smith-Wilson algorithm for a general set of instruments such as coupon bonds and swaps.
+
+    Solves the system from paragraph 149 (Q'HQ) b = p - q with Q = diag(d) C and q = C'd for a sparse cash flow matrix C. The dense C and
+    the dense heart H are never built: H Q is computed with the semiseparable product `SWHeartApply` for blocks of `blockSize`
+    instruments and multiplied with the sparse Q'. Only the m x m matrix Q'HQ is dense.
+
+    To extrapolate the calibrated curve use `SWExtrapolate(M_Target, M_CF, C @ b, ufr, alpha)`, since Q b = diag(d) C b.
+
+    Arguments:
+        p: m x 1 ndarray of market prices of the instruments. Example: p = np.ones(2) for par swaps
+        C: N x m cash flow matrix (scipy.sparse matrix or ndarray) from paragraph 137, see `SWCashFlowMatrix`.
+        M_CF: N x 1 ndarray of cash flow dates corresponding to the rows of C. Example: M_CF = np.array([1, 2])
+        ufr: Floating number representing the ultimate forward rate. Example: ufr = 0.042
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+        blockSize: Positive integer representing the number of instruments for which H Q is held in memory at once.
+
+    Returns:
+        m x 1 ndarray representing the calibration vector b.
+
+    Example of use:
+        >>> import numpy as np
+        >>> tenors = np.array([1, 2, 3, 5, 7, 10, 15, 20])
+        >>> rates = np.array([0.010, 0.015, 0.018, 0.022, 0.025, 0.028, 0.030, 0.031])
+        >>> C, M_CF = SWCashFlowMatrix(*SWSwapCashFlows(rates, tenors, frequency=2))
+        >>> b = SWCalibrateInstruments(np.ones(tenors.size), C, M_CF, 0.042, 0.12)
+        >>> from SWExtrapolate import SWExtrapolate
+        >>> r_Target = SWExtrapolate(np.arange(1, 61), M_CF, C @ b, 0.042, 0.12)
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+    if blockSize < 1:
+        raise ValueError("blockSize must be positive")
+    C = sp.csc_matrix(C)
+    M_CF = np.asarray(M_CF, dtype=float).ravel()
+    if C.shape[0] != M_CF.size:
+        raise ValueError("Number of rows of C must match the number of cash flow dates")
+
+    d = np.exp(-np.log(1 + ufr) * M_CF)          # Calculate vector d described in paragraph 138
+    Q = sp.diags(d) @ C                          # Matrix Q described in paragraph 139 (sparse)
+    q = C.T @ d                                  # Vector q described in paragraph 139
+    QT = Q.T.tocsr()
+
+    m = C.shape[1]
+    QHQ = np.empty((m, m))
+    for start in range(0, m, blockSize):         # H Q for a block of instruments only
+        HQ = SWHeartApply(M_CF, M_CF, Q[:, start:start + blockSize].toarray(), alpha)
+        QHQ[:, start:start + blockSize] = QT @ HQ
+
+    return cho_solve(cho_factor(QHQ), np.asarray(p, dtype=float) - q)   # Calibration vector b from paragraph 149
@@ -0,0 +1,164 @@
+import numpy as np
+from collections import OrderedDict
+from scipy.linalg import cho_factor, cho_solve
+if __package__:
+    from .SWHeart import SWHeart as SWHeart
+else:
+    from SWHeart import SWHeart as SWHeart
+
+class SWCurve:
+    """
+    Smith-Wilson curve for a fixed set of observed maturities, ultimate forward rate and convergence speed alpha.
+
+    Everything in the Smith-Wilson algorithm that does not depend on the observed rates is computed once when the object is
+    constructed: the vector d (paragraph 138), the matrix Q'HQ (paragraphs 132 and 139) and its Cholesky factorization.
+    Calibrating to a new set of market rates then costs a pair of triangular solves and extrapolating costs a matrix-vector product.
+    The kernels between targeted and observed maturities are kept for the most recently used target grids.
+
+    Arguments:
+        M_Obs: n x 1 ndarray of maturities of the observed zero-coupon bonds. Example: M_Obs = np.array([1, 3])
+        ufr: Floating number representing the ultimate forward rate. Example: ufr = 0.042
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+        maxTargets: Positive integer representing the number of target grids whose kernels are kept. The least recently used grid is evicted first.
+
+    Example of use:
+        >>> import numpy as np
+        >>> curve = SWCurve(np.array([1, 2, 4, 5, 6, 7]), 0.04, 0.15)
+        >>> b = curve.calibrate(np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04]))
+        >>> r_Target = curve.extrapolate(np.arange(1, 66), b)
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+
+    def __init__(self, M_Obs: np.ndarray, ufr: float, alpha: float, maxTargets: int = 8):
+        if maxTargets < 1:
+            raise ValueError("maxTargets must be positive")
+
+        self.M_Obs = np.asarray(M_Obs, dtype=float).ravel()
+        self.ufr = float(ufr)
+        self.alpha = float(alpha)
+        self.maxTargets = maxTargets
+
+        self.d = np.exp(-np.log(1 + self.ufr) * self.M_Obs)                  # Vector d described in paragraph 138
+        QHQ = self.d[:, np.newaxis] * SWHeart(self.M_Obs, self.M_Obs, self.alpha) * self.d   # Q'HQ with Q = diag(d) from paragraph 139
+        self.factor = cho_factor(QHQ)                                        # Cholesky factorization reused by every calibration
+        self._targets = OrderedDict()
+
+    def calibrate(self, r: np.ndarray) -> np.ndarray:
+        """
+        Calculate the calibration vector for the observed rates `r` (see `SWCalibrate`).
+
+        Arguments:
+            r: n x 1 ndarray of rates observed at the maturities `M_Obs`, or an n_curves x n ndarray with one curve per row.
+
+        Returns:
+            ndarray of the same shape as `r` with the calibration vector(s) b from paragraph 149.
+        """
+        p = (1 + r) ** (-self.M_Obs)                # Transform rates to implied market prices of a ZCB bond
+        return cho_solve(self.factor, (p - self.d).T).T   # Calibration vector b from paragraph 149 with q = d
+
+    def kernel(self, M_Target: np.ndarray):
+        """
+        Return the discount factors at the ufr and the matrix H Q for the targeted maturities, computing them only if the grid is not cached.
+
+        Arguments:
+            M_Target: k x 1 ndarray of targeted maturities.
+
+        Returns:
+            Tuple (dTarget, HQ) with a k x 1 ndarray of ufr discount factors and a k x n ndarray equal to H(M_Target, M_Obs) diag(d).
+        """
+        M_Target = np.asarray(M_Target, dtype=float).ravel()
+        key = M_Target.tobytes()
+        if key in self._targets:
+            self._targets.move_to_end(key)
+            return self._targets[key]
+
+        dTarget = np.exp(-np.log(1 + self.ufr) * M_Target)
+        HQ = SWHeart(M_Target, self.M_Obs, self.alpha) * self.d              # Heart of the Wilson function from paragraph 132 times Q
+        self._targets[key] = (dTarget, HQ)
+        if len(self._targets) > self.maxTargets:
+            self._targets.popitem(last=False)                                # Evict the least recently used target grid
+        return dTarget, HQ
+
+    def prices(self, M_Target: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Calculate the prices of zero-coupon bonds at the targeted maturities for the calibration vector(s) `b` (paragraph 147).
+        """
+        dTarget, HQ = self.kernel(M_Target)
+        return dTarget * (1 + b @ HQ.T)
+
+    def extrapolate(self, M_Target: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Interpolate or extrapolate rates for the targeted maturities for the calibration vector(s) `b` (see `SWExtrapolate`).
+
+        Arguments:
+            M_Target: k x 1 ndarray of targeted maturities.
+            b: n x 1 ndarray calibration vector or n_curves x n ndarray of calibration vectors returned by `calibrate`.
+
+        Returns:
+            k x 1 ndarray (or n_curves x k ndarray) of rates for zero-coupon bonds with maturities from `M_Target`.
+        """
+        M_Target = np.asarray(M_Target, dtype=float).ravel()
+        return self.prices(M_Target, b) ** (-1 / M_Target) - 1
+
+class SWCurveCache:
+    """
+    Bounded least-recently-used cache of `SWCurve` objects keyed on (observed maturities, ufr, alpha).
+
+    Arguments:
+        maxSize: Positive integer representing the maximum number of curves kept. The least recently used curve is evicted first.
+        maxTargets: Number of target grids kept by each curve (see `SWCurve`).
+
+    Example of use:
+        >>> cache = SWCurveCache(maxSize=16)
+        >>> curve = cache.get(np.array([1, 2, 4, 5, 6, 7]), 0.04, 0.15)
+        >>> curve is cache.get(np.array([1, 2, 4, 5, 6, 7]), 0.04, 0.15)
+        True
+    """
+
+    def __init__(self, maxSize: int = 32, maxTargets: int = 8):
+        if maxSize < 1:
+            raise ValueError("maxSize must be positive")
+        self.maxSize = maxSize
+        self.maxTargets = maxTargets
+        self._curves = OrderedDict()
+
+    def get(self, M_Obs: np.ndarray, ufr: float, alpha: float) -> SWCurve:
+        M_Obs = np.asarray(M_Obs, dtype=float).ravel()
+        key = (M_Obs.tobytes(), float(ufr), float(alpha))
+        if key in self._curves:
+            self._curves.move_to_end(key)
+            return self._curves[key]
+
+        curve = SWCurve(M_Obs, ufr, alpha, self.maxTargets)
+        self._curves[key] = curve
+        if len(self._curves) > self.maxSize:
+            self._curves.popitem(last=False)
+        return curve
+
+    def clear(self):
+        self._curves.clear()
+
+    def __len__(self):
+        return len(self._curves)
+
+_defaultCache = SWCurveCache()
+
+def SWGetCurve(M_Obs: np.ndarray, ufr: float, alpha: float) -> SWCurve:
+    """
+    Return the `SWCurve` for the observed maturities, ufr and alpha from the module-wide cache, constructing it on first use.
+
+    Arguments:
+        M_Obs: n x 1 ndarray of maturities of the observed zero-coupon bonds. Example: M_Obs = np.array([1, 3])
+        ufr: Floating number representing the ultimate forward rate. Example: ufr = 0.042
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+
+    Returns:
+        `SWCurve` object with a factorized calibration system.
+
+    Example of use:
+        >>> curve = SWGetCurve(np.array([1, 2, 4, 5, 6, 7]), 0.04, 0.15)
+        >>> r_Target = curve.extrapolate(np.arange(1, 66), curve.calibrate(np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04])))
+    """
+    return _defaultCache.get(M_Obs, ufr, alpha)
@@ -0,0 +1,78 @@
+import numpy as np
+if __package__:
+    from .SWHeart import SWHeart as SWHeart
+else:
+    from SWHeart import SWHeart as SWHeart
+
+def SWEvaluate(M_Target: np.ndarray, M_Obs: np.ndarray, b: np.ndarray, ufr: float, alpha: float, chunkSize: int = 4096) -> dict:
+    """
+    Evaluate a calibrated Smith-Wilson curve at the targeted maturities and return all commonly used curve outputs in one pass.
+
+    The discount pricing function from paragraph 147 is P(t) = exp(-w t) (1 + H(t, M_Obs) Q b) with w = log(1 + ufr), where H is the heart
+    of the Wilson function from `SWHeart`. Its derivative is available analytically from the derivative of the heart
+        dH/dt(t, u) = alpha - alpha exp(-alpha u) cosh(alpha t)   for t <= u
+        dH/dt(t, u) = alpha exp(-alpha t) sinh(alpha u)           for t > u
+    so the instantaneous forward rate f(t) = w - (dH/dt Q b) / (1 + H Q b) is obtained together with the prices.
+    The targeted maturities are processed in chunks of `chunkSize` elements to keep memory bounded (see `SWExtrapolateChunked`).
+
+    Arguments:
+        M_Target: k x 1 ndarray of increasing targeted maturities. Example: M_Target = np.array([1, 2, 3, 5])
+        M_Obs: n x 1 ndarray representing the observed bond maturities used for calibrating the calibration vector `b`. Example: M_Obs = np.array([1, 3])
+        b: n x 1 ndarray representing the calibration vector (or n_curves x n ndarray with one calibration vector per row).
+        ufr: Floating number representing the ultimate forward rate. Example: ufr = 0.042
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+        chunkSize: Positive integer representing the number of targeted maturities processed at once. Example: chunkSize = 4096
+
+    Returns:
+        Dictionary of k x 1 ndarrays (or n_curves x k ndarrays) with the keys:
+            "discount": prices of zero-coupon bonds P(t).
+            "zero": annually compounded zero rates P(t) ** (-1 / t) - 1 (same as `SWExtrapolate`).
+            "zero_continuous": continuously compounded zero rates -log(P(t)) / t.
+            "forward": instantaneous forward rates -d log(P(t)) / dt.
+            "annuity": cumulative annuity factors sum_{i <= j} (t_i - t_{i-1}) P(t_i) with t_0 = 0.
+
+    Example of use:
+        >>> import numpy as np
+        >>> from SWCalibrate import SWCalibrate
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> b = SWCalibrate(np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04]), M_Obs, 0.04, 0.15)
+        >>> curve = SWEvaluate(np.arange(1, 66), M_Obs, b, 0.04, 0.15)
+        >>> curve["forward"][-1]  # Converges towards log(1 + ufr)
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+
+    if chunkSize < 1:
+        raise ValueError("chunkSize must be positive")
+    M_Target = np.asarray(M_Target, dtype=float).ravel()
+    M_Obs = np.asarray(M_Obs, dtype=float).ravel()
+    b = np.asarray(b, dtype=float)
+    if np.any(np.diff(M_Target) <= 0):
+        raise ValueError("Targeted maturities must be increasing")
+
+    w = np.log(1 + ufr)
+    Qb = np.exp(-w * M_Obs) * b                          # Q b with Q = diag(d) from paragraph 139
+    eU = np.exp(-alpha * M_Obs)
+    sU = np.sinh(alpha * M_Obs)
+
+    shape = b.shape[:-1] + (M_Target.size,)
+    P = np.empty(shape)
+    f = np.empty(shape)
+    for start in range(0, M_Target.size, chunkSize):
+        t = M_Target[start:start + chunkSize, np.newaxis]
+        H = SWHeart(t[:, 0], M_Obs, alpha)                                           # Heart of the Wilson function from paragraph 132
+        below = t <= M_Obs                               # Targeted maturity below the observed maturity
+        dH = np.where(below, alpha - alpha * eU * np.cosh(alpha * t), alpha * np.exp(-alpha * t) * sU)
+        g = 1 + Qb @ H.T
+        P[..., start:start + chunkSize] = np.exp(-w * t[:, 0]) * g                  # Discount pricing function from paragraph 147
+        f[..., start:start + chunkSize] = w - (Qb @ dH.T) / g                       # Instantaneous forward rate
+
+    logP = np.log(P)
+    return {
+        "discount": P,
+        "zero": np.exp(-logP / M_Target) - 1,
+        "zero_continuous": -logP / M_Target,
+        "forward": f,
+        "annuity": np.cumsum(np.diff(M_Target, prepend=0) * P, axis=-1),
+    }
@@ -1,4 +1,8 @@
-import numpy as np 
+import numpy as np
+if __package__:
+    from .SWHeart import SWHeart as SWHeart
+else:
+    from SWHeart import SWHeart as SWHeart
 
 def SWExtrapolate(M_Target, M_Obs, b, ufr: float, alpha: float):
    """
@@ -22,7 +26,6 @@ def SWExtrapolate(M_Target, M_Obs, b, ufr: float, alpha: float):
     https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
     """
 
-   from SWHeart import SWHeart as SWHeart
    C = np.identity(M_Obs.size)
    d = np.exp(-np.log(1+ufr) * M_Obs)   # Calculate vector d described in paragraph 138
    Q = np.diag(d) @ C                   # Matrix Q described in paragraph 139
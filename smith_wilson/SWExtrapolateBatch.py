@@ -0,0 +1,54 @@
+import numpy as np
+if __package__:
+    from .SWHeart import SWHeart as SWHeart
+else:
+    from SWHeart import SWHeart as SWHeart
+
+def SWExtrapolateBatch(M_Target: np.ndarray, M_Obs: np.ndarray, b: np.ndarray, ufr, alpha) -> np.ndarray:
+    """
+    Interpolate or extrapolate rates for targeted maturities for a stack of curves using the Smith-Wilson algorithm.
+
+    Vectorized version of `SWExtrapolate` for many calibration vectors obtained on the same observed maturities (see `SWCalibrateBatch`).
+    The heart between the targeted and the observed maturities is built once per distinct alpha and applied to all curves in a single
+    matrix product. The diagonal matrices from paragraph 147 are applied as element-wise scaling.
+
+    Arguments:
+        M_Target: k x 1 ndarray representing each targeted bond maturity of interest. Example: M_Target = np.array([1, 2, 3, 5])
+        M_Obs: n x 1 ndarray representing the observed bond maturities used for calibrating the calibration vectors `b`. Example: M_Obs = np.array([1, 3])
+        b: n_curves x n ndarray where each row is the calibration vector of one curve.
+        ufr: Floating number or n_curves x 1 ndarray representing the ultimate forward rate of each curve. Example: ufr = 0.042
+        alpha: Floating number or n_curves x 1 ndarray representing the convergence speed parameter alpha of each curve. Example: alpha = 0.05
+
+    Returns:
+        n_curves x k ndarray where each row contains the targeted rates for zero-coupon bonds with maturities from `M_Target` for the corresponding curve.
+
+    Example of use:
+        >>> import numpy as np
+        >>> from SWCalibrateBatch import SWCalibrateBatch
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> r_Obs = np.array([[0.01, 0.02, 0.03, 0.032, 0.035, 0.04], [0.011, 0.021, 0.031, 0.033, 0.036, 0.041]])
+        >>> b = SWCalibrateBatch(r_Obs, M_Obs, 0.04, 0.15)
+        >>> SWExtrapolateBatch(np.arange(1, 21), M_Obs, b, 0.04, 0.15).shape
+        (2, 20)
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+
+    b = np.atleast_2d(b)
+    M_Target = np.asarray(M_Target, dtype=float).ravel()
+    M_Obs = np.asarray(M_Obs, dtype=float).ravel()
+    nCurves = b.shape[0]
+    ufr = np.broadcast_to(np.asarray(ufr, dtype=float), (nCurves,))
+    alpha = np.broadcast_to(np.asarray(alpha, dtype=float), (nCurves,))
+
+    logUfr = np.log(1 + ufr)[:, np.newaxis]
+    Qb = np.exp(-logUfr * M_Obs) * b                     # Q b with Q = diag(d) from paragraph 139
+    dTarget = np.exp(-logUfr * M_Target)                 # Discount factors at the ufr for the targeted maturities
+
+    HQb = np.empty((nCurves, M_Target.size))
+    for a in np.unique(alpha):                           # The heart is shared by all curves with the same alpha
+        iCurves = alpha == a
+        HQb[iCurves] = Qb[iCurves] @ SWHeart(M_Target, M_Obs, a).T
+    p = dTarget * (1 + HQb)                              # Discount pricing function for targeted maturities from paragraph 147
+    return p ** (-1 / M_Target) - 1                      # Convert obtained prices to rates
@@ -0,0 +1,58 @@
+import numpy as np
+if __package__:
+    from .SWHeart import SWHeart as SWHeart
+else:
+    from SWHeart import SWHeart as SWHeart
+
+def SWExtrapolateChunked(M_Target: np.ndarray, M_Obs: np.ndarray, b: np.ndarray, ufr: float, alpha: float, chunkSize: int = 4096, out: np.ndarray = None) -> np.ndarray:
+    """
+    Interpolate or extrapolate rates for a long grid of targeted maturities using the Smith-Wilson algorithm with bounded memory.
+
+    Gives the same result as `SWExtrapolate`, but the targeted maturities are processed in chunks of `chunkSize` elements. For each chunk
+    only a chunkSize x n heart is built and the diagonal matrix of ufr discount factors from paragraph 147 is applied as an element-wise
+    scale. Peak memory is therefore proportional to chunkSize x n and does not depend on the length of the targeted grid.
+
+    Arguments:
+        M_Target: k x 1 ndarray representing each targeted bond maturity of interest. Example: M_Target = np.arange(1, 54751) / 365
+        M_Obs: n x 1 ndarray representing the observed bond maturities used for calibrating the calibration vector `b`. Example: M_Obs = np.array([1, 3])
+        b: n x 1 ndarray representing the calibration vector (or n_curves x n ndarray with one calibration vector per row).
+        ufr: Floating number representing the ultimate forward rate. Example: ufr = 0.042
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+        chunkSize: Positive integer representing the number of targeted maturities processed at once. Example: chunkSize = 4096
+        out: Optional k x 1 (or n_curves x k) float ndarray into which the rates are written. If not provided, a new array is allocated.
+
+    Returns:
+        k x 1 ndarray (or n_curves x k ndarray) representing the targeted rates for zero-coupon bonds. This is `out` if it was provided.
+
+    Example of use:
+        >>> import numpy as np
+        >>> from SWCalibrate import SWCalibrate
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> b = SWCalibrate(np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04]), M_Obs, 0.04, 0.15)
+        >>> M_Target = np.arange(1, 150 * 365 + 1) / 365  # Daily grid up to 150 years
+        >>> r_Target = SWExtrapolateChunked(M_Target, M_Obs, b, 0.04, 0.15, chunkSize=10000)
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+
+    if chunkSize < 1:
+        raise ValueError("chunkSize must be positive")
+    M_Target = np.asarray(M_Target, dtype=float).ravel()
+    M_Obs = np.asarray(M_Obs, dtype=float).ravel()
+    b = np.asarray(b, dtype=float)
+
+    shape = b.shape[:-1] + (M_Target.size,)
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f"out must have shape {shape}, but has shape {out.shape}")
+
+    logUfr = np.log(1 + ufr)
+    Qb = np.exp(-logUfr * M_Obs) * b                 # Q b with Q = diag(d) from paragraph 139
+    for start in range(0, M_Target.size, chunkSize):
+        M_Chunk = M_Target[start:start + chunkSize]
+        HQb = Qb @ SWHeart(M_Chunk, M_Obs, alpha).T  # Heart of the Wilson function from paragraph 132 for this chunk only
+        p = np.exp(-logUfr * M_Chunk) * (1 + HQb)    # Discount pricing function from paragraph 147 with diag(.) applied element-wise
+        out[..., start:start + chunkSize] = p ** (-1 / M_Chunk) - 1
+    return out
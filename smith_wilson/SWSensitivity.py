@@ -0,0 +1,68 @@
+import numpy as np
+from scipy.linalg import cho_solve
+if __package__:
+    from .SWCurve import SWGetCurve as SWGetCurve
+else:
+    from SWCurve import SWGetCurve as SWGetCurve
+
+def SWSensitivity(M_Target: np.ndarray, M_Obs: np.ndarray, r_Obs: np.ndarray, ufr: float, alpha: float) -> dict:
+    """
+    Calculate the Smith-Wilson curve at the targeted maturities together with its analytic sensitivities to the observed rates and the ufr.
+
+    With zero-coupon inputs the calibration from paragraph 149 gives Q b = H^-1 (p / d - 1) and the prices from paragraph 147 are
+    P(t) = d(t) (1 + H(t, M_Obs) Q b). Differentiating gives
+        dP(t) / dr_j   = d(t) [H(t, M_Obs) Q (Q'HQ)^-1]_j dp_j / dr_j      with dp_j / dr_j = -M_j (1 + r_j) ** (-M_j - 1)
+        dP(t) / dufr   = (-t P(t) + d(t) H(t, M_Obs) Q (Q'HQ)^-1 (M_Obs * p)) / (1 + ufr)
+    The factorization of Q'HQ and the kernel of the targeted maturities are taken from the cached `SWCurve` (see `SWGetCurve`), so the
+    full Jacobian costs one solve with k right-hand sides instead of n + 1 calibrations with bumped inputs.
+
+    Arguments:
+        M_Target: k x 1 ndarray representing each targeted bond maturity of interest. Example: M_Target = np.array([1, 2, 3, 5])
+        M_Obs: n x 1 ndarray of maturities of bonds that have rates provided in the input `r_Obs`. Example: M_Obs = np.array([1, 3])
+        r_Obs: n x 1 ndarray of observed zero-coupon rates. Example: r_Obs = np.array([0.0024, 0.0034])
+        ufr: Floating number representing the ultimate forward rate. Example: ufr = 0.042
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+
+    Returns:
+        Dictionary with the keys:
+            "discount": k x 1 ndarray of prices of zero-coupon bonds at the targeted maturities.
+            "zero": k x 1 ndarray of annually compounded zero rates at the targeted maturities (same as `SWExtrapolate`).
+            "dDiscount_dr": k x n ndarray with the derivatives of the prices with respect to each observed rate.
+            "dZero_dr": k x n ndarray with the derivatives of the zero rates with respect to each observed rate.
+            "dDiscount_dufr": k x 1 ndarray with the derivatives of the prices with respect to the ufr.
+            "dZero_dufr": k x 1 ndarray with the derivatives of the zero rates with respect to the ufr.
+
+    Example of use:
+        >>> import numpy as np
+        >>> M_Obs = np.array([1, 2, 4, 5, 6, 7])
+        >>> r_Obs = np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04])
+        >>> sens = SWSensitivity(np.arange(1, 66), M_Obs, r_Obs, 0.04, 0.15)
+        >>> keyRateDV01 = sens["dZero_dr"] * 0.0001  # Change of every target rate for a 1bp move of each observed rate
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+
+    M_Target = np.asarray(M_Target, dtype=float).ravel()
+    M_Obs = np.asarray(M_Obs, dtype=float).ravel()
+    r_Obs = np.asarray(r_Obs, dtype=float).ravel()
+
+    curve = SWGetCurve(M_Obs, ufr, alpha)
+    dTarget, HQ = curve.kernel(M_Target)                  # Ufr discount factors and H(M_Target, M_Obs) Q
+    p = (1 + r_Obs) ** (-M_Obs)                           # Implied market prices of the observed ZCB bonds
+    P = dTarget * (1 + HQ @ curve.calibrate(r_Obs))       # Discount pricing function from paragraph 147
+
+    G = cho_solve(curve.factor, HQ.T).T                   # H(M_Target, M_Obs) Q (Q'HQ)^-1 for all targets at once
+    dpdr = -M_Obs * p / (1 + r_Obs)
+    dPdr = dTarget[:, np.newaxis] * G * dpdr
+    dPdufr = (-M_Target * P + dTarget * (G @ (M_Obs * p))) / (1 + ufr)
+
+    dZerodP = -P ** (-1 / M_Target - 1) / M_Target        # Derivative of P ** (-1 / t) - 1
+    return {
+        "discount": P,
+        "zero": P ** (-1 / M_Target) - 1,
+        "dDiscount_dr": dPdr,
+        "dZero_dr": dZerodP[:, np.newaxis] * dPdr,
+        "dDiscount_dufr": dPdufr,
+        "dZero_dufr": dZerodP * dPdufr,
+    }
@@ -0,0 +1,184 @@
+import numpy as np
+
+# The heart of the Wilson function from paragraph 132 can be written as
+#     H(u, v) = alpha * min(u, v) - exp(-alpha * max(u, v)) * sinh(alpha * min(u, v)),
+# which is a symmetric semiseparable kernel of rank 2: for u >= v it equals psi(u)' phi(v) with
+#     psi(t) = [1, exp(-alpha * t)]   and   phi(t) = [alpha * t, -sinh(alpha * t)].
+# Products with H and its Cholesky factor can therefore be computed with running sums over sorted maturities
+# instead of dense matrices.
+
+def _SWGenerators(t: np.ndarray, alpha: float):
+    """
+    Return the generators psi(t) and phi(t) of the heart of the Wilson function as two len(t) x 2 ndarrays.
+    """
+    psi = np.column_stack((np.ones_like(t), np.exp(-alpha * t)))
+    phi = np.column_stack((alpha * t, -np.sinh(alpha * t)))
+    return psi, phi
+
+def SWHeartApply(u: np.ndarray, v: np.ndarray, X: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Calculate the product SWHeart(u, v, alpha) @ X without building the heart of the Wilson function.
+
+    Uses the semiseparable form of the heart: the contribution of the maturities in `v` below each maturity in `u` is a prefix sum and
+    the contribution of the maturities above is a suffix sum. The cost is linear in the sizes of `u`, `v` and the number of columns of `X`
+    (plus sorting `v` and locating every element of `u` in it).
+
+    Arguments:
+        u: k x 1 ndarray of maturities. Example: u = np.array([1, 2, 3, 5])
+        v: n x 1 ndarray of maturities. Example: v = np.array([1, 3])
+        X: n x 1 or n x m ndarray to be multiplied with the heart.
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+
+    Returns:
+        k x 1 (or k x m) ndarray equal to SWHeart(u, v, alpha) @ X.
+    """
+    u = np.asarray(u, dtype=float).ravel()
+    v = np.asarray(v, dtype=float).ravel()
+    X = np.asarray(X, dtype=float)
+    vector = X.ndim == 1
+    X = X.reshape(v.size, -1)
+
+    order = np.argsort(v, kind="stable")
+    v, X = v[order], X[order]
+    psiV, phiV = _SWGenerators(v, alpha)
+    psiU, phiU = _SWGenerators(u, alpha)
+
+    # Prefix sums of phi(v_j) x_j over v_j <= u and suffix sums of psi(v_j) x_j over v_j > u
+    below = np.zeros((v.size + 1, 2, X.shape[1]))
+    below[1:] = np.cumsum(phiV[:, :, np.newaxis] * X[:, np.newaxis, :], axis=0)
+    above = np.zeros((v.size + 1, 2, X.shape[1]))
+    above[:-1] = np.cumsum((psiV[:, :, np.newaxis] * X[:, np.newaxis, :])[::-1], axis=0)[::-1]
+
+    split = np.searchsorted(v, u, side="right")   # Number of maturities in v that are smaller or equal to each maturity in u
+    out = np.einsum("ki,kim->km", psiU, below[split]) + np.einsum("ki,kim->km", phiU, above[split])
+    return out[:, 0] if vector else out
+
+class SWHeartFactor:
+    """
+    Cholesky factorization H = L L' of the heart of the Wilson function for a set of distinct maturities in linear time and memory.
+
+    The factor of a rank-2 semiseparable matrix is itself semiseparable: below the diagonal L[i, j] = psi(M_i)' w_j, so the factor is
+    stored as the n x 2 generators w and the n diagonal elements. Solving H x = y then costs two sweeps over the sorted maturities.
+
+    Arguments:
+        M: n x 1 ndarray of distinct maturities. Example: M = np.array([1, 3])
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+
+    Example of use:
+        >>> import numpy as np
+        >>> from SWHeart import SWHeart
+        >>> M = np.array([1, 2, 4, 5, 6, 7])
+        >>> x = SWHeartFactor(M, 0.15).solve(np.ones(6))
+        >>> np.allclose(SWHeart(M, M, 0.15) @ x, 1)
+        True
+    """
+
+    def __init__(self, M: np.ndarray, alpha: float):
+        M = np.asarray(M, dtype=float).ravel()
+        self.order = np.argsort(M, kind="stable")
+        self.M = M[self.order]
+        self.alpha = float(alpha)
+        if np.any(np.diff(self.M) <= 0):
+            raise ValueError("Maturities must be distinct")
+
+        psi, phi = _SWGenerators(self.M, self.alpha)
+        self.psi = psi
+        self.w = np.empty_like(psi)
+        self.diag = np.empty(self.M.size)
+        s11 = s12 = s22 = 0.0                        # S_j = sum_{k < j} w_k w_k'
+        for j, (p1, p2, q1, q2) in enumerate(np.column_stack((psi, phi)).tolist()):
+            Sp1 = s11 * p1 + s12 * p2
+            Sp2 = s12 * p1 + s22 * p2
+            pivot = p1 * q1 + p2 * q2 - p1 * Sp1 - p2 * Sp2   # H_jj minus the contribution of the previous columns
+            if pivot <= 0:
+                raise np.linalg.LinAlgError("Heart of the Wilson function is not positive definite for these maturities")
+            dj = np.sqrt(pivot)
+            w1 = (q1 - Sp1) / dj
+            w2 = (q2 - Sp2) / dj
+            s11 += w1 * w1
+            s12 += w1 * w2
+            s22 += w2 * w2
+            self.w[j] = (w1, w2)
+            self.diag[j] = dj
+
+    def solve(self, Y: np.ndarray) -> np.ndarray:
+        """
+        Solve H X = Y for an n x 1 or n x m right-hand side given in the original (unsorted) order of the maturities.
+        """
+        Y = np.asarray(Y, dtype=float)
+        vector = Y.ndim == 1
+        Y = Y.reshape(self.M.size, -1)[self.order]
+        n = self.M.size
+
+        Z = np.empty_like(Y)                          # Forward sweep L Z = Y
+        acc = np.zeros((2, Y.shape[1]))
+        for i in range(n):
+            Z[i] = (Y[i] - self.psi[i] @ acc) / self.diag[i]
+            acc += np.outer(self.w[i], Z[i])
+
+        X = np.empty_like(Y)                          # Backward sweep L' X = Z
+        acc[:] = 0
+        for j in range(n - 1, -1, -1):
+            X[j] = (Z[j] - self.w[j] @ acc) / self.diag[j]
+            acc += np.outer(self.psi[j], X[j])
+
+        out = np.empty_like(X)
+        out[self.order] = X
+        return out[:, 0] if vector else out
+
+def SWCalibrateStructured(r: np.ndarray, M: np.ndarray, ufr: float, alpha: float) -> np.ndarray:
+    """
+    Calculate the calibration vector using the Smith-Wilson algorithm in linear time and memory.
+
+    Gives the same result as `SWCalibrate` without building or inverting any dense matrix. With Q = diag(d) the system from paragraph 149
+    is equivalent to H (d * b) = p / d - 1, which is solved with the semiseparable Cholesky factorization `SWHeartFactor`.
+
+    Arguments:
+        r: n x 1 ndarray of rates for which you wish to calibrate the algorithm (or n_curves x n ndarray with one curve per row). Example: r = np.array([0.0024, 0.0034])
+        M: n x 1 ndarray of distinct maturities of bonds that have rates provided in the input `r`. Example: M = np.array([1, 3])
+        ufr: Floating number representing the ultimate forward rate. Example: ufr = 0.042
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+
+    Returns:
+        ndarray of the same shape as `r` representing the calibration vector(s) needed for interpolation and extrapolation.
+
+    Example of use:
+        >>> import numpy as np
+        >>> M_Obs = np.arange(1, 601) / 12  # Monthly grid up to 50 years
+        >>> r_Obs = 0.01 + 0.03 * (1 - np.exp(-M_Obs / 10))
+        >>> b = SWCalibrateStructured(r_Obs, M_Obs, 0.042, 0.1)
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+    M = np.asarray(M, dtype=float).ravel()
+    p = (1 + r) ** (-M)                          # Transform rates to implied market prices of a ZCB bond
+    d = np.exp(-np.log(1 + ufr) * M)             # Calculate vector d described in paragraph 138
+    return SWHeartFactor(M, alpha).solve((p / d - 1).T).T / d
+
+def SWExtrapolateStructured(M_Target: np.ndarray, M_Obs: np.ndarray, b: np.ndarray, ufr: float, alpha: float) -> np.ndarray:
+    """
+    Interpolate or extrapolate rates for targeted maturities using the Smith-Wilson algorithm in linear time and memory.
+
+    Gives the same result as `SWExtrapolate` but applies the heart of the Wilson function with `SWHeartApply` instead of building
+    the k x n heart and the k x k diagonal matrix.
+
+    Arguments:
+        M_Target: k x 1 ndarray representing each targeted bond maturity of interest. Example: M_Target = np.array([1, 2, 3, 5])
+        M_Obs: n x 1 ndarray representing the observed bond maturities used for calibrating the calibration vector `b`. Example: M_Obs = np.array([1, 3])
+        b: n x 1 ndarray representing the calibration vector (or n_curves x n ndarray with one calibration vector per row).
+        ufr: Floating number representing the ultimate forward rate. Example: ufr = 0.042
+        alpha: Floating number representing the convergence speed parameter alpha. Example: alpha = 0.05
+
+    Returns:
+        k x 1 ndarray (or n_curves x k ndarray) representing the targeted rates for zero-coupon bonds.
+
+    For more information, refer to the documentation at:
+    https://www.eiopa.europa.eu/sites/default/files/risk_free_interest_rate/12092019-technical_documentation.pdf
+    """
+    M_Target = np.asarray(M_Target, dtype=float).ravel()
+    M_Obs = np.asarray(M_Obs, dtype=float).ravel()
+    Qb = np.exp(-np.log(1 + ufr) * M_Obs) * b    # Q b with Q = diag(d) from paragraph 139
+    dTarget = np.exp(-np.log(1 + ufr) * M_Target)
+    p = dTarget * (1 + SWHeartApply(M_Target, M_Obs, Qb.T, alpha).T)   # Discount pricing function from paragraph 147
+    return p ** (-1 / M_Target) - 1
@@ -0,0 +1 @@
+""" Smith & Wilson algorithm for the interpolation and extrapolation of interest rates. """
@@ -0,0 +1,204 @@
+import numpy as np
+import pytest
+if __package__:
+    from .SWCalibrate import SWCalibrate
+    from .SWExtrapolate import SWExtrapolate
+    from .SWCalibrateBatch import SWCalibrateBatch
+    from .SWExtrapolateBatch import SWExtrapolateBatch
+    from .SWCurve import SWCurve, SWCurveCache
+    from .SWHeart import SWHeart
+    from .SWStructured import SWHeartApply, SWHeartFactor, SWCalibrateStructured, SWExtrapolateStructured
+    from .SWExtrapolateChunked import SWExtrapolateChunked
+    from .SWEvaluate import SWEvaluate
+    from .SWCalibrateInstruments import SWCashFlowMatrix, SWSwapCashFlows, SWCalibrateInstruments
+    from .SWSensitivity import SWSensitivity
+    from .SWBatchRun import SWBatchRun
+else:
+    from SWCalibrate import SWCalibrate
+    from SWExtrapolate import SWExtrapolate
+    from SWCalibrateBatch import SWCalibrateBatch
+    from SWExtrapolateBatch import SWExtrapolateBatch
+    from SWCurve import SWCurve, SWCurveCache
+    from SWHeart import SWHeart
+    from SWStructured import SWHeartApply, SWHeartFactor, SWCalibrateStructured, SWExtrapolateStructured
+    from SWExtrapolateChunked import SWExtrapolateChunked
+    from SWEvaluate import SWEvaluate
+    from SWCalibrateInstruments import SWCashFlowMatrix, SWSwapCashFlows, SWCalibrateInstruments
+    from SWSensitivity import SWSensitivity
+    from SWBatchRun import SWBatchRun
+
+M_Obs = np.array([1, 2, 4, 5, 6, 7])
+r_Obs = np.array([0.01, 0.02, 0.03, 0.032, 0.035, 0.04])
+M_Target = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 15, 20, 40, 60])
+ufr = 0.04
+alpha = 0.15
+
+# Batched calibration matches the single-curve calibration row by row
+def test_batch_calibration_matches_single_curve():
+    r = np.vstack([r_Obs, r_Obs + 0.001, r_Obs - 0.002])
+    ufrs = np.array([0.04, 0.042, 0.035])
+    alphas = np.array([0.15, 0.15, 0.1])
+    b = SWCalibrateBatch(r, M_Obs, ufrs, alphas)
+    for i in range(r.shape[0]):
+        expected = SWCalibrate(r[i], M_Obs, ufrs[i], alphas[i])
+        assert b[i] == pytest.approx(expected, rel=1e-8), "Batched calibration differs from SWCalibrate."
+
+# Batched extrapolation matches the single-curve extrapolation row by row
+def test_batch_extrapolation_matches_single_curve():
+    r = np.vstack([r_Obs, r_Obs + 0.001])
+    alphas = np.array([0.15, 0.2])
+    b = SWCalibrateBatch(r, M_Obs, ufr, alphas)
+    out = SWExtrapolateBatch(M_Target, M_Obs, b, ufr, alphas)
+    assert out.shape == (2, M_Target.size), "Output is not n_curves x k."
+    for i in range(r.shape[0]):
+        expected = SWExtrapolate(M_Target, M_Obs, SWCalibrate(r[i], M_Obs, ufr, alphas[i]), ufr, alphas[i])
+        assert out[i] == pytest.approx(expected, abs=1e-12), "Batched extrapolation differs from SWExtrapolate."
+
+# Calibrated curves reprice the observed rates
+def test_batch_reproduces_observed_rates():
+    r = np.vstack([r_Obs, r_Obs * 1.1])
+    b = SWCalibrateBatch(r, M_Obs, ufr, alpha)
+    out = SWExtrapolateBatch(M_Obs, M_Obs, b, ufr, alpha)
+    assert out == pytest.approx(r, abs=1e-12), "Observed rates are not reproduced."
+
+# Cached curve object reproduces the dense calibration and extrapolation
+def test_curve_object_matches_dense_path():
+    curve = SWCurve(M_Obs, ufr, alpha)
+    b = curve.calibrate(r_Obs)
+    assert b == pytest.approx(SWCalibrate(r_Obs, M_Obs, ufr, alpha), rel=1e-8)
+    assert curve.extrapolate(M_Target, b) == pytest.approx(SWExtrapolate(M_Target, M_Obs, b, ufr, alpha), abs=1e-12)
+
+# Target kernels and curves are evicted in least-recently-used order
+def test_curve_cache_eviction():
+    curve = SWCurve(M_Obs, ufr, alpha, maxTargets=2)
+    for grid in (M_Target, M_Obs, M_Target, np.arange(1, 5)):
+        curve.kernel(grid)
+    assert len(curve._targets) == 2, "Target kernels are not bounded."
+    assert M_Obs.astype(float).tobytes() not in curve._targets, "Least recently used grid was not evicted."
+
+    cache = SWCurveCache(maxSize=2)
+    first = cache.get(M_Obs, ufr, alpha)
+    cache.get(M_Obs, ufr, 0.2)
+    assert cache.get(M_Obs, ufr, alpha) is first, "Cached curve was rebuilt."
+    cache.get(M_Obs, ufr, 0.3)
+    assert len(cache) == 2
+    assert cache.get(M_Obs, ufr, alpha) is first, "Most recently used curve was evicted."
+
+# Semiseparable product with the heart matches the dense heart for unsorted maturities
+def test_heart_apply_matches_dense_heart():
+    v = np.array([7, 1, 5, 2, 6, 4])
+    X = np.arange(12.).reshape(6, 2)
+    assert SWHeartApply(M_Target, v, X, alpha) == pytest.approx(SWHeart(M_Target, v, alpha) @ X, rel=1e-10)
+
+# Semiseparable Cholesky solves the system with the heart
+def test_heart_factor_solve():
+    y = np.linspace(-1, 1, M_Obs.size)
+    x = SWHeartFactor(M_Obs, alpha).solve(y)
+    assert SWHeart(M_Obs, M_Obs, alpha) @ x == pytest.approx(y, abs=1e-10)
+
+# Repeated maturities are rejected
+def test_heart_factor_repeated_maturities():
+    with pytest.raises(ValueError, match="Maturities must be distinct"):
+        SWHeartFactor(np.array([1, 2, 2, 3]), alpha)
+
+# Structured calibration and extrapolation match the dense path
+def test_structured_matches_dense_path():
+    b = SWCalibrateStructured(r_Obs, M_Obs, ufr, alpha)
+    assert b == pytest.approx(SWCalibrate(r_Obs, M_Obs, ufr, alpha), rel=1e-8)
+    assert SWExtrapolateStructured(M_Target, M_Obs, b, ufr, alpha) == pytest.approx(SWExtrapolate(M_Target, M_Obs, b, ufr, alpha), abs=1e-12)
+
+# Structured path reproduces a dense monthly grid of observed rates
+def test_structured_monthly_grid():
+    M = np.arange(1, 601) / 12
+    r = 0.01 + 0.03 * (1 - np.exp(-M / 10))
+    b = SWCalibrateStructured(r, M, 0.042, 0.1)
+    assert SWExtrapolateStructured(M, M, b, 0.042, 0.1) == pytest.approx(r, abs=1e-12)
+
+# Chunked extrapolation matches the dense extrapolation and fills the supplied buffer
+def test_chunked_extrapolation():
+    b = SWCalibrate(r_Obs, M_Obs, ufr, alpha)
+    out = np.empty(M_Target.size)
+    res = SWExtrapolateChunked(M_Target, M_Obs, b, ufr, alpha, chunkSize=3, out=out)
+    assert res is out, "Output buffer was not used."
+    assert out == pytest.approx(SWExtrapolate(M_Target, M_Obs, b, ufr, alpha), abs=1e-12)
+
+# Output buffer with a wrong shape is rejected
+def test_chunked_extrapolation_wrong_buffer():
+    b = SWCalibrate(r_Obs, M_Obs, ufr, alpha)
+    with pytest.raises(ValueError, match="out must have shape"):
+        SWExtrapolateChunked(M_Target, M_Obs, b, ufr, alpha, out=np.empty(3))
+
+# Multi-output evaluation is consistent with SWExtrapolate and with finite differences of the prices
+def test_evaluate_outputs():
+    b = SWCalibrate(r_Obs, M_Obs, ufr, alpha)
+    out = SWEvaluate(M_Target, M_Obs, b, ufr, alpha, chunkSize=5)
+    assert out["zero"] == pytest.approx(SWExtrapolate(M_Target, M_Obs, b, ufr, alpha), abs=1e-12)
+    assert out["discount"] == pytest.approx((1 + out["zero"]) ** (-M_Target), rel=1e-12)
+    assert out["zero_continuous"] == pytest.approx(np.log(1 + out["zero"]), rel=1e-10)
+    h = 1e-5
+    up = SWEvaluate(M_Target + h, M_Obs, b, ufr, alpha)["discount"]
+    down = SWEvaluate(M_Target - h, M_Obs, b, ufr, alpha)["discount"]
+    assert out["forward"] == pytest.approx(-(np.log(up) - np.log(down)) / (2 * h), abs=1e-8)
+    assert out["annuity"][-1] == pytest.approx(np.sum(np.diff(M_Target, prepend=0) * out["discount"]))
+
+# Calibration to zero-coupon instruments matches SWCalibrate
+def test_instruments_zero_coupon():
+    C, M_CF = SWCashFlowMatrix(np.arange(M_Obs.size), M_Obs, np.ones(M_Obs.size))
+    b = SWCalibrateInstruments((1 + r_Obs) ** (-M_Obs), C, M_CF, ufr, alpha, blockSize=4)
+    assert b == pytest.approx(SWCalibrate(r_Obs, M_Obs, ufr, alpha), rel=1e-8)
+
+# Curve calibrated to par swaps reprices the swaps
+def test_instruments_par_swaps():
+    tenors = np.array([1, 2, 3, 5, 7, 10, 15, 20])
+    rates = np.array([0.010, 0.015, 0.018, 0.022, 0.025, 0.028, 0.030, 0.031])
+    C, M_CF = SWCashFlowMatrix(*SWSwapCashFlows(rates, tenors, frequency=2))
+    assert C.shape == (40, 8), "Cash flow matrix has the wrong shape."
+    b = SWCalibrateInstruments(np.ones(tenors.size), C, M_CF, 0.042, 0.12)
+    P = (1 + SWExtrapolate(M_CF, M_CF, C @ b, 0.042, 0.12)) ** (-M_CF)
+    assert C.T @ P == pytest.approx(np.ones(tenors.size), abs=1e-12), "Swaps are not repriced at par."
+
+# Analytic sensitivities match central finite differences of SWCalibrate and SWExtrapolate
+def test_sensitivities_match_finite_differences():
+    sens = SWSensitivity(M_Target, M_Obs, r_Obs, ufr, alpha)
+    rates = lambda r, u: SWExtrapolate(M_Target, M_Obs, SWCalibrate(r, M_Obs, u, alpha), u, alpha)
+    assert sens["zero"] == pytest.approx(rates(r_Obs, ufr), abs=1e-12)
+    h = 1e-6
+    for j in range(M_Obs.size):
+        bump = np.zeros(M_Obs.size)
+        bump[j] = h
+        fd = (rates(r_Obs + bump, ufr) - rates(r_Obs - bump, ufr)) / (2 * h)
+        assert sens["dZero_dr"][:, j] == pytest.approx(fd, abs=1e-6)
+    fd = (rates(r_Obs, ufr + h) - rates(r_Obs, ufr - h)) / (2 * h)
+    assert sens["dZero_dufr"] == pytest.approx(fd, abs=1e-6)
+    assert sens["dZero_dr"][0] == pytest.approx(np.eye(M_Obs.size)[0], abs=1e-8), "Observed rate should only depend on itself."
+
+# Batch runner produces the same curves as SWCalibrate and SWExtrapolate, with and without worker processes
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_run(tmp_path, workers):
+    pd = pytest.importorskip("pandas")
+    curves = {("EUR", "base"): r_Obs, ("EUR", "up"): r_Obs + 0.01, ("USD", "base"): r_Obs - 0.002}
+    rows = [(c, s, m, r, ufr, alpha, 6) for (c, s), rates in curves.items() for m, r in zip(M_Obs, rates)]
+    pd.DataFrame(rows, columns=["currency", "scenario", "maturity", "rate", "ufr", "alpha", "llp"]).to_csv(tmp_path / "in.csv", index=False)
+    timings = SWBatchRun(str(tmp_path / "in.csv"), str(tmp_path / "out.csv"), M_Target, ["currency", "scenario"], workers=workers, chunkSize=2)
+    assert timings["curves"] == 3
+    out = pd.read_csv(tmp_path / "out.csv")
+    assert len(out) == 3 * M_Target.size
+    for (c, s), rates in curves.items():
+        b = SWCalibrate(rates[:-1], M_Obs[:-1], ufr, alpha)            # Maturity 7 is beyond the last liquid point
+        expected = SWExtrapolate(M_Target, M_Obs[:-1], b, ufr, alpha).ravel()
+        assert out[(out.currency == c) & (out.scenario == s)]["rate"].to_numpy() == pytest.approx(expected, abs=1e-12)
+
+# Batch runner keeps the curves without a last liquid point when only some curves have one
+def test_batch_run_partial_llp(tmp_path):
+    pd = pytest.importorskip("pandas")
+    curves = {"EUR": (r_Obs, 6), "USD": (r_Obs - 0.002, None)}
+    rows = [(c, m, r, ufr, alpha, llp) for c, (rates, llp) in curves.items() for m, r in zip(M_Obs, rates)]
+    pd.DataFrame(rows, columns=["currency", "maturity", "rate", "ufr", "alpha", "llp"]).to_csv(tmp_path / "in.csv", index=False)
+    timings = SWBatchRun(str(tmp_path / "in.csv"), str(tmp_path / "out.csv"), M_Target, ["currency"], workers=1)
+    assert timings["curves"] == 2
+    out = pd.read_csv(tmp_path / "out.csv")
+    for c, (rates, llp) in curves.items():
+        n = M_Obs.size if llp is None else np.sum(M_Obs <= llp)
+        b = SWCalibrate(rates[:n], M_Obs[:n], ufr, alpha)
+        expected = SWExtrapolate(M_Target, M_Obs[:n], b, ufr, alpha).ravel()
+        assert out[out.currency == c]["rate"].to_numpy() == pytest.approx(expected, abs=1e-12)
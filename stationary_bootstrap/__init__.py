@@ -0,0 +1 @@
+""" Stationary bootstrap of time series. """
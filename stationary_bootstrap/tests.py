@@ -1,6 +1,9 @@
 import numpy as np
 import pytest
-from stationary_bootstrap import stationary_bootstrap
+if __package__:
+    from .stationary_bootstrap import stationary_bootstrap
+else:
+    from stationary_bootstrap import stationary_bootstrap
 
 
 # Normal behaviour
@@ -117,7 +120,10 @@ def test_string_number_input_data():
 
 ## Test calibration
 
-from stationary_bootstrap_calibrate import OptimalLength, lam, mlag
+if __package__:
+    from .stationary_bootstrap_calibrate import OptimalLength, lam, mlag
+else:
+    from stationary_bootstrap_calibrate import OptimalLength, lam, mlag
 
 data = np.array([0.4, 0.2, 0.1, 0.4, 0.3, 0.1, 0.3, 0.4, 0.2, 0.5, 0.1, 0.2])
 
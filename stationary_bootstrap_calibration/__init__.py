@@ -0,0 +1 @@
+""" Automatic block length selection of the stationary bootstrap. """
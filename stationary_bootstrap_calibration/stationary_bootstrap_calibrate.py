@@ -218,6 +218,6 @@ def lam(x: np.ndarray)-> np.ndarray:
     return out
 
 
-import numpy as np
-data = np.array([0.1,0.2,0.3,0.4,0.5,0.6,0.7,0.8,0.9,1.0, 1.1, 0.3, 0.5])
-print(OptimalLength(data))
+if __name__ == "__main__":
+    data = np.array([0.1,0.2,0.3,0.4,0.5,0.6,0.7,0.8,0.9,1.0, 1.1, 0.3, 0.5])
+    print(OptimalLength(data))
@@ -1,7 +1,10 @@
 ## Test calibration
 import numpy as np
 import pytest
-from stationary_bootstrap_calibrate import OptimalLength, lam, mlag
+if __package__:
+    from .stationary_bootstrap_calibrate import OptimalLength, lam, mlag
+else:
+    from stationary_bootstrap_calibrate import OptimalLength, lam, mlag
 
 
 #Test lam output type
@@ -1,7 +1,9 @@
 import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 
-def simulate_Vasicek_One_Factor(r0: float = 0.1, a: float = 1.0, lam: float = 0.1, sigma: float = 0.2, T: int = 52, dt = 0.1) -> pd.DataFrame:
+def simulate_Vasicek_One_Factor(r0: float = 0.1, a: float = 1.0, lam: float = 0.1, sigma: float = 0.2, T: int = 52, dt = 0.1) -> "pd.DataFrame":
     """ Simulates a temporal series of interest rates using the One Factor Vasicek model
      interest_rate_simulation = simulate_Vasicek_One_Factor(r0, a, lam, sigma, T, dt)
     
@@ -56,6 +58,7 @@ def simulate_Vasicek_One_Factor(r0: float = 0.1, a: float = 1.0, lam: float = 0.
     for t in range(1,N):
         r[t] = r[t-1] * np.exp(-a*dt)+lam*(1-np.exp(-a*dt))+sigma*np.sqrt((1-np.exp(-2*a*dt))/(2*a))* np.random.normal(loc = 0,scale = 1)
 
+    import pandas as pd
     dict = {'Time' : time, 'Interest Rate' : r}
 
     interest_rate_simulation = pd.DataFrame.from_dict(data = dict)
@@ -0,0 +1 @@
+""" One factor Vasicek short rate model. """
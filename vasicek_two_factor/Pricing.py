@@ -1,8 +1,10 @@
-import pandas as pd
 import numpy as np
 from scipy import integrate
 
-from Vasicek import BrownianMotion
+if __package__:
+    from .Vasicek import BrownianMotion
+else:
+    from Vasicek import BrownianMotion
 
 class Swaption(object):
 
@@ -55,6 +57,7 @@ class ZeroCouponBond():
         # Example:
         # TBD
 
+        import pandas as pd
         interest_rate_simulation = pd.DataFrame()
         brownian_motion = BrownianMotion()
         for i in range(nScen):
@@ -1,7 +1,9 @@
 import numpy as np
-import pandas as pd
 from typing import Any
 from typing import List
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 
 class BrownianMotion():
 
@@ -71,7 +73,7 @@ class BrownianMotion():
 
             return [W_1, W_2]
 
-    def simulate_Vasicek_Two_Factor(self, r0: List[float] = [0.1, 0.1], a: List[float] = [1.0, 1.0], b: List[float] = [0.1, 0.1], sigma: List[float] = [0.2, 0.2], rho: float = 0.5, T: int = 52, dt: float = 0.1) -> pd.DataFrame:
+    def simulate_Vasicek_Two_Factor(self, r0: List[float] = [0.1, 0.1], a: List[float] = [1.0, 1.0], b: List[float] = [0.1, 0.1], sigma: List[float] = [0.2, 0.2], rho: float = 0.5, T: int = 52, dt: float = 0.1) -> "pd.DataFrame":
         # SIMULATE_VASICEK_TWO_FACTOR calculates a posible sample path of the nominal interest rate by simulating the real rate and inflation. Both are assumed to follow a mean-reverting vasicek process
         # interest_rate_simulation = simulate_Vasicek_Two_Factor(self, r0, a, b, sigma, rho, T, dt)
         #
@@ -124,6 +126,7 @@ class BrownianMotion():
 
         dict = {'Time' : time, 'Real Interest Rate' : r_e, 'Nominal Interest Rate' : r_s}
 
+        import pandas as pd
         interest_rate_simulation = pd.DataFrame.from_dict(data = dict)
         interest_rate_simulation.set_index('Time', inplace = True)
 
@@ -0,0 +1 @@
+""" Two factor Vasicek short rate model. """